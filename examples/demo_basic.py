@@ -11,6 +11,41 @@ from pathlib import Path
 
 from rdf4j_mcp.config import BackendType, Settings
 from rdf4j_mcp.server import RDF4JMCPServer
+from rdf4j_mcp.util import binding_value, local_name
+
+EX = "http://example.org/"
+
+PEOPLE_PROJECTS_QUERY = """
+PREFIX ex: <http://example.org/>
+SELECT ?name ?project ?projectName
+WHERE {
+    ?person a ex:Person ;
+            ex:name ?name ;
+            ex:worksOn ?project .
+    ?project ex:name ?projectName .
+}
+ORDER BY ?name
+"""
+
+KG_PLATFORM_ASK_QUERY = """
+PREFIX ex: <http://example.org/>
+ASK {
+    ?person ex:worksOn ex:kg-platform .
+}
+"""
+
+PROJECT_TEAMS_QUERY = """
+PREFIX ex: <http://example.org/>
+SELECT ?projectName ?budget (COUNT(?person) as ?teamSize)
+WHERE {
+    ?project a ex:Project ;
+             ex:name ?projectName ;
+             ex:budget ?budget .
+    ?person ex:worksOn ?project .
+}
+GROUP BY ?project ?projectName ?budget
+ORDER BY DESC(?budget)
+"""
 
 
 async def main():
@@ -54,51 +89,38 @@ async def main():
         # Demo 3: Search Classes
         print("\n3. Classes in Ontology")
         print("-" * 40)
-        classes = await backend.search_classes(limit=10)
-        for binding in classes.bindings or []:
-            cls = binding.get("class", {}).get("value", "")
-            label = binding.get("label", {}).get("value", "")
-            if "example.org" in cls:
-                print(f"   {cls.split('/')[-1]}: {label}")
+        classes = await backend.search_classes(limit=10, namespace_prefix=EX)
+        for binding in classes:
+            cls = binding_value(binding, "class")
+            label = binding_value(binding, "label")
+            print(f"   {local_name(cls)}: {label}")
 
         # Demo 4: Search Properties
         print("\n4. Properties in Ontology")
         print("-" * 40)
-        props = await backend.search_properties(limit=15)
-        for binding in props.bindings or []:
-            prop = binding.get("property", {}).get("value", "")
-            if "example.org" in prop:
-                domain = binding.get("domain", {}).get("value", "").split("/")[-1]
-                range_ = binding.get("range", {}).get("value", "").split("/")[-1]
-                print(f"   {prop.split('/')[-1]}: {domain} -> {range_}")
+        props = await backend.search_properties(limit=15, namespace_prefix=EX)
+        for binding in props:
+            prop = binding_value(binding, "property")
+            domain = local_name(binding_value(binding, "domain"))
+            range_ = local_name(binding_value(binding, "range"))
+            print(f"   {local_name(prop)}: {domain} -> {range_}")
 
         # Demo 5: SPARQL SELECT Query
         print("\n5. SPARQL SELECT: Find all people and their projects")
         print("-" * 40)
-        query = """
-        PREFIX ex: <http://example.org/>
-        SELECT ?name ?project ?projectName
-        WHERE {
-            ?person a ex:Person ;
-                    ex:name ?name ;
-                    ex:worksOn ?project .
-            ?project ex:name ?projectName .
-        }
-        ORDER BY ?name
-        """
-        result = await backend.sparql_select(query)
-        for binding in result.bindings or []:
-            name = binding.get("name", {}).get("value", "")
-            project = binding.get("projectName", {}).get("value", "")
+        result = await backend.sparql_select(PEOPLE_PROJECTS_QUERY)
+        for binding in result:
+            name = binding_value(binding, "name")
+            project = binding_value(binding, "projectName")
             print(f"   {name} -> {project}")
 
         # Demo 6: Find Instances
         print("\n6. Find Instances of ex:Project")
         print("-" * 40)
         instances = await backend.find_instances("http://example.org/Project")
-        for binding in instances.bindings or []:
-            inst = binding.get("instance", {}).get("value", "").split("/")[-1]
-            label = binding.get("label", {}).get("value", "")
+        for binding in instances:
+            inst = local_name(binding_value(binding, "instance"))
+            label = binding_value(binding, "label")
             print(f"   {inst}: {label}")
 
         # Demo 7: Describe Resource
@@ -110,35 +132,17 @@ async def main():
         # Demo 8: SPARQL ASK Query
         print("\n\n8. SPARQL ASK: Does anyone work on KG Platform?")
         print("-" * 40)
-        ask_query = """
-        PREFIX ex: <http://example.org/>
-        ASK {
-            ?person ex:worksOn ex:kg-platform .
-        }
-        """
-        ask_result = await backend.sparql_ask(ask_query)
+        ask_result = await backend.sparql_ask(KG_PLATFORM_ASK_QUERY)
         print(f"   Result: {ask_result.boolean}")
 
         # Demo 9: Complex Query - Project Team Analysis
         print("\n9. Complex Query: Project team sizes and budgets")
         print("-" * 40)
-        complex_query = """
-        PREFIX ex: <http://example.org/>
-        SELECT ?projectName ?budget (COUNT(?person) as ?teamSize)
-        WHERE {
-            ?project a ex:Project ;
-                     ex:name ?projectName ;
-                     ex:budget ?budget .
-            ?person ex:worksOn ?project .
-        }
-        GROUP BY ?project ?projectName ?budget
-        ORDER BY DESC(?budget)
-        """
-        complex_result = await backend.sparql_select(complex_query)
-        for binding in complex_result.bindings or []:
-            name = binding.get("projectName", {}).get("value", "")
-            budget = binding.get("budget", {}).get("value", "")
-            size = binding.get("teamSize", {}).get("value", "")
+        complex_result = await backend.sparql_select(PROJECT_TEAMS_QUERY)
+        for binding in complex_result:
+            name = binding_value(binding, "projectName")
+            budget = binding_value(binding, "budget")
+            size = binding_value(binding, "teamSize")
             print(f"   {name}: ${float(budget):,.0f} budget, {size} team members")
 
         print("\n" + "=" * 60)
@@ -7,10 +7,26 @@ and understand a knowledge graph schema.
 """
 
 import asyncio
+from dataclasses import asdict
 from pathlib import Path
 
 from rdf4j_mcp.config import BackendType, Settings
 from rdf4j_mcp.server import RDF4JMCPServer
+from rdf4j_mcp.util import binding_value, local_name
+
+EX = "http://example.org/"
+
+INSTANCES_QUERY_TEMPLATE = """
+PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+
+SELECT DISTINCT ?class ?instance ?label
+WHERE {{
+    VALUES ?class {{ {values} }}
+    ?instance a ?class .
+    OPTIONAL {{ ?instance rdfs:label ?label }}
+}}
+ORDER BY ?class ?instance
+"""
 
 
 async def main():
@@ -38,30 +54,26 @@ async def main():
         summary = await backend.get_schema_summary()
 
         print("\nStatistics:")
-        for key, value in summary["statistics"].items():
+        for key, value in asdict(summary.statistics).items():
             print(f"   {key}: {value}")
 
         print("\nNamespaces Used:")
-        for ns in summary["namespaces"][:6]:
-            print(f"   {ns['prefix']}: <{ns['namespace']}>")
+        for ns in summary.namespaces[:6]:
+            print(f"   {ns.prefix}: <{ns.namespace}>")
 
         # Step 2: Discover Classes
         print("\n\n2. DISCOVERING CLASSES")
         print("=" * 60)
 
-        classes = await backend.search_classes()
-        owl_classes = [
-            b
-            for b in (classes.bindings or [])
-            if "example.org" in b.get("class", {}).get("value", "")
-        ]
+        classes = await backend.search_classes(namespace_prefix=EX)
+        owl_classes = classes.bindings or []
 
         print(f"\nFound {len(owl_classes)} custom classes:")
         for cls in owl_classes:
-            iri = cls.get("class", {}).get("value", "")
-            label = cls.get("label", {}).get("value", "No label")
-            comment = cls.get("comment", {}).get("value", "")
-            print(f"\n   {iri.split('/')[-1]}")
+            iri = binding_value(cls, "class")
+            label = binding_value(cls, "label", "No label")
+            comment = binding_value(cls, "comment")
+            print(f"\n   {local_name(iri)}")
             print(f"   Label: {label}")
             if comment:
                 print(f"   Description: {comment}")
@@ -70,41 +82,45 @@ async def main():
         print("\n\n3. CLASS-PROPERTY RELATIONSHIPS")
         print("=" * 60)
 
-        for cls in owl_classes:
-            class_iri = cls.get("class", {}).get("value", "")
-            class_name = class_iri.split("/")[-1]
+        class_iris = [binding_value(cls, "class") for cls in owl_classes]
+
+        # One grouped query for all classes instead of one query per class
+        props_by_class: dict[str, list[dict]] = {iri: [] for iri in class_iris}
+        props = await backend.search_properties_bulk(class_iris)
+        for prop in props:
+            props_by_class[prop["domain"]["value"]].append(prop)
 
-            props = await backend.search_properties(domain=class_iri)
-            class_props = [
-                p
-                for p in (props.bindings or [])
-                if p.get("domain", {}).get("value", "") == class_iri
-            ]
+        for class_iri, class_props in props_by_class.items():
+            class_name = local_name(class_iri)
 
             if class_props:
                 print(f"\n{class_name}:")
                 for prop in class_props:
-                    prop_name = prop.get("property", {}).get("value", "").split("/")[-1]
-                    range_val = prop.get("range", {}).get("value", "")
-                    range_name = range_val.split("/")[-1] if range_val else "Any"
+                    prop_name = local_name(binding_value(prop, "property"))
+                    range_val = binding_value(prop, "range")
+                    range_name = local_name(range_val) if range_val else "Any"
                     print(f"   -> {prop_name} -> {range_name}")
 
         # Step 4: Explore Instance Distribution
         print("\n\n4. INSTANCE DISTRIBUTION")
         print("=" * 60)
 
-        for cls in owl_classes:
-            class_iri = cls.get("class", {}).get("value", "")
-            class_name = class_iri.split("/")[-1]
+        values = " ".join(f"<{iri}>" for iri in class_iris)
+        instances_by_class: dict[str, list[dict]] = {iri: [] for iri in class_iris}
+        result = await backend.sparql_select(INSTANCES_QUERY_TEMPLATE.format(values=values))
+        for binding in result:
+            instances_by_class[binding["class"]["value"]].append(binding)
+
+        for class_iri, instances in instances_by_class.items():
+            class_name = local_name(class_iri)
 
-            instances = await backend.find_instances(class_iri)
-            count = len(instances.bindings or [])
+            count = len(instances)
 
             if count > 0:
                 print(f"\n{class_name}: {count} instances")
-                for inst in (instances.bindings or [])[:3]:
-                    inst_name = inst.get("instance", {}).get("value", "").split("/")[-1]
-                    label = inst.get("label", {}).get("value", "")
+                for inst in instances[:3]:
+                    inst_name = local_name(binding_value(inst, "instance"))
+                    label = binding_value(inst, "label")
                     display = f"{inst_name}"
                     if label:
                         display += f" ({label})"
@@ -117,29 +133,14 @@ async def main():
         print("=" * 60)
 
         # Find all object properties and their usage
-        query = """
-        PREFIX ex: <http://example.org/>
-        PREFIX owl: <http://www.w3.org/2002/07/owl#>
-        PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-
-        SELECT ?prop ?domain ?range (COUNT(*) as ?usage)
-        WHERE {
-            ?prop a owl:ObjectProperty ;
-                  rdfs:domain ?domain ;
-                  rdfs:range ?range .
-            ?s ?prop ?o .
-        }
-        GROUP BY ?prop ?domain ?range
-        ORDER BY DESC(?usage)
-        """
-        result = await backend.sparql_select(query)
+        result = await backend.get_property_usage()
 
         print("\nObject Property Usage:")
-        for binding in result.bindings or []:
-            prop = binding.get("prop", {}).get("value", "").split("/")[-1]
-            domain = binding.get("domain", {}).get("value", "").split("/")[-1]
-            range_ = binding.get("range", {}).get("value", "").split("/")[-1]
-            usage = binding.get("usage", {}).get("value", "0")
+        for binding in result:
+            prop = local_name(binding_value(binding, "prop"))
+            domain = local_name(binding_value(binding, "domain"))
+            range_ = local_name(binding_value(binding, "range"))
+            usage = binding_value(binding, "usage", "0")
             print(f"   {domain} --[{prop}]--> {range_}  (used {usage}x)")
 
         # Step 6: Network Connectivity
@@ -147,26 +148,20 @@ async def main():
         print("=" * 60)
 
         # Find entities with most connections
-        query = """
-        PREFIX ex: <http://example.org/>
-
-        SELECT ?entity ?type (COUNT(?related) as ?connections)
-        WHERE {
-            ?entity a ?type .
-            { ?entity ?p ?related } UNION { ?related ?p ?entity }
-            FILTER(?type IN (ex:Person, ex:Project, ex:Organization))
-        }
-        GROUP BY ?entity ?type
-        ORDER BY DESC(?connections)
-        LIMIT 10
-        """
-        result = await backend.sparql_select(query)
+        result = await backend.get_connectivity(
+            [
+                "http://example.org/Person",
+                "http://example.org/Project",
+                "http://example.org/Organization",
+            ],
+            limit=10,
+        )
 
         print("\nMost Connected Entities:")
-        for binding in result.bindings or []:
-            entity = binding.get("entity", {}).get("value", "").split("/")[-1]
-            type_ = binding.get("type", {}).get("value", "").split("/")[-1]
-            conns = binding.get("connections", {}).get("value", "0")
+        for binding in result:
+            entity = local_name(binding_value(binding, "entity"))
+            type_ = local_name(binding_value(binding, "type"))
+            conns = binding_value(binding, "connections", "0")
             print(f"   {entity} ({type_}): {conns} connections")
 
         print("\n" + "=" * 60)
@@ -11,6 +11,177 @@ from pathlib import Path
 
 from rdf4j_mcp.config import BackendType, Settings
 from rdf4j_mcp.server import RDF4JMCPServer
+from rdf4j_mcp.util import binding_value, local_name
+
+PEOPLE_QUERY = """
+PREFIX ex: <http://example.org/>
+SELECT ?name ?email
+WHERE {
+    ?person a ex:Person ;
+            ex:name ?name ;
+            ex:email ?email .
+}
+ORDER BY ?name
+"""
+
+OPTIONAL_DEPARTMENT_QUERY = """
+PREFIX ex: <http://example.org/>
+SELECT ?name ?deptName
+WHERE {
+    ?person a ex:Person ;
+            ex:name ?name .
+    OPTIONAL {
+        ?person ex:memberOf ?dept .
+        ?dept ex:name ?deptName .
+    }
+}
+ORDER BY ?name
+"""
+
+BUDGET_FILTER_QUERY = """
+PREFIX ex: <http://example.org/>
+PREFIX xsd: <http://www.w3.org/2001/XMLSchema#>
+SELECT ?name ?budget
+WHERE {
+    ?project a ex:Project ;
+             ex:name ?name ;
+             ex:budget ?budget .
+    FILTER(?budget > 200000)
+}
+ORDER BY DESC(?budget)
+"""
+
+TEAM_SIZE_QUERY = """
+PREFIX ex: <http://example.org/>
+SELECT ?projectName (COUNT(?person) AS ?teamSize)
+WHERE {
+    ?project a ex:Project ;
+             ex:name ?projectName .
+    ?person ex:worksOn ?project .
+}
+GROUP BY ?project ?projectName
+ORDER BY DESC(?teamSize)
+"""
+
+LARGE_TEAMS_QUERY = """
+PREFIX ex: <http://example.org/>
+SELECT ?projectName (COUNT(?person) AS ?teamSize)
+WHERE {
+    ?project a ex:Project ;
+             ex:name ?projectName .
+    ?person ex:worksOn ?project .
+}
+GROUP BY ?project ?projectName
+HAVING (COUNT(?person) >= 2)
+ORDER BY DESC(?teamSize)
+"""
+
+TOP_PROJECT_TEAM_QUERY = """
+PREFIX ex: <http://example.org/>
+SELECT ?personName ?projectName ?budget
+WHERE {
+    {
+        SELECT ?project (MAX(?b) AS ?maxBudget)
+        WHERE {
+            ?project a ex:Project ;
+                     ex:budget ?b .
+        }
+        GROUP BY ?project
+        ORDER BY DESC(?maxBudget)
+        LIMIT 1
+    }
+    ?project ex:name ?projectName ;
+             ex:budget ?budget .
+    ?person ex:worksOn ?project ;
+            ex:name ?personName .
+}
+"""
+
+NAMED_ENTITIES_QUERY = """
+PREFIX ex: <http://example.org/>
+SELECT ?type ?name
+WHERE {
+    {
+        ?entity a ex:Person ;
+                ex:name ?name .
+        BIND("Person" AS ?type)
+    }
+    UNION
+    {
+        ?entity a ex:Project ;
+                ex:name ?name .
+        BIND("Project" AS ?type)
+    }
+}
+ORDER BY ?type ?name
+"""
+
+PERSON_ORGANIZATION_QUERY = """
+PREFIX ex: <http://example.org/>
+SELECT ?personName ?orgName
+WHERE {
+    ?person a ex:Person ;
+            ex:name ?personName ;
+            ex:memberOf/^ex:hasDepartment ?org .
+    ?org ex:name ?orgName .
+}
+"""
+
+TECHNOLOGY_REGEX_QUERY = """
+PREFIX ex: <http://example.org/>
+SELECT ?name
+WHERE {
+    ?tech a ex:Technology ;
+          ex:name ?name .
+    FILTER(REGEX(?name, "Python|SPARQL", "i"))
+}
+"""
+
+TECHNOLOGY_USAGE_QUERY = """
+PREFIX ex: <http://example.org/>
+SELECT ?techName (COUNT(DISTINCT ?project) AS ?projectCount)
+       (GROUP_CONCAT(DISTINCT ?projectName; separator=", ") AS ?projects)
+WHERE {
+    ?project a ex:Project ;
+             ex:name ?projectName ;
+             ex:status "active" ;
+             ex:uses ?tech .
+    ?tech ex:name ?techName .
+}
+GROUP BY ?tech ?techName
+ORDER BY DESC(?projectCount)
+"""
+
+ASK_QUERIES = [
+    (
+        "Is there anyone named 'Alice Johnson'?",
+        "ASK { ?p <http://example.org/name> 'Alice Johnson' }",
+    ),
+    (
+        "Are there any projects using Kubernetes?",
+        "ASK { ?p <http://example.org/uses> <http://example.org/kubernetes> }",
+    ),
+    (
+        "Is there a completed project?",
+        "ASK { ?p a <http://example.org/Project> ; <http://example.org/status> 'completed' }",
+    ),
+]
+
+CONSTRUCT_QUERY = """
+PREFIX ex: <http://example.org/>
+CONSTRUCT {
+    ?person ex:name ?name ;
+            ex:worksOn ?project .
+    ?project ex:name ?projectName .
+}
+WHERE {
+    ?person a ex:Person ;
+            ex:name ?name ;
+            ex:worksOn ?project .
+    ?project ex:name ?projectName .
+}
+LIMIT 5
+"""
 
 
 async def run_query(backend, title, query, format_func=None):
@@ -19,23 +190,37 @@ async def run_query(backend, title, query, format_func=None):
     print("-" * 50)
     print(f"Query:\n{query.strip()}\n")
 
-    result = await backend.sparql_select(query)
-
     print("Results:")
-    if not result.bindings:
-        print("   (no results)")
-        return
-
-    for binding in result.bindings or []:
+    found = False
+    async for binding in backend.sparql_select_stream(query):
+        found = True
         if format_func:
             print(f"   {format_func(binding)}")
         else:
             parts = []
             for var, val in binding.items():
-                v = val.get("value", "").split("/")[-1]
+                v = local_name(val.get("value", ""))
                 parts.append(f"{var}={v}")
             print(f"   {', '.join(parts)}")
 
+    if not found:
+        print("   (no results)")
+
+
+async def run_values_query(backend, title, query):
+    """Helper to run and display a single-variable query."""
+    print(f"\n{title}")
+    print("-" * 50)
+    print(f"Query:\n{query.strip()}\n")
+
+    print("Results:")
+    values = await backend.sparql_select_values(query)
+    for value in values:
+        print(f"   {value}")
+
+    if not values:
+        print("   (no results)")
+
 
 async def main():
     sample_data = Path(__file__).parent / "sample_data.ttl"
@@ -60,16 +245,7 @@ async def main():
         await run_query(
             backend,
             "1. BASIC SELECT - List all people",
-            """
-            PREFIX ex: <http://example.org/>
-            SELECT ?name ?email
-            WHERE {
-                ?person a ex:Person ;
-                        ex:name ?name ;
-                        ex:email ?email .
-            }
-            ORDER BY ?name
-            """,
+            PEOPLE_QUERY,
             lambda b: f"{b['name']['value']} <{b['email']['value']}>",
         )
 
@@ -77,38 +253,15 @@ async def main():
         await run_query(
             backend,
             "2. OPTIONAL - People with optional department",
-            """
-            PREFIX ex: <http://example.org/>
-            SELECT ?name ?deptName
-            WHERE {
-                ?person a ex:Person ;
-                        ex:name ?name .
-                OPTIONAL {
-                    ?person ex:memberOf ?dept .
-                    ?dept ex:name ?deptName .
-                }
-            }
-            ORDER BY ?name
-            """,
-            lambda b: f"{b['name']['value']} - {b.get('deptName', {}).get('value', 'N/A')}",
+            OPTIONAL_DEPARTMENT_QUERY,
+            lambda b: f"{b['name']['value']} - {binding_value(b, 'deptName', 'N/A')}",
         )
 
         # Query 3: FILTER
         await run_query(
             backend,
             "3. FILTER - Projects with budget over $200,000",
-            """
-            PREFIX ex: <http://example.org/>
-            PREFIX xsd: <http://www.w3.org/2001/XMLSchema#>
-            SELECT ?name ?budget
-            WHERE {
-                ?project a ex:Project ;
-                         ex:name ?name ;
-                         ex:budget ?budget .
-                FILTER(?budget > 200000)
-            }
-            ORDER BY DESC(?budget)
-            """,
+            BUDGET_FILTER_QUERY,
             lambda b: f"{b['name']['value']}: ${float(b['budget']['value']):,.0f}",
         )
 
@@ -116,17 +269,7 @@ async def main():
         await run_query(
             backend,
             "4. AGGREGATION - Team size per project",
-            """
-            PREFIX ex: <http://example.org/>
-            SELECT ?projectName (COUNT(?person) AS ?teamSize)
-            WHERE {
-                ?project a ex:Project ;
-                         ex:name ?projectName .
-                ?person ex:worksOn ?project .
-            }
-            GROUP BY ?project ?projectName
-            ORDER BY DESC(?teamSize)
-            """,
+            TEAM_SIZE_QUERY,
             lambda b: f"{b['projectName']['value']}: {b['teamSize']['value']} members",
         )
 
@@ -134,18 +277,7 @@ async def main():
         await run_query(
             backend,
             "5. HAVING - Projects with 2+ team members",
-            """
-            PREFIX ex: <http://example.org/>
-            SELECT ?projectName (COUNT(?person) AS ?teamSize)
-            WHERE {
-                ?project a ex:Project ;
-                         ex:name ?projectName .
-                ?person ex:worksOn ?project .
-            }
-            GROUP BY ?project ?projectName
-            HAVING (COUNT(?person) >= 2)
-            ORDER BY DESC(?teamSize)
-            """,
+            LARGE_TEAMS_QUERY,
             lambda b: f"{b['projectName']['value']}: {b['teamSize']['value']} members",
         )
 
@@ -153,26 +285,7 @@ async def main():
         await run_query(
             backend,
             "6. SUBQUERY - People working on the most expensive project",
-            """
-            PREFIX ex: <http://example.org/>
-            SELECT ?personName ?projectName ?budget
-            WHERE {
-                {
-                    SELECT ?project (MAX(?b) AS ?maxBudget)
-                    WHERE {
-                        ?project a ex:Project ;
-                                 ex:budget ?b .
-                    }
-                    GROUP BY ?project
-                    ORDER BY DESC(?maxBudget)
-                    LIMIT 1
-                }
-                ?project ex:name ?projectName ;
-                         ex:budget ?budget .
-                ?person ex:worksOn ?project ;
-                        ex:name ?personName .
-            }
-            """,
+            TOP_PROJECT_TEAM_QUERY,
             lambda b: (
                 f"{b['personName']['value']} on {b['projectName']['value']} "
                 f"(${float(b['budget']['value']):,.0f})"
@@ -183,24 +296,7 @@ async def main():
         await run_query(
             backend,
             "7. UNION - All things with names (people and projects)",
-            """
-            PREFIX ex: <http://example.org/>
-            SELECT ?type ?name
-            WHERE {
-                {
-                    ?entity a ex:Person ;
-                            ex:name ?name .
-                    BIND("Person" AS ?type)
-                }
-                UNION
-                {
-                    ?entity a ex:Project ;
-                            ex:name ?name .
-                    BIND("Project" AS ?type)
-                }
-            }
-            ORDER BY ?type ?name
-            """,
+            NAMED_ENTITIES_QUERY,
             lambda b: f"[{b['type']['value']}] {b['name']['value']}",
         )
 
@@ -208,53 +304,22 @@ async def main():
         await run_query(
             backend,
             "8. PROPERTY PATH - People connected to organizations (via department)",
-            """
-            PREFIX ex: <http://example.org/>
-            SELECT ?personName ?orgName
-            WHERE {
-                ?person a ex:Person ;
-                        ex:name ?personName ;
-                        ex:memberOf/^ex:hasDepartment ?org .
-                ?org ex:name ?orgName .
-            }
-            """,
+            PERSON_ORGANIZATION_QUERY,
             lambda b: f"{b['personName']['value']} -> {b['orgName']['value']}",
         )
 
         # Query 9: REGEX filter
-        await run_query(
+        await run_values_query(
             backend,
             "9. REGEX - Find technologies containing 'Python' or 'SPARQL'",
-            """
-            PREFIX ex: <http://example.org/>
-            SELECT ?name
-            WHERE {
-                ?tech a ex:Technology ;
-                      ex:name ?name .
-                FILTER(REGEX(?name, "Python|SPARQL", "i"))
-            }
-            """,
-            lambda b: b["name"]["value"],
+            TECHNOLOGY_REGEX_QUERY,
         )
 
         # Query 10: Complex analysis
         await run_query(
             backend,
             "10. COMPLEX - Technology usage across active projects",
-            """
-            PREFIX ex: <http://example.org/>
-            SELECT ?techName (COUNT(DISTINCT ?project) AS ?projectCount)
-                   (GROUP_CONCAT(DISTINCT ?projectName; separator=", ") AS ?projects)
-            WHERE {
-                ?project a ex:Project ;
-                         ex:name ?projectName ;
-                         ex:status "active" ;
-                         ex:uses ?tech .
-                ?tech ex:name ?techName .
-            }
-            GROUP BY ?tech ?techName
-            ORDER BY DESC(?projectCount)
-            """,
+            TECHNOLOGY_USAGE_QUERY,
             lambda b: (
                 f"{b['techName']['value']}: {b['projectCount']['value']} projects "
                 f"({b['projects']['value']})"
@@ -265,23 +330,7 @@ async def main():
         print("\n11. ASK QUERIES - Boolean questions")
         print("-" * 50)
 
-        ask_queries = [
-            (
-                "Is there anyone named 'Alice Johnson'?",
-                "ASK { ?p <http://example.org/name> 'Alice Johnson' }",
-            ),
-            (
-                "Are there any projects using Kubernetes?",
-                "ASK { ?p <http://example.org/uses> <http://example.org/kubernetes> }",
-            ),
-            (
-                "Is there a completed project?",
-                "ASK { ?p a <http://example.org/Project> ; "
-                "<http://example.org/status> 'completed' }",
-            ),
-        ]
-
-        for question, query in ask_queries:
+        for question, query in ASK_QUERIES:
             result = await backend.sparql_ask(query)
             answer = "Yes" if result.boolean else "No"
             print(f"   Q: {question}")
@@ -290,23 +339,8 @@ async def main():
         # CONSTRUCT Query Demo
         print("\n12. CONSTRUCT - Build a subgraph")
         print("-" * 50)
-        construct_query = """
-        PREFIX ex: <http://example.org/>
-        CONSTRUCT {
-            ?person ex:name ?name ;
-                    ex:worksOn ?project .
-            ?project ex:name ?projectName .
-        }
-        WHERE {
-            ?person a ex:Person ;
-                    ex:name ?name ;
-                    ex:worksOn ?project .
-            ?project ex:name ?projectName .
-        }
-        LIMIT 5
-        """
-        print(f"Query:\n{construct_query}")
-        result = await backend.sparql_construct(construct_query)
+        print(f"Query:\n{CONSTRUCT_QUERY}")
+        result = await backend.sparql_construct(CONSTRUCT_QUERY)
         print("\nResult (Turtle):")
         if result.triples:
             # Show first 500 chars
@@ -1,7 +1,29 @@
 """Backend implementations for RDF4J MCP Server."""
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .base import Backend
-from .local import LocalBackend
-from .remote import RemoteBackend
 
-__all__ = ["Backend", "LocalBackend", "RemoteBackend"]
+if TYPE_CHECKING:
+    from .local import LocalBackend
+    from .oxigraph import OxigraphBackend
+    from .remote import RemoteBackend
+
+__all__ = ["Backend", "LocalBackend", "OxigraphBackend", "RemoteBackend"]
+
+# Only one backend is used per process, and LocalBackend pulls in rdflib's
+# SPARQL engine, so the implementations are imported on first access
+_BACKEND_MODULES = {
+    "LocalBackend": ".local",
+    "OxigraphBackend": ".oxigraph",
+    "RemoteBackend": ".remote",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a backend implementation on first access."""
+    module = _BACKEND_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module, __name__), name)
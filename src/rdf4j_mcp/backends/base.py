@@ -1,11 +1,220 @@
 """Abstract base class for RDF backends."""
 
+import asyncio
+import re
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Final, TypeVar
+
+import pyoxigraph as og
+from rdflib import RDF, RDFS, BNode, Graph, Literal, URIRef
+from rdflib.term import Node
+
+from ..util import normalize_query
+
+Triple = tuple[Node, Node, Node]
+
+T = TypeVar("T")
+
+_REGEX_METACHARACTERS = frozenset(".^$*+?()[]{}|\\")
+
+_SPARQL_STRING_ESCAPES = str.maketrans(
+    {"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r", "\t": "\\t"}
+)
+
+
+def _escape_sparql_string(value: str) -> str:
+    """Escape a value for use inside a double-quoted SPARQL string literal."""
+    return value.translate(_SPARQL_STRING_ESCAPES)
+
+
+def classify_pattern(pattern: str) -> tuple[str, str]:
+    """Pick the cheapest case-insensitive string test for a search pattern.
+
+    Plain substrings use CONTAINS and ``^prefix`` patterns use STRSTARTS, which
+    engines evaluate far cheaper than REGEX. REGEX is only used when the
+    pattern contains other regex metacharacters, and malformed regexes are
+    rejected here rather than after a round-trip to the query engine.
+
+    Returns:
+        A ``(kind, operand)`` pair where kind is a key of PATTERN_FILTERS
+
+    Raises:
+        ValueError: If the pattern is not a valid regular expression
+    """
+    if not _REGEX_METACHARACTERS.intersection(pattern):
+        return "contains", pattern.lower()
+    if pattern.startswith("^") and not _REGEX_METACHARACTERS.intersection(pattern[1:]):
+        return "prefix", pattern[1:].lower()
+    try:
+        # re keeps its own cache of compiled patterns, so repeats are cheap
+        re.compile(pattern)
+    except re.error as exc:
+        # XPath regexes allow escapes such as \p{L} that re lacks; leave those to the engine
+        if not exc.msg.startswith("bad escape"):
+            raise ValueError(f"Invalid search pattern {pattern!r}: {exc}") from exc
+    return "regex", pattern
+
+
+# Filter expression templates keyed by classify_pattern() kind
+PATTERN_FILTERS = {
+    "contains": "CONTAINS(LCASE(STR({variable})), {operand})",
+    "prefix": "STRSTARTS(LCASE(STR({variable})), {operand})",
+    "regex": 'REGEX(STR({variable}), {operand}, "i")',
+}
+
+
+# Case-sensitive IRI namespace test; engines can answer it from a prefix range scan
+NAMESPACE_FILTER: Final = "STRSTARTS(STR({variable}), {operand})"
+
+
+def _pattern_filter(variable: str, pattern: str) -> str:
+    """Build a case-insensitive filter expression matching ``pattern`` against a variable."""
+    kind, operand = classify_pattern(pattern)
+    return PATTERN_FILTERS[kind].format(
+        variable=variable, operand=f'"{_escape_sparql_string(operand)}"'
+    )
+
+
+def _namespace_filter(variable: str, namespace_prefix: str) -> str:
+    """Build a filter expression restricting a variable to IRIs under ``namespace_prefix``."""
+    return NAMESPACE_FILTER.format(
+        variable=variable, operand=f'"{_escape_sparql_string(namespace_prefix)}"'
+    )
+
+
+def search_classes_query(
+    filter_clause: str = "", sort: bool = False, comment_length: int | None = None
+) -> str:
+    """Build the (unlimited) class search query around an optional FILTER clause.
+
+    With ``sort`` the rows are ordered by ?class. Engines with a top-K operator
+    (RDF4J) evaluate ``ORDER BY ... LIMIT`` with a bounded heap; rdflib sorts
+    the full candidate set, so LocalBackend sorts client-side instead.
+    ``comment_length`` cuts rdfs:comment values down in the query itself, so
+    verbose comments are never serialized in full.
+    """
+    order_clause = "ORDER BY ?class" if sort else ""
+    if comment_length is None:
+        comment_clause = "OPTIONAL { ?class rdfs:comment ?comment }"
+    else:
+        comment_clause = (
+            "OPTIONAL { ?class rdfs:comment ?fullComment } "
+            f"BIND(SUBSTR(?fullComment, 1, {int(comment_length)}) AS ?comment)"
+        )
+    # Deduplicate ?class in a subselect so the label/comment joins run once
+    # per class rather than once per type assertion.
+    return f"""
+        SELECT DISTINCT ?class ?label ?comment
+        WHERE {{
+            {{
+                SELECT DISTINCT ?class
+                WHERE {{
+                    {{ ?class a owl:Class }}
+                    UNION
+                    {{ ?class a rdfs:Class }}
+                    UNION
+                    {{ [] a ?class }}
+                    {filter_clause}
+                }}
+            }}
+            OPTIONAL {{ ?class rdfs:label ?label }}
+            {comment_clause}
+        }}
+        {order_clause}
+        """
+
+
+def search_properties_query(
+    pattern_clause: str = "", filter_clause: str = "", sort: bool = False
+) -> str:
+    """Build the (unlimited) property search query.
+
+    ``pattern_clause`` filters ?property inside the subselect; ``filter_clause``
+    constrains ?domain/?range after the OPTIONAL joins. ``sort`` orders the rows
+    by ?property, as in search_classes_query().
+    """
+    order_clause = "ORDER BY ?property" if sort else ""
+    # Deduplicate ?property before the OPTIONAL joins fan out; the pattern
+    # filter only needs ?property, so it is applied inside the subselect.
+    return f"""
+        SELECT DISTINCT ?property ?label ?domain ?range
+        WHERE {{
+            {{
+                SELECT DISTINCT ?property
+                WHERE {{
+                    {{ ?property a rdf:Property }}
+                    UNION
+                    {{ ?property a owl:ObjectProperty }}
+                    UNION
+                    {{ ?property a owl:DatatypeProperty }}
+                    UNION
+                    {{ [] ?property [] }}
+                    {pattern_clause}
+                }}
+            }}
+            OPTIONAL {{ ?property rdfs:label ?label }}
+            OPTIONAL {{ ?property rdfs:domain ?domain }}
+            OPTIONAL {{ ?property rdfs:range ?range }}
+            {filter_clause}
+        }}
+        {order_clause}
+        """
+
+
+# Distinct subject/object counts, left to the store so it can answer them from
+# its own indexes instead of streaming every term back to Python
+SUBJECT_COUNT_QUERY: Final = "SELECT (COUNT(DISTINCT ?s) AS ?count) WHERE { ?s ?p ?o }"
+OBJECT_COUNT_QUERY: Final = "SELECT (COUNT(DISTINCT ?o) AS ?count) WHERE { ?s ?p ?o }"
+
+
+# Default number of classes and properties in a schema summary
+SUMMARY_LIMIT: Final = 50
 
+# Class comments in the schema summary are only ever shown as short snippets
+SUMMARY_COMMENT_LENGTH: Final = 100
 
-@dataclass
+CONSTRUCT_FORMATS: Final = ("turtle", "nt")
+
+
+_SIMPLE_ASK_RE = re.compile(
+    r"^\s*ASK\s*(?:WHERE\s*)?\{\s*(\S+)\s+(\S+)\s+(\S+?)\s*\.?\s*\}\s*$",
+    re.IGNORECASE,
+)
+
+
+def parse_single_pattern_ask(query: str) -> tuple[str | None, str | None, str | None] | None:
+    """Recognize an ASK query whose body is a single triple pattern.
+
+    Returns the pattern as ``(subject, predicate, object)`` IRIs with ``None``
+    for variables, or ``None`` if the query needs the full SPARQL pipeline
+    (prefixed names, literals, repeated variables, multiple patterns, ...).
+    """
+    match = _SIMPLE_ASK_RE.match(query)
+    if match is None:
+        return None
+
+    pattern: list[str | None] = []
+    variables: set[str] = set()
+    for position, token in enumerate(match.groups()):
+        if token[0] in "?$" and len(token) > 1:
+            if token[1:] in variables:
+                return None
+            variables.add(token[1:])
+            pattern.append(None)
+        elif token.startswith("<") and token.endswith(">") and len(token) > 2:
+            pattern.append(token[1:-1])
+        elif token == "a" and position == 1:
+            pattern.append(str(RDF.type))
+        else:
+            return None
+    return pattern[0], pattern[1], pattern[2]
+
+
+@dataclass(slots=True, frozen=True)
 class RepositoryInfo:
     """Information about an RDF repository."""
 
@@ -16,7 +225,7 @@ class RepositoryInfo:
     writable: bool = True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NamespaceInfo:
     """Namespace prefix mapping."""
 
@@ -24,18 +233,22 @@ class NamespaceInfo:
     namespace: str
 
 
-@dataclass
+@dataclass(slots=True)
 class QueryResult:
     """Result of a SPARQL query."""
 
     type: str  # "select", "construct", "ask", "describe"
     bindings: list[dict[str, Any]] | None = None  # For SELECT queries
-    triples: str | None = None  # For CONSTRUCT/DESCRIBE (as Turtle)
+    triples: str | None = None  # For CONSTRUCT/DESCRIBE (N-Triples or Turtle)
     boolean: bool | None = None  # For ASK queries
     variables: list[str] | None = None  # Variable names for SELECT
 
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        """Iterate over the SELECT bindings (nothing for other result types)."""
+        return iter(self.bindings or ())
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class StatisticsInfo:
     """Repository statistics."""
 
@@ -46,9 +259,282 @@ class StatisticsInfo:
     total_objects: int
 
 
+@dataclass(slots=True)
+class SchemaSummary:
+    """Overview of a repository's schema.
+
+    ``classes`` and ``properties`` hold the raw search bindings; the statistics
+    and namespaces stay as dataclasses until they reach a serialization boundary.
+    Class comments are cut to SUMMARY_COMMENT_LENGTH characters.
+    """
+
+    statistics: StatisticsInfo
+    classes: list[dict[str, Any]]
+    properties: list[dict[str, Any]]
+    namespaces: list[NamespaceInfo]
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    """A cached value tagged with the repository version it was computed at."""
+
+    version: str | None
+    expires_at: float
+    value: Any
+
+
+# Query result cache key: (query type, repository, CONSTRUCT format, normalized query)
+QueryKey = tuple[str, str | None, str, str]
+
+
+def _uri_to_dict(term: Any) -> dict[str, Any]:
+    return {"type": "uri", "value": str(term)}
+
+
+def _literal_to_dict(term: Any) -> dict[str, Any]:
+    result: dict[str, Any] = {"type": "literal", "value": str(term)}
+    if term.language:
+        result["xml:lang"] = term.language
+    if term.datatype:
+        result["datatype"] = str(term.datatype)
+    return result
+
+
+def _bnode_to_dict(term: Any) -> dict[str, Any]:
+    return {"type": "bnode", "value": str(term)}
+
+
+def _unknown_to_dict(term: Any) -> dict[str, Any]:
+    return {"type": "unknown", "value": str(term)}
+
+
+XSD_STRING: Final = "http://www.w3.org/2001/XMLSchema#string"
+
+
+def _oxigraph_uri_to_dict(term: Any) -> dict[str, Any]:
+    return {"type": "uri", "value": term.value}
+
+
+def _oxigraph_literal_to_dict(term: Any) -> dict[str, Any]:
+    result: dict[str, Any] = {"type": "literal", "value": term.value}
+    if term.language:
+        result["xml:lang"] = term.language
+    elif term.datatype.value != XSD_STRING:
+        result["datatype"] = term.datatype.value
+    return result
+
+
+def _oxigraph_bnode_to_dict(term: Any) -> dict[str, Any]:
+    return {"type": "bnode", "value": term.value}
+
+
+TermConverter = Callable[[Any], dict[str, Any]]
+
+# Keyed on the exact term class: one dict lookup per term instead of an
+# isinstance() chain, which adds up over every cell of a large result
+_NODE_CONVERTERS: dict[type, TermConverter] = {
+    URIRef: _uri_to_dict,
+    Literal: _literal_to_dict,
+    BNode: _bnode_to_dict,
+}
+_OXIGRAPH_CONVERTERS: dict[type, TermConverter] = {
+    og.NamedNode: _oxigraph_uri_to_dict,
+    og.Literal: _oxigraph_literal_to_dict,
+    og.BlankNode: _oxigraph_bnode_to_dict,
+}
+
+
+def _converter_for(converters: dict[type, TermConverter], term: Any) -> TermConverter:
+    """Find the converter for a term whose exact class isn't in the table."""
+    for cls, converter in converters.items():
+        if isinstance(term, cls):
+            return converter
+    return _unknown_to_dict
+
+
+def node_to_dict(term: Any) -> dict[str, Any]:
+    """Convert an rdflib term to the SPARQL JSON results dict representation."""
+    converter = _NODE_CONVERTERS.get(type(term))
+    if converter is None:
+        converter = _converter_for(_NODE_CONVERTERS, term)
+    return converter(term)
+
+
+def oxigraph_term_to_dict(term: Any) -> dict[str, Any]:
+    """Convert a pyoxigraph term to the SPARQL JSON results dict representation.
+
+    pyoxigraph gives every literal a datatype; the implicit xsd:string and
+    rdf:langString ones are dropped so the output matches node_to_dict().
+    """
+    converter = _OXIGRAPH_CONVERTERS.get(type(term))
+    if converter is None:
+        converter = _converter_for(_OXIGRAPH_CONVERTERS, term)
+    return converter(term)
+
+
+def oxigraph_term_to_node(term: Any) -> Node:
+    """Convert a pyoxigraph term to the equivalent rdflib term."""
+    if isinstance(term, og.NamedNode):
+        return URIRef(term.value)
+    elif isinstance(term, og.Literal):
+        if term.language:
+            return Literal(term.value, lang=term.language)
+        elif term.datatype.value != XSD_STRING:
+            return Literal(term.value, datatype=URIRef(term.datatype.value))
+        else:
+            return Literal(term.value)
+    elif isinstance(term, og.BlankNode):
+        return BNode(term.value)
+    else:
+        return Literal(str(term))
+
+
 class Backend(ABC):
     """Abstract base class for RDF storage backends."""
 
+    def __init__(self, cache_ttl: float = 300.0, query_cache_size: int = 256):
+        """Initialize shared backend state.
+
+        Args:
+            cache_ttl: Seconds to cache schema-level lookups and query results
+                (0 disables caching)
+            query_cache_size: Maximum number of query results to keep (0 disables)
+        """
+        self._cache_ttl = cache_ttl
+        self._cache: dict[tuple[str, str | None], _CacheEntry] = {}
+        self._cache_locks: dict[tuple[str, str | None], asyncio.Lock] = {}
+        self._query_cache_size = query_cache_size
+        self._query_cache: OrderedDict[QueryKey, _CacheEntry] = OrderedDict()
+        # Uncached queries being run, keyed with the repository version they run against
+        self._query_flights: dict[tuple[QueryKey, str | None], asyncio.Future[QueryResult]] = {}
+
+    async def _repository_version(self, repository_id: str | None) -> str | None:
+        """Return a cheap stamp that changes whenever the repository is modified.
+
+        Backends without a version signal return None and rely on the TTL alone.
+        """
+        return None
+
+    async def _cached(
+        self,
+        kind: str,
+        repository_id: str | None,
+        compute: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Return a cached value for (kind, repository), recomputing when stale.
+
+        Entries are invalidated when the TTL expires or the repository version
+        changes. A per-key lock ensures concurrent callers share one computation.
+        """
+        if self._cache_ttl <= 0:
+            return await compute()
+
+        key = (kind, repository_id or await self.get_current_repository())
+        lock = self._cache_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            entry = self._cache.get(key)
+            if entry is not None and time.monotonic() >= entry.expires_at:
+                entry = None
+            # A probe may be a round trip, so it comes after the local TTL check
+            version = await self._repository_version(key[1])
+            if entry is not None and entry.version == version:
+                value: T = entry.value
+                return value
+
+            value = await compute()
+            self._cache[key] = _CacheEntry(version, time.monotonic() + self._cache_ttl, value)
+            return value
+
+    async def cached_query(
+        self,
+        query_type: str,
+        query: str,
+        repository_id: str | None = None,
+        format: str = "nt",
+    ) -> QueryResult:
+        """Run a SELECT, ASK or CONSTRUCT query through the query result cache.
+
+        Results are kept in a bounded LRU keyed on (type, repository, query),
+        where queries differing only in whitespace or comments share a key,
+        and invalidated like schema lookups: by TTL or a repository version
+        change. Concurrent callers missing the cache on the same query share
+        one backend request. Cached results are shared, so callers must not
+        mutate them.
+
+        Args:
+            query_type: "select", "ask" or "construct"
+            query: The SPARQL query
+            repository_id: Repository to query (uses default if not specified)
+            format: Serialization for CONSTRUCT results, see sparql_construct()
+        """
+        if query_type not in ("select", "ask", "construct"):
+            raise ValueError(f"Unknown query type: {query_type}")
+
+        if self._cache_ttl <= 0 or self._query_cache_size <= 0:
+            return await self._run_query(query_type, query, repository_id, format)
+
+        repository = repository_id or await self.get_current_repository()
+        key = (
+            query_type,
+            repository,
+            format if query_type == "construct" else "",
+            normalize_query(query),
+        )
+        entry = self._query_cache.get(key)
+        if entry is not None and time.monotonic() >= entry.expires_at:
+            del self._query_cache[key]
+            entry = None
+        # A probe may be a round trip, so it comes after the local TTL check
+        version = await self._repository_version(repository)
+        if entry is not None and entry.version == version:
+            self._query_cache.move_to_end(key)
+            result: QueryResult = entry.value
+            return result
+
+        flight = self._query_flights.get((key, version))
+        if flight is None:
+            flight = asyncio.ensure_future(
+                self._fill_query_cache(key, version, query, repository_id, format)
+            )
+            self._query_flights[(key, version)] = flight
+        # Shielded so one caller giving up doesn't cancel the request for the others
+        return await asyncio.shield(flight)
+
+    async def _fill_query_cache(
+        self,
+        key: QueryKey,
+        version: str | None,
+        query: str,
+        repository_id: str | None,
+        format: str,
+    ) -> QueryResult:
+        """Run a query that missed the result cache and store its result."""
+        try:
+            result = await self._run_query(key[0], query, repository_id, format)
+        finally:
+            del self._query_flights[(key, version)]
+        self._query_cache[key] = _CacheEntry(version, time.monotonic() + self._cache_ttl, result)
+        self._query_cache.move_to_end(key)
+        if len(self._query_cache) > self._query_cache_size:
+            self._query_cache.popitem(last=False)
+        return result
+
+    async def _run_query(
+        self, query_type: str, query: str, repository_id: str | None, format: str
+    ) -> QueryResult:
+        """Dispatch an uncached query to the matching sparql_* method."""
+        if query_type == "select":
+            return await self.sparql_select(query, repository_id)
+        elif query_type == "ask":
+            return await self.sparql_ask(query, repository_id)
+        else:
+            return await self.sparql_construct(query, repository_id, format)
+
+    def clear_cache(self) -> None:
+        """Drop all cached lookups and query results."""
+        self._cache.clear()
+        self._query_cache.clear()
+
     @abstractmethod
     async def connect(self) -> None:
         """Establish connection to the backend."""
@@ -79,9 +565,54 @@ class Backend(ABC):
         """Execute a SPARQL SELECT query."""
         pass
 
+    async def sparql_select_stream(
+        self, query: str, repository_id: str | None = None
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Execute a SPARQL SELECT query, yielding bindings one at a time.
+
+        The default implementation buffers the full result via sparql_select;
+        backends that can evaluate lazily override this so callers that stop
+        early don't pay for the rows they never read. RemoteBackend keeps the
+        default: its SPARQL JSON response is downloaded and decoded whole.
+        """
+        result = await self.sparql_select(query, repository_id)
+        for binding in result:
+            yield binding
+
+    async def sparql_select_values(self, query: str, repository_id: str | None = None) -> list[str]:
+        """Execute a single-variable SELECT query and return the bound values.
+
+        Rows where the variable is unbound are skipped.
+
+        Args:
+            query: SELECT query projecting exactly one variable
+            repository_id: Repository to query (defaults to the current one)
+
+        Returns:
+            The lexical value of each binding, in result order
+        """
+        result = await self.sparql_select(query, repository_id)
+        variables = result.variables or []
+        if len(variables) > 1:
+            raise ValueError(f"Expected a single projected variable, got {len(variables)}")
+        if not variables:
+            return []
+        variable = variables[0]
+        return [binding[variable]["value"] for binding in result if variable in binding]
+
     @abstractmethod
-    async def sparql_construct(self, query: str, repository_id: str | None = None) -> QueryResult:
-        """Execute a SPARQL CONSTRUCT or DESCRIBE query."""
+    async def sparql_construct(
+        self, query: str, repository_id: str | None = None, format: str = "nt"
+    ) -> QueryResult:
+        """Execute a SPARQL CONSTRUCT or DESCRIBE query.
+
+        Args:
+            query: The CONSTRUCT or DESCRIBE query
+            repository_id: Repository to query (uses default if not specified)
+            format: Serialization of the result, "nt" (N-Triples) or "turtle";
+                N-Triples skips Turtle's prefix compaction and grouping, so
+                Turtle is opt-in for callers that want the compact form
+        """
         pass
 
     @abstractmethod
@@ -89,48 +620,90 @@ class Backend(ABC):
         """Execute a SPARQL ASK query."""
         pass
 
-    @abstractmethod
     async def get_namespaces(self, repository_id: str | None = None) -> list[NamespaceInfo]:
-        """Get namespace prefix mappings."""
-        pass
+        """Get namespace prefix mappings (cached per repository)."""
+        return await self._cached(
+            "namespaces", repository_id, lambda: self._fetch_namespaces(repository_id)
+        )
 
     @abstractmethod
+    async def _fetch_namespaces(self, repository_id: str | None = None) -> list[NamespaceInfo]:
+        """Fetch namespace prefix mappings from the store."""
+        pass
+
     async def get_statistics(self, repository_id: str | None = None) -> StatisticsInfo:
-        """Get repository statistics."""
+        """Get repository statistics (cached per repository)."""
+        return await self._cached(
+            "statistics", repository_id, lambda: self._fetch_statistics(repository_id)
+        )
+
+    @abstractmethod
+    async def _fetch_statistics(self, repository_id: str | None = None) -> StatisticsInfo:
+        """Compute repository statistics from the store."""
+        pass
+
+    @abstractmethod
+    async def match_triples(
+        self,
+        subject: str | None = None,
+        predicate: str | None = None,
+        obj: str | None = None,
+        repository_id: str | None = None,
+        limit: int | None = None,
+    ) -> list[Triple]:
+        """Match a single triple pattern against the store's native indexes.
+
+        Bound positions are IRIs; ``None`` acts as a wildcard. This bypasses the
+        SPARQL parser and planner entirely, so it should be preferred over a
+        generated query whenever a lookup is a single triple pattern. When
+        ``limit`` is given, matching stops after that many triples.
+        """
         pass
 
     async def describe_resource(self, iri: str, repository_id: str | None = None) -> QueryResult:
-        """Get all triples about a resource."""
-        query = f"DESCRIBE <{iri}>"
-        return await self.sparql_construct(query, repository_id)
+        """Get all triples about a resource, serialized as N-Triples."""
+        triples = await self.match_triples(iri, None, None, repository_id)
+
+        result_graph = Graph()
+        for triple in triples:
+            result_graph.add(triple)
+
+        return QueryResult(
+            type="construct",
+            triples=result_graph.serialize(format="nt"),
+        )
 
     async def search_classes(
         self,
         pattern: str | None = None,
         limit: int = 100,
         repository_id: str | None = None,
+        namespace_prefix: str | None = None,
+        sort: bool = False,
+        comment_length: int | None = None,
     ) -> QueryResult:
-        """Search for classes in the ontology."""
-        filter_clause = ""
+        """Search for classes in the ontology (through the query result cache).
+
+        Args:
+            pattern: Case-insensitive substring, ``^prefix`` or regex to match class IRIs
+            limit: Maximum number of classes to return
+            repository_id: Repository to search (defaults to the current one)
+            namespace_prefix: Only return classes whose IRI starts with this prefix
+            sort: Order the classes by IRI (otherwise in store order)
+            comment_length: Truncate comments to this many characters (default: full)
+        """
+        expressions = []
         if pattern:
-            filter_clause = f'FILTER(REGEX(STR(?class), "{pattern}", "i"))'
+            expressions.append(_pattern_filter("?class", pattern))
+        if namespace_prefix:
+            expressions.append(_namespace_filter("?class", namespace_prefix))
 
-        query = f"""
-        SELECT DISTINCT ?class ?label ?comment
-        WHERE {{
-            {{ ?class a owl:Class }}
-            UNION
-            {{ ?class a rdfs:Class }}
-            UNION
-            {{ ?s a ?class }}
-            OPTIONAL {{ ?class rdfs:label ?label }}
-            OPTIONAL {{ ?class rdfs:comment ?comment }}
-            {filter_clause}
-        }}
-        ORDER BY ?class
-        LIMIT {limit}
-        """
-        return await self.sparql_select(query, repository_id)
+        filter_clause = ""
+        if expressions:
+            filter_clause = "FILTER(" + " && ".join(expressions) + ")"
+
+        query = search_classes_query(filter_clause, sort, comment_length) + f"LIMIT {limit}\n"
+        return await self.cached_query("select", query, repository_id)
 
     async def search_properties(
         self,
@@ -139,11 +712,31 @@ class Backend(ABC):
         range_: str | None = None,
         limit: int = 100,
         repository_id: str | None = None,
+        namespace_prefix: str | None = None,
+        sort: bool = False,
     ) -> QueryResult:
-        """Search for properties in the ontology."""
-        filters = []
+        """Search for properties in the ontology (through the query result cache).
+
+        Args:
+            pattern: Case-insensitive substring, ``^prefix`` or regex to match property IRIs
+            domain: Only return properties with this rdfs:domain
+            range_: Only return properties with this rdfs:range
+            limit: Maximum number of properties to return
+            repository_id: Repository to search (defaults to the current one)
+            namespace_prefix: Only return properties whose IRI starts with this prefix
+            sort: Order the properties by IRI (otherwise in store order)
+        """
+        expressions = []
         if pattern:
-            filters.append(f'REGEX(STR(?property), "{pattern}", "i")')
+            expressions.append(_pattern_filter("?property", pattern))
+        if namespace_prefix:
+            expressions.append(_namespace_filter("?property", namespace_prefix))
+
+        pattern_clause = ""
+        if expressions:
+            pattern_clause = "FILTER(" + " && ".join(expressions) + ")"
+
+        filters = []
         if domain:
             filters.append(f"?domain = <{domain}>")
         if range_:
@@ -153,61 +746,177 @@ class Backend(ABC):
         if filters:
             filter_clause = "FILTER(" + " && ".join(filters) + ")"
 
+        query = search_properties_query(pattern_clause, filter_clause, sort) + f"LIMIT {limit}\n"
+        return await self.cached_query("select", query, repository_id)
+
+    async def search_properties_bulk(
+        self,
+        domains: list[str],
+        repository_id: str | None = None,
+    ) -> QueryResult:
+        """Find properties for several domain classes in a single query."""
+        if not domains:
+            return QueryResult(type="select", bindings=[], variables=[])
+
+        values = " ".join(f"<{domain}>" for domain in domains)
         query = f"""
-        SELECT DISTINCT ?property ?label ?domain ?range
+        SELECT DISTINCT ?domain ?property ?label ?range
         WHERE {{
-            {{ ?property a rdf:Property }}
-            UNION
-            {{ ?property a owl:ObjectProperty }}
-            UNION
-            {{ ?property a owl:DatatypeProperty }}
-            UNION
-            {{ ?s ?property ?o }}
+            VALUES ?domain {{ {values} }}
+            ?property rdfs:domain ?domain .
             OPTIONAL {{ ?property rdfs:label ?label }}
-            OPTIONAL {{ ?property rdfs:domain ?domain }}
             OPTIONAL {{ ?property rdfs:range ?range }}
-            {filter_clause}
         }}
-        ORDER BY ?property
-        LIMIT {limit}
+        ORDER BY ?domain ?property
         """
         return await self.sparql_select(query, repository_id)
 
+    async def _fetch_labels(
+        self, iris: list[str], repository_id: str | None
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Look up rdfs:label values for several resources in one bulk query.
+
+        Returns:
+            Label bindings keyed by resource IRI (resources without labels are absent)
+        """
+        values = " ".join(f"<{iri}>" for iri in iris)
+        query = f"""
+        SELECT ?instance ?label
+        WHERE {{
+            VALUES ?instance {{ {values} }}
+            ?instance <{RDFS.label}> ?label .
+        }}
+        """
+        labels: dict[str, list[dict[str, Any]]] = {}
+        for b in await self.sparql_select(query, repository_id):
+            if "instance" in b and "label" in b:
+                labels.setdefault(b["instance"]["value"], []).append(b["label"])
+        return labels
+
     async def find_instances(
         self,
         class_iri: str,
         limit: int = 100,
         repository_id: str | None = None,
     ) -> QueryResult:
-        """Find instances of a class."""
+        """Find up to ``limit`` instances of a class.
+
+        Matching stops as soon as ``limit`` instances are found; the selected
+        instances are then sorted for stable output. This reads the in-process
+        type index through match_triples rather than running one SPARQL query,
+        so it bypasses the query result cache; RemoteBackend's SPARQL version
+        goes through cached_query().
+        """
+        triples = await self.match_triples(
+            None, str(RDF.type), class_iri, repository_id, limit=limit
+        )
+        instances = sorted((s for s, _, _ in triples), key=str)
+
+        # Join labels client-side rather than through an OPTIONAL per instance
+        iris = [str(i) for i in instances if isinstance(i, URIRef)]
+        labels = await self._fetch_labels(iris, repository_id) if iris else {}
+
+        bindings: list[dict[str, Any]] = []
+        for instance in instances:
+            instance_dict = node_to_dict(instance)
+            instance_labels = labels.get(str(instance))
+            if instance_labels:
+                bindings.extend(
+                    {"instance": instance_dict, "label": label} for label in instance_labels
+                )
+            else:
+                bindings.append({"instance": instance_dict})
+
+        return QueryResult(
+            type="select",
+            bindings=bindings[:limit],
+            variables=["instance", "label"],
+        )
+
+    async def get_property_usage(self, repository_id: str | None = None) -> QueryResult:
+        """Count how often each declared object property is used, most used first."""
+        query = """
+        SELECT ?prop ?domain ?range (COUNT(*) AS ?usage)
+        WHERE {
+            ?prop a owl:ObjectProperty ;
+                  rdfs:domain ?domain ;
+                  rdfs:range ?range .
+            ?s ?prop ?o .
+        }
+        GROUP BY ?prop ?domain ?range
+        ORDER BY DESC(?usage)
+        """
+        return await self.sparql_select(query, repository_id)
+
+    async def get_connectivity(
+        self,
+        class_iris: list[str],
+        limit: int = 10,
+        repository_id: str | None = None,
+    ) -> QueryResult:
+        """Find the most connected instances of the given classes.
+
+        Connections count every triple in which the instance appears as
+        subject or object.
+        """
+        if not class_iris:
+            return QueryResult(type="select", bindings=[], variables=[])
+
+        values = " ".join(f"<{iri}>" for iri in class_iris)
         query = f"""
-        SELECT DISTINCT ?instance ?label
+        SELECT ?entity ?type (COUNT(?related) AS ?connections)
         WHERE {{
-            ?instance a <{class_iri}> .
-            OPTIONAL {{ ?instance rdfs:label ?label }}
+            VALUES ?type {{ {values} }}
+            ?entity a ?type .
+            {{ ?entity ?p ?related }} UNION {{ ?related ?p ?entity }}
         }}
-        ORDER BY ?instance
+        GROUP BY ?entity ?type
+        ORDER BY DESC(?connections)
         LIMIT {limit}
         """
         return await self.sparql_select(query, repository_id)
 
-    async def get_schema_summary(self, repository_id: str | None = None) -> dict[str, Any]:
-        """Get a summary of the ontology schema."""
-        classes_result = await self.search_classes(limit=50, repository_id=repository_id)
-        properties_result = await self.search_properties(limit=50, repository_id=repository_id)
-        stats = await self.get_statistics(repository_id)
-        namespaces = await self.get_namespaces(repository_id)
-
-        return {
-            "statistics": {
-                "total_statements": stats.total_statements,
-                "total_classes": stats.total_classes,
-                "total_properties": stats.total_properties,
-            },
-            "classes": classes_result.bindings or [],
-            "properties": properties_result.bindings or [],
-            "namespaces": [{"prefix": ns.prefix, "namespace": ns.namespace} for ns in namespaces],
-        }
+    async def get_schema_summary(
+        self,
+        repository_id: str | None = None,
+        classes_limit: int = SUMMARY_LIMIT,
+        properties_limit: int = SUMMARY_LIMIT,
+    ) -> SchemaSummary:
+        """Get a summary of the ontology schema (cached per repository and limits).
+
+        Args:
+            repository_id: Repository to summarize (uses the current one if not specified)
+            classes_limit: Maximum number of classes to include
+            properties_limit: Maximum number of properties to include
+        """
+        return await self._cached(
+            f"schema_summary:{classes_limit}:{properties_limit}",
+            repository_id,
+            lambda: self._build_schema_summary(repository_id, classes_limit, properties_limit),
+        )
+
+    async def _build_schema_summary(
+        self, repository_id: str | None, classes_limit: int, properties_limit: int
+    ) -> SchemaSummary:
+        """Build the schema summary from the store."""
+        # The four lookups are independent, so run them concurrently
+        classes_result, properties_result, stats, namespaces = await asyncio.gather(
+            self.search_classes(
+                limit=classes_limit,
+                repository_id=repository_id,
+                comment_length=SUMMARY_COMMENT_LENGTH,
+            ),
+            self.search_properties(limit=properties_limit, repository_id=repository_id),
+            self.get_statistics(repository_id),
+            self.get_namespaces(repository_id),
+        )
+
+        return SchemaSummary(
+            statistics=stats,
+            classes=classes_result.bindings or [],
+            properties=properties_result.bindings or [],
+            namespaces=namespaces,
+        )
 
     async def __aenter__(self) -> "Backend":
         """Async context manager entry."""
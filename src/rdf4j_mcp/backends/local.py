@@ -1,19 +1,233 @@
 """Local RDF backend using rdflib."""
 
-from typing import Any
-
+import asyncio
+import heapq
+from collections import Counter
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache, partial
+from itertools import islice
+from pathlib import Path
+from typing import Any, Final, TypeVar
+
+import pyoxigraph as og
 import rdflib
-from rdflib import OWL, RDF, RDFS, Graph, Namespace
+from rdflib import OWL, RDF, RDFS, Graph, Literal, URIRef
+from rdflib.plugins.sparql import prepareQuery
+from rdflib.plugins.sparql.sparql import Query
+from rdflib.plugins.stores.memory import Memory
 from rdflib.query import ResultRow
+from rdflib.term import Identifier, Node
 
 from .base import (
+    CONSTRUCT_FORMATS,
+    NAMESPACE_FILTER,
+    PATTERN_FILTERS,
+    SUMMARY_COMMENT_LENGTH,
     Backend,
     NamespaceInfo,
     QueryResult,
     RepositoryInfo,
     StatisticsInfo,
+    Triple,
+    classify_pattern,
+    node_to_dict,
+    oxigraph_term_to_node,
+    parse_single_pattern_ask,
+    search_classes_query,
+    search_properties_query,
+)
+
+T = TypeVar("T")
+
+_TEMPLATE_NAMESPACES = {"rdf": RDF, "rdfs": RDFS, "owl": OWL}
+
+# Properties of one ?domain, bound per call; the text never changes, so it is
+# parsed and translated once at import rather than per search_properties_bulk
+_PROPERTIES_FOR_DOMAIN = prepareQuery(
+    """
+    SELECT DISTINCT ?property ?label ?range
+    WHERE {
+        ?property rdfs:domain ?domain .
+        OPTIONAL { ?property rdfs:label ?label }
+        OPTIONAL { ?property rdfs:range ?range }
+    }
+    ORDER BY ?property
+    """,
+    initNs=_TEMPLATE_NAMESPACES,
 )
 
+# rdf:type objects that mark their subject as a class or a property
+_CLASS_TYPES = frozenset({OWL.Class, RDFS.Class})
+_PROPERTY_TYPES = frozenset({RDF.Property, OWL.ObjectProperty, OWL.DatatypeProperty})
+
+# rdflib validates every IRI on construction; callers tend to ask about the same
+# handful of classes and patterns repeatedly, so reuse the immutable terms.
+# typed=True keeps e.g. Literal(1) and Literal(True) apart.
+_uriref = lru_cache(maxsize=4096, typed=True)(URIRef)
+_literal = lru_cache(maxsize=4096, typed=True)(Literal)
+
+
+# Rows converted per trip to the worker thread when streaming SELECT results
+_STREAM_BATCH_SIZE: Final = 256
+
+# File extensions mapped to rdflib parser names, so loads never fall back to
+# rdflib's plugin lookup and content sniffing
+_FORMATS_BY_EXTENSION = {
+    ".ttl": "turtle",
+    ".nt": "nt",
+    ".nq": "nquads",
+    ".rdf": "xml",
+    ".owl": "xml",
+    ".n3": "n3",
+    ".trig": "trig",
+    ".jsonld": "json-ld",
+}
+
+# Line-based formats read with pyoxigraph's native parser and bulk-added to the
+# graph; rdflib's own parsers for these are pure Python. Quads are flattened
+# into the graph (rdflib would silently drop them on a plain Graph).
+_NATIVE_FORMATS = {
+    "nt": og.RdfFormat.N_TRIPLES,
+    "nt11": og.RdfFormat.N_TRIPLES,
+    "ntriples": og.RdfFormat.N_TRIPLES,
+    "nquads": og.RdfFormat.N_QUADS,
+}
+
+
+def _native_node(term: Any) -> Node:
+    """Convert a parsed pyoxigraph term, sharing the memoized IRI terms."""
+    if type(term) is og.NamedNode:
+        return _uriref(term.value)
+    return oxigraph_term_to_node(term)
+
+
+def _discard(counter: Counter[Node], key: Node) -> None:
+    """Drop one reference to ``key``, removing it once none remain."""
+    if counter[key] <= 1:
+        del counter[key]
+    else:
+        counter[key] -= 1
+
+
+class _IndexedMemory(Memory):
+    """rdflib Memory store that also keeps per-term counts for statistics.
+
+    Memory already indexes triples by SPO/POS/OSP but doesn't expose those
+    indexes. Mirroring how many triples reference each term here makes the
+    distinct subject, predicate and object counts O(1), and class/property
+    counts proportional to the schema instead of the data.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.subjects: Counter[Node] = Counter()
+        self.predicates: Counter[Node] = Counter()
+        self.objects: Counter[Node] = Counter()
+        # Objects of rdf:type, and subjects typed as a class or a property
+        self.type_objects: Counter[Node] = Counter()
+        self.declared_classes: Counter[Node] = Counter()
+        self.declared_properties: Counter[Node] = Counter()
+
+    def add(self, triple: Any, context: Any, quoted: bool = False) -> None:
+        before = len(self)
+        super().add(triple, context, quoted)
+        if len(self) == before:
+            return
+
+        s, p, o = triple
+        self.subjects[s] += 1
+        self.predicates[p] += 1
+        self.objects[o] += 1
+        if p == RDF.type:
+            self.type_objects[o] += 1
+            if o in _CLASS_TYPES:
+                self.declared_classes[s] += 1
+            elif o in _PROPERTY_TYPES:
+                self.declared_properties[s] += 1
+
+    def remove(self, triple_pattern: Any, context: Any = None) -> None:
+        matches = [triple for triple, _ in self.triples(triple_pattern, context)]
+        super().remove(triple_pattern, context)
+
+        for triple in matches:
+            if next(self.triples(triple), None) is not None:
+                # Still asserted in another context
+                continue
+            s, p, o = triple
+            _discard(self.subjects, s)
+            _discard(self.predicates, p)
+            _discard(self.objects, o)
+            if p == RDF.type:
+                _discard(self.type_objects, o)
+                if o in _CLASS_TYPES:
+                    _discard(self.declared_classes, s)
+                elif o in _PROPERTY_TYPES:
+                    _discard(self.declared_properties, s)
+
+    def classes(self) -> set[Node]:
+        """Objects of rdf:type plus anything typed owl:Class or rdfs:Class."""
+        return self.type_objects.keys() | self.declared_classes.keys()
+
+    def properties(self) -> set[Node]:
+        """Predicates in use plus anything typed as an RDF/OWL property."""
+        return self.predicates.keys() | self.declared_properties.keys()
+
+
+@lru_cache(maxsize=256)
+def _prepare(query: str, namespaces: tuple[tuple[str, str], ...]) -> Query:
+    """Parse and translate a SPARQL query once per query text and prefix set."""
+    return prepareQuery(query, initNs=dict(namespaces))
+
+
+def _subject_filter(variable: str, pattern_kind: str | None, has_namespace: bool) -> str:
+    """Build the FILTER clause for ?_pattern/?_namespace template parameters."""
+    expressions = []
+    if pattern_kind:
+        expressions.append(
+            PATTERN_FILTERS[pattern_kind].format(variable=variable, operand="?_pattern")
+        )
+    if has_namespace:
+        expressions.append(NAMESPACE_FILTER.format(variable=variable, operand="?_namespace"))
+
+    if not expressions:
+        return ""
+    return "FILTER(" + " && ".join(expressions) + ")"
+
+
+@cache
+def _prepared_search_classes(
+    pattern_kind: str | None, has_namespace: bool, comment_length: int | None = None
+) -> Query:
+    """Prepare the class search template with ?_pattern/?_namespace parameters."""
+    filter_clause = _subject_filter("?class", pattern_kind, has_namespace)
+    return prepareQuery(
+        search_classes_query(filter_clause, comment_length=comment_length),
+        initNs=_TEMPLATE_NAMESPACES,
+    )
+
+
+@cache
+def _prepared_search_properties(
+    pattern_kind: str | None, has_namespace: bool, has_domain: bool, has_range: bool
+) -> Query:
+    """Prepare a property search template with ?_pattern/?_namespace/?_domain/?_range."""
+    pattern_clause = _subject_filter("?property", pattern_kind, has_namespace)
+
+    filters = []
+    if has_domain:
+        filters.append("?domain = ?_domain")
+    if has_range:
+        filters.append("?range = ?_range")
+
+    filter_clause = ""
+    if filters:
+        filter_clause = "FILTER(" + " && ".join(filters) + ")"
+
+    return prepareQuery(
+        search_properties_query(pattern_clause, filter_clause), initNs=_TEMPLATE_NAMESPACES
+    )
+
 
 class LocalBackend(Backend):
     """Local RDF backend using rdflib for in-memory or file-based storage."""
@@ -22,35 +236,56 @@ class LocalBackend(Backend):
         self,
         store_path: str | None = None,
         store_format: str = "turtle",
+        cache_ttl: float = 300.0,
+        query_cache_size: int = 256,
     ):
         """Initialize local backend.
 
         Args:
             store_path: Path to RDF file to load (optional)
             store_format: Format of RDF file (turtle, xml, n3, nt, nquads, trig, jsonld)
+            cache_ttl: Seconds to cache schema-level lookups and query results
+                (0 disables caching)
+            query_cache_size: Maximum number of query results to keep (0 disables)
         """
+        super().__init__(cache_ttl, query_cache_size)
         self._store_path = store_path
         self._store_format = store_format
         self._graph: Graph | None = None
+        self._store = _IndexedMemory()
+        self._executor: ThreadPoolExecutor | None = None
         self._repository_id = "local"
+        self._generation = 0
+        self._namespaces_generation = -1
+        self._namespaces: tuple[tuple[str, str], ...] = ()
+        self._init_ns: dict[str, str] = {}
 
     async def connect(self) -> None:
         """Initialize the RDF graph."""
-        self._graph = Graph()
+        self._store = _IndexedMemory()
+        # rdflib's default bindings already include rdf, rdfs, owl and xsd,
+        # all set up in one pass when the namespace manager is created
+        self._graph = Graph(store=self._store, bind_namespaces="rdflib")
+        self._generation += 1
 
-        # Bind common namespaces
-        self._graph.bind("rdf", RDF)
-        self._graph.bind("rdfs", RDFS)
-        self._graph.bind("owl", OWL)
-        self._graph.bind("xsd", Namespace("http://www.w3.org/2001/XMLSchema#"))
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rdflib")
 
         # Load from file if specified
         if self._store_path:
-            self._graph.parse(self._store_path, format=self._store_format)
+            await self._run(self._parse, self._store_format, path=self._store_path)
+
+        # Build the templates the schema summary runs so the first request
+        # doesn't pay for rdflib's SPARQL parser
+        await self._run(_prepared_search_classes, None, False, SUMMARY_COMMENT_LENGTH)
+        await self._run(_prepared_search_properties, None, False, False, False)
 
     async def close(self) -> None:
-        """Close the backend (no-op for local)."""
+        """Close the backend and stop its worker thread."""
         self._graph = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
 
     def _ensure_connected(self) -> Graph:
         """Ensure graph is connected and return it."""
@@ -58,6 +293,19 @@ class LocalBackend(Backend):
             raise RuntimeError("Backend not connected. Call connect() first.")
         return self._graph
 
+    async def _run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run blocking rdflib work off the event loop.
+
+        Parsing and query evaluation are pure Python and can take seconds on
+        large graphs. They run on a single worker thread: that keeps the event
+        loop serving other requests, and since rdflib's Memory store isn't
+        safe to modify while it is being read, one worker also keeps loads
+        and queries from interleaving.
+        """
+        self._ensure_connected()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
     async def list_repositories(self) -> list[RepositoryInfo]:
         """List available repositories (returns single local repo)."""
         return [
@@ -81,37 +329,55 @@ class LocalBackend(Backend):
 
     def _bindings_to_dicts(self, result: rdflib.query.Result) -> list[dict[str, Any]]:
         """Convert rdflib query result to list of dicts."""
-        bindings = []
-        for row in result:
-            if isinstance(row, ResultRow):
-                binding = {}
-                for var in result.vars or []:
-                    value = getattr(row, str(var), None)
-                    if value is not None:
-                        binding[str(var)] = self._term_to_dict(value)
-                bindings.append(binding)
-        return bindings
+        names = [str(v) for v in (result.vars or [])]
+        term_to_dict = self._term_to_dict
+        return [
+            {
+                name: term_to_dict(value)
+                for name, value in zip(names, row, strict=True)
+                if value is not None
+            }
+            for row in result
+            if isinstance(row, ResultRow)
+        ]
+
+    def _row_to_dict(self, row: ResultRow, names: list[str]) -> dict[str, Any]:
+        """Convert a single rdflib result row to a dict.
+
+        Rows are tuples ordered like ``result.vars``, so values are paired with
+        the precomputed variable names positionally rather than by getattr.
+        """
+        term_to_dict = self._term_to_dict
+        return {
+            name: term_to_dict(value)
+            for name, value in zip(names, row, strict=True)
+            if value is not None
+        }
+
+    def _query(self, query: str) -> rdflib.query.Result:
+        """Evaluate a SPARQL query, reusing the parsed form of repeated queries.
+
+        Prefixes resolve against the graph's bindings, which only change when
+        data is (re)loaded, so they are snapshotted per load generation.
+        """
+        graph = self._ensure_connected()
+        if self._namespaces_generation != self._generation:
+            self._namespaces = tuple((prefix, str(ns)) for prefix, ns in graph.namespaces())
+            self._init_ns = dict(self._namespaces)
+            self._namespaces_generation = self._generation
+        return graph.query(_prepare(query, self._namespaces), initNs=self._init_ns)
 
     def _term_to_dict(self, term: Any) -> dict[str, Any]:
         """Convert an rdflib term to a dict representation."""
-        if isinstance(term, rdflib.URIRef):
-            return {"type": "uri", "value": str(term)}
-        elif isinstance(term, rdflib.Literal):
-            result: dict[str, Any] = {"type": "literal", "value": str(term)}
-            if term.language:
-                result["xml:lang"] = term.language
-            if term.datatype:
-                result["datatype"] = str(term.datatype)
-            return result
-        elif isinstance(term, rdflib.BNode):
-            return {"type": "bnode", "value": str(term)}
-        else:
-            return {"type": "unknown", "value": str(term)}
+        return node_to_dict(term)
 
     async def sparql_select(self, query: str, repository_id: str | None = None) -> QueryResult:
         """Execute a SPARQL SELECT query."""
-        graph = self._ensure_connected()
-        result = graph.query(query)
+        return await self._run(self._select, query)
+
+    def _select(self, query: str) -> QueryResult:
+        """Evaluate a SELECT query and convert every row."""
+        result = self._query(query)
 
         variables = [str(v) for v in (result.vars or [])]
         bindings = self._bindings_to_dicts(result)
@@ -122,107 +388,395 @@ class LocalBackend(Backend):
             variables=variables,
         )
 
-    async def sparql_construct(self, query: str, repository_id: str | None = None) -> QueryResult:
-        """Execute a SPARQL CONSTRUCT or DESCRIBE query."""
+    def _select_result(
+        self, result: rdflib.query.Result, limit: int, sort_by: str | None = None
+    ) -> QueryResult:
+        """Convert the first ``limit`` rows of an rdflib SELECT result.
+
+        Args:
+            result: The SELECT result to convert
+            limit: Maximum number of rows to convert
+            sort_by: Variable to order rows by; the smallest ``limit`` rows are
+                kept in a bounded heap rather than sorting the whole result
+        """
+        names = [str(v) for v in (result.vars or [])]
+        rows = (row for row in result if isinstance(row, ResultRow))
+        if sort_by is None:
+            selected = list(islice(rows, limit))
+        else:
+            selected = heapq.nsmallest(limit, rows, key=lambda row: str(row[sort_by]))
+        return QueryResult(
+            type="select",
+            bindings=[self._row_to_dict(row, names) for row in selected],
+            variables=names,
+        )
+
+    async def search_classes(
+        self,
+        pattern: str | None = None,
+        limit: int = 100,
+        repository_id: str | None = None,
+        namespace_prefix: str | None = None,
+        sort: bool = False,
+        comment_length: int | None = None,
+    ) -> QueryResult:
+        """Search for classes using a prepared query template."""
+        pattern_kind = None
+        init_bindings: dict[str, Identifier] = {}
+        if pattern:
+            pattern_kind, operand = classify_pattern(pattern)
+            init_bindings["_pattern"] = _literal(operand)
+        if namespace_prefix:
+            init_bindings["_namespace"] = _literal(namespace_prefix)
+
+        prepare = partial(
+            _prepared_search_classes, pattern_kind, bool(namespace_prefix), comment_length
+        )
+        return await self._run(
+            self._search, prepare, init_bindings, limit, "class" if sort else None
+        )
+
+    async def search_properties(
+        self,
+        pattern: str | None = None,
+        domain: str | None = None,
+        range_: str | None = None,
+        limit: int = 100,
+        repository_id: str | None = None,
+        namespace_prefix: str | None = None,
+        sort: bool = False,
+    ) -> QueryResult:
+        """Search for properties using a prepared query template."""
+        pattern_kind = None
+        init_bindings: dict[str, Identifier] = {}
+        if pattern:
+            pattern_kind, operand = classify_pattern(pattern)
+            init_bindings["_pattern"] = _literal(operand)
+        if namespace_prefix:
+            init_bindings["_namespace"] = _literal(namespace_prefix)
+        if domain:
+            init_bindings["_domain"] = _uriref(domain)
+        if range_:
+            init_bindings["_range"] = _uriref(range_)
+
+        prepare = partial(
+            _prepared_search_properties,
+            pattern_kind,
+            bool(namespace_prefix),
+            bool(domain),
+            bool(range_),
+        )
+        return await self._run(
+            self._search, prepare, init_bindings, limit, "property" if sort else None
+        )
+
+    def _search(
+        self,
+        prepare: Callable[[], Query],
+        init_bindings: dict[str, Identifier],
+        limit: int,
+        sort_by: str | None,
+    ) -> QueryResult:
+        """Evaluate a search template, prepared on first use, with its parameters bound."""
+        result = self._ensure_connected().query(prepare(), initBindings=init_bindings)
+        return self._select_result(result, limit, sort_by)
+
+    async def search_properties_bulk(
+        self,
+        domains: list[str],
+        repository_id: str | None = None,
+    ) -> QueryResult:
+        """Find properties for several domains with the prepared per-domain query."""
+        if not domains:
+            return QueryResult(type="select", bindings=[], variables=[])
+
+        return QueryResult(
+            type="select",
+            bindings=await self._run(self._properties_for_domains, domains),
+            variables=["domain", "property", "label", "range"],
+        )
+
+    def _properties_for_domains(self, domains: list[str]) -> list[dict[str, Any]]:
+        """Run the per-domain property query for each distinct domain, in IRI order."""
         graph = self._ensure_connected()
-        result = graph.query(query)
+        bindings = []
+        for domain in sorted(set(domains)):
+            domain_dict = node_to_dict(_uriref(domain))
+            result = graph.query(_PROPERTIES_FOR_DOMAIN, initBindings={"domain": _uriref(domain)})
+            for row in result:
+                if isinstance(row, ResultRow):
+                    binding = {"domain": domain_dict}
+                    binding.update(self._row_to_dict(row, ["property", "label", "range"]))
+                    bindings.append(binding)
+        return bindings
+
+    async def sparql_select_stream(
+        self, query: str, repository_id: str | None = None
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Execute a SPARQL SELECT query, converting rows lazily.
+
+        Rows are evaluated on the worker thread in batches as they are
+        consumed, so the event loop never runs the query and a slow consumer
+        never holds the worker.
+
+        Raises:
+            RuntimeError: If data is loaded before the results are exhausted
+        """
+        result = await self._run(self._query, query)
+        names = [str(v) for v in (result.vars or [])]
+        rows = iter(result)
+        generation = self._generation
+        while batch := await self._run(self._next_rows, rows, names, generation):
+            for binding in batch:
+                yield binding
+
+    def _next_rows(
+        self, rows: Iterator[Any], names: list[str], generation: int
+    ) -> list[dict[str, Any]]:
+        """Evaluate and convert the next batch of a lazy SELECT result."""
+        if self._generation != generation:
+            raise RuntimeError("Data was loaded while streaming query results")
+        return [
+            self._row_to_dict(row, names)
+            for row in islice(rows, _STREAM_BATCH_SIZE)
+            if isinstance(row, ResultRow)
+        ]
+
+    async def _fetch_labels(
+        self, iris: list[str], repository_id: str | None
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Look up rdfs:label values with one index probe per resource."""
+        return await self._run(self._labels, iris)
 
-        # Create a new graph from the result triples
-        result_graph = Graph()
-        for triple in result:
-            result_graph.add(triple)
+    def _labels(self, iris: list[str]) -> dict[str, list[dict[str, Any]]]:
+        """Collect the labels of each resource that has any."""
+        graph = self._ensure_connected()
+        labels: dict[str, list[dict[str, Any]]] = {}
+        for iri in iris:
+            found = [node_to_dict(label) for label in graph.objects(_uriref(iri), RDFS.label)]
+            if found:
+                labels[iri] = found
+        return labels
+
+    async def sparql_select_values(self, query: str, repository_id: str | None = None) -> list[str]:
+        """Execute a single-variable SELECT query without building binding dicts."""
+        return await self._run(self._select_values, query)
+
+    def _select_values(self, query: str) -> list[str]:
+        """Evaluate a single-variable SELECT query into plain strings."""
+        result = self._query(query)
+        variables = result.vars or []
+        if len(variables) > 1:
+            raise ValueError(f"Expected a single projected variable, got {len(variables)}")
+        return [str(row[0]) for row in result if isinstance(row, ResultRow) and row[0] is not None]
+
+    async def sparql_construct(
+        self, query: str, repository_id: str | None = None, format: str = "nt"
+    ) -> QueryResult:
+        """Execute a SPARQL CONSTRUCT or DESCRIBE query.
+
+        rdflib already collects the output in ``result.graph``, which is
+        serialized directly; "nt" avoids the Turtle pretty-printer entirely.
+        """
+        if format not in CONSTRUCT_FORMATS:
+            raise ValueError(f"Unsupported CONSTRUCT format: {format}")
+        return await self._run(self._construct, query, format)
 
-        # Serialize to Turtle
-        turtle = result_graph.serialize(format="turtle")
+    def _construct(self, query: str, format: str) -> QueryResult:
+        """Evaluate a CONSTRUCT or DESCRIBE query and serialize the result graph."""
+        result = self._query(query)
+        data = result.serialize(format=format) if result.graph is not None else None
 
         return QueryResult(
             type="construct",
-            triples=turtle,
+            triples=data.decode("utf-8") if data else "",
+        )
+
+    async def match_triples(
+        self,
+        subject: str | None = None,
+        predicate: str | None = None,
+        obj: str | None = None,
+        repository_id: str | None = None,
+        limit: int | None = None,
+    ) -> list[Triple]:
+        """Match a triple pattern using rdflib's in-memory indexes."""
+        pattern = (
+            _uriref(subject) if subject is not None else None,
+            _uriref(predicate) if predicate is not None else None,
+            _uriref(obj) if obj is not None else None,
         )
+        return await self._run(self._match, pattern, limit)
+
+    def _match(
+        self, pattern: tuple[Node | None, Node | None, Node | None], limit: int | None
+    ) -> list[Triple]:
+        """Collect up to ``limit`` triples matching a pattern."""
+        return list(islice(self._ensure_connected().triples(pattern), limit))
 
     async def sparql_ask(self, query: str, repository_id: str | None = None) -> QueryResult:
         """Execute a SPARQL ASK query."""
-        graph = self._ensure_connected()
-        result = graph.query(query)
+        # Single triple pattern: one index probe instead of a full BGP evaluation
+        simple_pattern = parse_single_pattern_ask(query)
+        if simple_pattern is not None:
+            s, p, o = (_uriref(term) if term is not None else None for term in simple_pattern)
+            return QueryResult(type="ask", boolean=bool(await self._run(self._match, (s, p, o), 1)))
+
+        result = await self._run(self._query, query)
 
         return QueryResult(
             type="ask",
             boolean=bool(result.askAnswer),
         )
 
-    async def get_namespaces(self, repository_id: str | None = None) -> list[NamespaceInfo]:
+    async def _repository_version(self, repository_id: str | None) -> str | None:
+        """Version stamp bumped on every load, plus the graph size as a safeguard."""
+        return await self._run(self._version)
+
+    def _version(self) -> str:
+        """Read the load generation and graph size together."""
+        return f"{self._generation}:{len(self._ensure_connected())}"
+
+    async def _fetch_namespaces(self, repository_id: str | None = None) -> list[NamespaceInfo]:
         """Get namespace prefix mappings."""
+        return await self._run(self._namespace_infos)
+
+    def _namespace_infos(self) -> list[NamespaceInfo]:
+        """List the graph's prefix bindings."""
         graph = self._ensure_connected()
         namespaces = []
         for prefix, ns in graph.namespaces():
             namespaces.append(NamespaceInfo(prefix=prefix, namespace=str(ns)))
         return namespaces
 
-    async def get_statistics(self, repository_id: str | None = None) -> StatisticsInfo:
-        """Get repository statistics."""
-        graph = self._ensure_connected()
-
-        # Count total statements
-        total_statements = len(graph)
+    async def _fetch_statistics(self, repository_id: str | None = None) -> StatisticsInfo:
+        """Get repository statistics from the store's per-term counts.
 
-        # Count distinct classes
-        classes_query = """
-        SELECT (COUNT(DISTINCT ?class) AS ?count) WHERE {
-            { ?class a owl:Class }
-            UNION { ?class a rdfs:Class }
-            UNION { ?s a ?class }
-        }
-        """
-        classes_result = graph.query(classes_query)
-        total_classes = 0
-        for row in classes_result:
-            if hasattr(row, "count") and row.count is not None:
-                total_classes = int(row.count)
-
-        # Count distinct properties
-        props_query = """
-        SELECT (COUNT(DISTINCT ?prop) AS ?count) WHERE {
-            { ?prop a rdf:Property }
-            UNION { ?prop a owl:ObjectProperty }
-            UNION { ?prop a owl:DatatypeProperty }
-            UNION { ?s ?prop ?o }
-        }
+        Classes are the objects of rdf:type plus anything typed owl:Class or
+        rdfs:Class; properties are every predicate in use plus anything typed
+        as an RDF/OWL property. The counts are maintained as triples are added
+        and removed, so no pass over the graph is needed.
         """
-        props_result = graph.query(props_query)
-        total_properties = 0
-        for row in props_result:
-            if hasattr(row, "count") and row.count is not None:
-                total_properties = int(row.count)
-
-        # Count distinct subjects
-        subjects = set()
-        objects = set()
-        for s, _, o in graph:
-            subjects.add(s)
-            objects.add(o)
+        return await self._run(self._statistics)
+
+    def _statistics(self) -> StatisticsInfo:
+        """Read the statistics from the store's counters."""
+        graph = self._ensure_connected()
+        store = self._store
 
         return StatisticsInfo(
-            total_statements=total_statements,
-            total_classes=total_classes,
-            total_properties=total_properties,
-            total_subjects=len(subjects),
-            total_objects=len(objects),
+            total_statements=len(graph),
+            total_classes=len(store.classes()),
+            total_properties=len(store.properties()),
+            total_subjects=len(store.subjects),
+            total_objects=len(store.objects),
         )
 
+    async def get_property_usage(self, repository_id: str | None = None) -> QueryResult:
+        """Count object property usage with one predicate-index lookup per property."""
+        return await self._run(self._property_usage)
+
+    def _property_usage(self) -> QueryResult:
+        """Build the property usage rows from the graph's indexes."""
+        graph = self._ensure_connected()
+
+        rows = []
+        for prop in graph.subjects(RDF.type, OWL.ObjectProperty, unique=True):
+            usage = sum(1 for _ in graph.triples((None, prop, None)))
+            if not usage:
+                continue
+            for domain in graph.objects(prop, RDFS.domain):
+                for range_ in graph.objects(prop, RDFS.range):
+                    rows.append((usage, prop, domain, range_))
+        rows.sort(key=lambda row: row[0], reverse=True)
+
+        return QueryResult(
+            type="select",
+            bindings=[
+                {
+                    "prop": node_to_dict(prop),
+                    "domain": node_to_dict(domain),
+                    "range": node_to_dict(range_),
+                    "usage": node_to_dict(_literal(usage)),
+                }
+                for usage, prop, domain, range_ in rows
+            ],
+            variables=["prop", "domain", "range", "usage"],
+        )
+
+    async def get_connectivity(
+        self,
+        class_iris: list[str],
+        limit: int = 10,
+        repository_id: str | None = None,
+    ) -> QueryResult:
+        """Count instance connections via subject and object index lookups."""
+        return await self._run(self._connectivity, class_iris, limit)
+
+    def _connectivity(self, class_iris: list[str], limit: int) -> QueryResult:
+        """Build the connectivity rows from the graph's indexes."""
+        graph = self._ensure_connected()
+
+        rows = []
+        for class_iri in class_iris:
+            type_ = _uriref(class_iri)
+            for entity in graph.subjects(RDF.type, type_, unique=True):
+                connections = sum(1 for _ in graph.triples((entity, None, None))) + sum(
+                    1 for _ in graph.triples((None, None, entity))
+                )
+                rows.append((connections, entity, type_))
+        rows.sort(key=lambda row: row[0], reverse=True)
+
+        return QueryResult(
+            type="select",
+            bindings=[
+                {
+                    "entity": node_to_dict(entity),
+                    "type": node_to_dict(type_),
+                    "connections": node_to_dict(_literal(connections)),
+                }
+                for connections, entity, type_ in rows[:limit]
+            ],
+            variables=["entity", "type", "connections"],
+        )
+
+    def _parse(self, format: str | None, **source: Any) -> int:
+        """Parse RDF into the graph and return the number of triples added."""
+        graph = self._ensure_connected()
+        before = len(graph)
+        native_format = _NATIVE_FORMATS.get(format) if format else None
+        if native_format is not None:
+            # Fresh blank node labels per load, as rdflib's parsers give
+            quads = og.parse(**source, format=native_format, rename_blank_nodes=True)
+            graph.addN(
+                (
+                    _native_node(quad.subject),
+                    _uriref(quad.predicate.value),
+                    _native_node(quad.object),
+                    graph,
+                )
+                for quad in quads
+            )
+        elif "path" in source:
+            graph.parse(source["path"], format=format)
+        else:
+            graph.parse(data=source["input"], format=format)
+        self._generation += 1
+        return len(graph) - before
+
     async def load_file(self, file_path: str, format: str | None = None) -> int:
         """Load RDF data from a file.
 
         Args:
             file_path: Path to the RDF file
-            format: RDF format (auto-detected if not specified)
+            format: RDF format (detected from the file extension if not specified)
 
         Returns:
             Number of triples loaded
         """
-        graph = self._ensure_connected()
-        before = len(graph)
-        graph.parse(file_path, format=format)
-        return len(graph) - before
+        if format is None:
+            format = _FORMATS_BY_EXTENSION.get(Path(file_path).suffix.lower())
+        return await self._run(self._parse, format, path=file_path)
 
     async def load_data(self, data: str, format: str = "turtle") -> int:
         """Load RDF data from a string.
@@ -234,7 +788,4 @@ class LocalBackend(Backend):
         Returns:
             Number of triples loaded
         """
-        graph = self._ensure_connected()
-        before = len(graph)
-        graph.parse(data=data, format=format)
-        return len(graph) - before
+        return await self._run(self._parse, format, input=data)
@@ -1,18 +1,50 @@
 """Remote RDF backend using RDF4J Python client."""
 
-from typing import Any
-
+import asyncio
+import importlib.util
+import time
+from itertools import islice
+from typing import Any, Final
+from urllib.parse import quote
+
+import httpx
+import orjson
 import pyoxigraph as og
-from rdf4j_python import AsyncRdf4j, AsyncRdf4JRepository
+from rdf4j_python import AsyncRdf4j, AsyncRdf4JRepository, RepositoryNotFoundException
 
 from .base import (
+    CONSTRUCT_FORMATS,
+    OBJECT_COUNT_QUERY,
+    SUBJECT_COUNT_QUERY,
     Backend,
     NamespaceInfo,
     QueryResult,
     RepositoryInfo,
     StatisticsInfo,
+    Triple,
+    oxigraph_term_to_node,
+    parse_single_pattern_ask,
+)
+
+# Connection pool shared by every request made through one backend instance
+_CONNECTION_LIMITS = httpx.Limits(
+    max_connections=20, max_keepalive_connections=20, keepalive_expiry=30.0
 )
 
+# HTTP/2 multiplexes concurrent queries over one connection; httpx needs the
+# optional h2 package for it (pip install "rdf4j-mcp[http2]")
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Seconds a repository size probe stays valid as the cache version stamp;
+# writes from other clients reach cached results within this interval
+_VERSION_PROBE_INTERVAL: Final = 2.0
+
+_SPARQL_JSON_HEADERS = {"Accept": "application/sparql-results+json"}
+_CONSTRUCT_HEADERS = {
+    "turtle": {"Accept": "text/turtle"},
+    "nt": {"Accept": "application/n-triples"},
+}
+
 
 class RemoteBackend(Backend):
     """Remote RDF backend using RDF4J HTTP API."""
@@ -21,23 +53,48 @@ class RemoteBackend(Backend):
         self,
         server_url: str,
         default_repository: str | None = None,
+        timeout: float = 30.0,
+        cache_ttl: float = 300.0,
+        query_cache_size: int = 256,
+        transport: httpx.AsyncBaseTransport | None = None,
     ):
         """Initialize remote backend.
 
         Args:
             server_url: URL of the RDF4J server
             default_repository: Default repository ID to use
+            timeout: HTTP request timeout in seconds
+            cache_ttl: Seconds to cache schema-level lookups and query results
+                (0 disables caching)
+            query_cache_size: Maximum number of query results to keep (0 disables)
+            transport: httpx transport for the SPARQL endpoint requests
+                (defaults to a pooled network transport)
         """
+        super().__init__(cache_ttl, query_cache_size)
         self._server_url = server_url.rstrip("/")
         self._default_repository = default_repository
+        self._timeout = timeout
+        self._transport = transport
         self._current_repository: str | None = default_repository
         self._client: AsyncRdf4j | None = None
+        self._http: httpx.AsyncClient | None = None
         self._repo: AsyncRdf4JRepository | None = None
+        # Per repository: when the last size probe expires, and the probe itself
+        self._version_probes: dict[str, tuple[float, asyncio.Future[int]]] = {}
 
     async def connect(self) -> None:
         """Connect to the RDF4J server."""
         self._client = AsyncRdf4j(self._server_url)
         await self._client.__aenter__()
+        # Queries and size probes go through one pooled keep-alive session of
+        # our own, so repeated requests reuse connections and honour the timeout
+        self._http = httpx.AsyncClient(
+            base_url=self._server_url,
+            timeout=self._timeout,
+            limits=_CONNECTION_LIMITS,
+            http2=_HTTP2,
+            transport=self._transport,
+        )
 
         # Connect to default repository if specified
         if self._default_repository:
@@ -46,6 +103,10 @@ class RemoteBackend(Backend):
 
     async def close(self) -> None:
         """Close connection to the server."""
+        if self._http:
+            await self._http.aclose()
+            self._http = None
+        self._version_probes.clear()
         if self._client:
             await self._client.__aexit__(None, None, None)
             self._client = None
@@ -57,13 +118,17 @@ class RemoteBackend(Backend):
             raise RuntimeError("Backend not connected. Call connect() first.")
         return self._client
 
-    async def _get_repository(self, repository_id: str | None = None) -> AsyncRdf4JRepository:
-        """Get repository instance."""
-        client = self._ensure_connected()
+    def _repository_id(self, repository_id: str | None) -> str:
+        """Resolve the repository to use, falling back to the current one."""
         repo_id = repository_id or self._current_repository
-
         if repo_id is None:
             raise ValueError("No repository specified and no default repository set")
+        return repo_id
+
+    async def _get_repository(self, repository_id: str | None = None) -> AsyncRdf4JRepository:
+        """Get repository instance."""
+        client = self._ensure_connected()
+        repo_id = self._repository_id(repository_id)
 
         if self._repo is not None and self._current_repository == repo_id:
             return self._repo
@@ -96,139 +161,183 @@ class RemoteBackend(Backend):
         """Get the currently selected repository ID."""
         return self._current_repository
 
-    def _solution_to_dict(self, solution: og.QuerySolution) -> dict[str, Any]:
-        """Convert a pyoxigraph QuerySolution to a dict."""
-        result = {}
-        for i, var in enumerate(solution):
-            if var is not None:
-                result[f"var_{i}"] = self._term_to_dict(var)
-        return result
-
-    def _term_to_dict(self, term: Any) -> dict[str, Any]:
-        """Convert a pyoxigraph term to a dict."""
-        if isinstance(term, og.NamedNode):
-            return {"type": "uri", "value": term.value}
-        elif isinstance(term, og.Literal):
-            result: dict[str, Any] = {"type": "literal", "value": term.value}
-            if term.language:
-                result["xml:lang"] = term.language
-            if term.datatype:
-                result["datatype"] = term.datatype.value
-            return result
-        elif isinstance(term, og.BlankNode):
-            return {"type": "bnode", "value": term.value}
-        else:
-            return {"type": "unknown", "value": str(term)}
-
-    def _query_solutions_to_bindings(
-        self, solutions: og.QuerySolutions
+    async def _repository_get(
+        self,
+        repository_id: str | None,
+        path: str = "",
+        params: dict[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """Send a GET to a repository endpoint of the RDF4J REST API."""
+        if self._http is None:
+            raise RuntimeError("Backend not connected. Call connect() first.")
+        repo_id = self._repository_id(repository_id)
+        response = await self._http.get(
+            f"/repositories/{quote(repo_id, safe='')}{path}", params=params, headers=headers
+        )
+        if response.status_code == httpx.codes.NOT_FOUND:
+            raise RepositoryNotFoundException(f"Repository {repo_id} not found")
+        response.raise_for_status()
+        return response
+
+    async def _query_response(
+        self, query: str, repository_id: str | None, headers: dict[str, str]
+    ) -> httpx.Response:
+        """Send a query to the repository endpoint, negotiating the result format."""
+        return await self._repository_get(
+            repository_id, params={"query": query, "infer": "true"}, headers=headers
+        )
+
+    async def _select_json(
+        self, query: str, repository_id: str | None
     ) -> tuple[list[dict[str, Any]], list[str]]:
-        """Convert QuerySolutions to bindings list and variable names."""
-        variables = list(solutions.variables)
-        var_names = [str(v.value) for v in variables]
+        """Run a SELECT query and decode the SPARQL JSON results directly.
 
-        bindings = []
-        for solution in solutions:
-            binding = {}
-            for i, var_name in enumerate(var_names):
-                value = solution[i]
-                if value is not None:
-                    binding[var_name] = self._term_to_dict(value)
-            bindings.append(binding)
+        The SPARQL JSON document already carries bindings in the dict shape
+        QueryResult exposes, so decoding it with orjson avoids building a
+        pyoxigraph term per value and converting it back.
 
-        return bindings, var_names
+        Returns:
+            The bindings and the projected variable names
+        """
+        response = await self._query_response(query, repository_id, _SPARQL_JSON_HEADERS)
+        document = orjson.loads(response.content)
+        results = document.get("results")
+        if results is None:
+            # Not a SELECT (e.g. an ASK sent through sparql_select)
+            return [], []
+        return results["bindings"], document["head"].get("vars", [])
 
     async def sparql_select(self, query: str, repository_id: str | None = None) -> QueryResult:
         """Execute a SPARQL SELECT query."""
-        repo = await self._get_repository(repository_id)
-        result = await repo.query(query)
-
-        if isinstance(result, og.QuerySolutions):
-            bindings, variables = self._query_solutions_to_bindings(result)
-            return QueryResult(
-                type="select",
-                bindings=bindings,
-                variables=variables,
-            )
-        else:
-            return QueryResult(
-                type="select",
-                bindings=[],
-                variables=[],
-            )
+        bindings, variables = await self._select_json(query, repository_id)
+        return QueryResult(
+            type="select",
+            bindings=bindings,
+            variables=variables,
+        )
 
-    async def sparql_construct(self, query: str, repository_id: str | None = None) -> QueryResult:
-        """Execute a SPARQL CONSTRUCT or DESCRIBE query."""
+    async def sparql_construct(
+        self, query: str, repository_id: str | None = None, format: str = "nt"
+    ) -> QueryResult:
+        """Execute a SPARQL CONSTRUCT or DESCRIBE query.
+
+        RDF4J serializes the graph in the requested format itself, so the
+        response body is passed through without parsing it into terms.
+        """
+        if format not in CONSTRUCT_FORMATS:
+            raise ValueError(f"Unsupported CONSTRUCT format: {format}")
+        response = await self._query_response(query, repository_id, _CONSTRUCT_HEADERS[format])
+        return QueryResult(
+            type="construct",
+            triples=response.text,
+        )
+
+    async def match_triples(
+        self,
+        subject: str | None = None,
+        predicate: str | None = None,
+        obj: str | None = None,
+        repository_id: str | None = None,
+        limit: int | None = None,
+    ) -> list[Triple]:
+        """Match a triple pattern via the RDF4J statements endpoint."""
         repo = await self._get_repository(repository_id)
-        result = await repo.query(query)
-
-        if isinstance(result, og.QueryTriples):
-            # Serialize triples to Turtle format
-            triples_list = list(result)
-            turtle_lines = []
-            for triple in triples_list:
-                s = self._format_term(triple.subject)
-                p = self._format_term(triple.predicate)
-                o = self._format_term(triple.object)
-                turtle_lines.append(f"{s} {p} {o} .")
-
-            return QueryResult(
-                type="construct",
-                triples="\n".join(turtle_lines),
-            )
-        else:
-            return QueryResult(
-                type="construct",
-                triples="",
+        quads = await repo.get_statements(
+            subject=og.NamedNode(subject) if subject is not None else None,
+            predicate=og.NamedNode(predicate) if predicate is not None else None,
+            object_=og.NamedNode(obj) if obj is not None else None,
+        )
+        # The statements endpoint has no limit parameter; stop converting early instead
+        return [
+            (
+                oxigraph_term_to_node(quad.subject),
+                oxigraph_term_to_node(quad.predicate),
+                oxigraph_term_to_node(quad.object),
             )
+            for quad in islice(quads, limit)
+        ]
 
-    def _format_term(self, term: Any) -> str:
-        """Format a term for Turtle output."""
-        if isinstance(term, og.NamedNode):
-            return f"<{term.value}>"
-        elif isinstance(term, og.Literal):
-            escaped = term.value.replace("\\", "\\\\").replace('"', '\\"')
-            if term.language:
-                return f'"{escaped}"@{term.language}'
-            elif term.datatype and term.datatype.value != "http://www.w3.org/2001/XMLSchema#string":
-                return f'"{escaped}"^^<{term.datatype.value}>'
-            else:
-                return f'"{escaped}"'
-        elif isinstance(term, og.BlankNode):
-            return f"_:{term.value}"
-        else:
-            return str(term)
+    async def find_instances(
+        self,
+        class_iri: str,
+        limit: int = 100,
+        repository_id: str | None = None,
+    ) -> QueryResult:
+        """Find up to ``limit`` instances of a class.
+
+        The statements endpoint can't limit server-side, so this uses SPARQL
+        with the LIMIT on an unordered inner subselect, letting RDF4J stop
+        scanning the type index before the label join. Results come from the
+        query result cache.
+        """
+        query = f"""
+        SELECT ?instance ?label
+        WHERE {{
+            {{ SELECT DISTINCT ?instance WHERE {{ ?instance a <{class_iri}> }} LIMIT {limit} }}
+            OPTIONAL {{ ?instance <http://www.w3.org/2000/01/rdf-schema#label> ?label }}
+        }}
+        """
+        return await self.cached_query("select", query, repository_id)
 
     async def sparql_ask(self, query: str, repository_id: str | None = None) -> QueryResult:
         """Execute a SPARQL ASK query."""
-        repo = await self._get_repository(repository_id)
-        result = await repo.query(query)
+        # Single triple pattern: a LIMIT 1 SELECT lets the server stop at the first match
+        simple_pattern = parse_single_pattern_ask(query)
+        if simple_pattern is not None:
+            s, p, o = (f"<{term}>" if term is not None else None for term in simple_pattern)
+            select_query = f"SELECT * WHERE {{ {s or '?s'} {p or '?p'} {o or '?o'} }} LIMIT 1"
+            bindings, _ = await self._select_json(select_query, repository_id)
+            return QueryResult(type="ask", boolean=bool(bindings))
+
+        response = await self._query_response(query, repository_id, _SPARQL_JSON_HEADERS)
+        return QueryResult(
+            type="ask",
+            boolean=orjson.loads(response.content).get("boolean") is True,
+        )
 
-        if isinstance(result, bool):
-            return QueryResult(
-                type="ask",
-                boolean=result,
-            )
-        else:
-            return QueryResult(
-                type="ask",
-                boolean=False,
-            )
+    async def _size(self, repository_id: str | None) -> int:
+        """Return the number of statements in the repository."""
+        response = await self._repository_get(repository_id, "/size")
+        return int(response.text.strip())
+
+    async def _repository_version(self, repository_id: str | None) -> str | None:
+        """Use the repository size as a modification stamp.
 
-    async def get_namespaces(self, repository_id: str | None = None) -> list[NamespaceInfo]:
+        The size is an HTTP round trip, so it is probed at most once per
+        _VERSION_PROBE_INTERVAL per repository; concurrent callers share the
+        probe in flight and a failed probe isn't reused.
+        """
+        repo_id = self._repository_id(repository_id)
+        now = time.monotonic()
+        probe = self._version_probes.get(repo_id)
+        if probe is None or now >= probe[0]:
+            probe = (now + _VERSION_PROBE_INTERVAL, asyncio.ensure_future(self._size(repo_id)))
+            self._version_probes[repo_id] = probe
+        try:
+            # Shielded so one caller giving up doesn't cancel the probe for the others
+            return str(await asyncio.shield(probe[1]))
+        except Exception:
+            if self._version_probes.get(repo_id) is probe:
+                del self._version_probes[repo_id]
+            raise
+
+    async def _fetch_namespaces(self, repository_id: str | None = None) -> list[NamespaceInfo]:
         """Get namespace prefix mappings."""
         repo = await self._get_repository(repository_id)
         namespaces = await repo.get_namespaces()
 
         return [NamespaceInfo(prefix=ns.prefix, namespace=str(ns.namespace)) for ns in namespaces]
 
-    async def get_statistics(self, repository_id: str | None = None) -> StatisticsInfo:
-        """Get repository statistics."""
-        repo = await self._get_repository(repository_id)
-
-        # Get total statement count
-        total_statements = await repo.size()
+    async def _count(self, query: str, repository_id: str | None) -> int:
+        """Run a single-row COUNT query and return its value (0 if unbound)."""
+        bindings, variables = await self._select_json(query, repository_id)
+        if bindings and variables and variables[0] in bindings[0]:
+            return int(bindings[0][variables[0]]["value"])
+        return 0
 
+    async def _fetch_statistics(self, repository_id: str | None = None) -> StatisticsInfo:
+        """Get repository statistics."""
         # Count classes
         classes_query = """
         SELECT (COUNT(DISTINCT ?class) AS ?count) WHERE {
@@ -237,12 +346,6 @@ class RemoteBackend(Backend):
             UNION { ?s a ?class }
         }
         """
-        classes_result = await repo.query(classes_query)
-        total_classes = 0
-        if isinstance(classes_result, og.QuerySolutions):
-            for solution in classes_result:
-                if solution[0] is not None:
-                    total_classes = int(solution[0].value)
 
         # Count properties
         props_query = """
@@ -253,30 +356,21 @@ class RemoteBackend(Backend):
             UNION { ?s ?prop ?o }
         }
         """
-        props_result = await repo.query(props_query)
-        total_properties = 0
-        if isinstance(props_result, og.QuerySolutions):
-            for solution in props_result:
-                if solution[0] is not None:
-                    total_properties = int(solution[0].value)
-
-        # Count subjects
-        subjects_query = "SELECT (COUNT(DISTINCT ?s) AS ?count) WHERE { ?s ?p ?o }"
-        subjects_result = await repo.query(subjects_query)
-        total_subjects = 0
-        if isinstance(subjects_result, og.QuerySolutions):
-            for solution in subjects_result:
-                if solution[0] is not None:
-                    total_subjects = int(solution[0].value)
-
-        # Count objects
-        objects_query = "SELECT (COUNT(DISTINCT ?o) AS ?count) WHERE { ?s ?p ?o }"
-        objects_result = await repo.query(objects_query)
-        total_objects = 0
-        if isinstance(objects_result, og.QuerySolutions):
-            for solution in objects_result:
-                if solution[0] is not None:
-                    total_objects = int(solution[0].value)
+
+        # Independent round trips: total latency is the slowest query, not the sum
+        (
+            total_statements,
+            total_classes,
+            total_properties,
+            total_subjects,
+            total_objects,
+        ) = await asyncio.gather(
+            self._size(repository_id),
+            self._count(classes_query, repository_id),
+            self._count(props_query, repository_id),
+            self._count(SUBJECT_COUNT_QUERY, repository_id),
+            self._count(OBJECT_COUNT_QUERY, repository_id),
+        )
 
         return StatisticsInfo(
             total_statements=total_statements,
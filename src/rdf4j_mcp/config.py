@@ -10,23 +10,33 @@ class BackendType(str, Enum):
     """Backend type for RDF storage."""
 
     LOCAL = "local"
+    OXIGRAPH = "oxigraph"
     REMOTE = "remote"
 
 
 class Settings(BaseSettings):
-    """Server configuration settings."""
+    """Server configuration settings.
+
+    Instances are immutable: the environment and .env file are read and
+    validated once, and the server shares one instance for its lifetime.
+    Use configure() to install different settings.
+    """
 
     model_config = SettingsConfigDict(
         env_prefix="RDF4J_MCP_",
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
+        frozen=True,
     )
 
     # Backend configuration
     backend_type: BackendType = Field(
         default=BackendType.LOCAL,
-        description="Backend type: 'local' for rdflib, 'remote' for RDF4J HTTP",
+        description=(
+            "Backend type: 'local' for rdflib, 'oxigraph' for an in-process Oxigraph "
+            "store, 'remote' for RDF4J HTTP"
+        ),
     )
 
     # Remote backend settings (RDF4J Server)
@@ -62,6 +72,21 @@ class Settings(BaseSettings):
         default=10000,
         description="Maximum allowed LIMIT for queries",
     )
+    max_concurrent_backend_calls: int = Field(
+        default=16,
+        ge=1,
+        description="Maximum number of tool calls running against the backend at once",
+    )
+
+    # Cache settings
+    cache_ttl: int = Field(
+        default=300,
+        description="Seconds to cache schema summaries, namespaces and query results (0 disables)",
+    )
+    query_cache_size: int = Field(
+        default=256,
+        description="Maximum number of SPARQL query results to cache (0 disables)",
+    )
 
     # Server settings
     server_name: str = Field(
@@ -79,7 +104,7 @@ _settings: Settings | None = None
 
 
 def get_settings() -> Settings:
-    """Get the global settings instance."""
+    """Get the global settings instance, reading the environment on first use."""
     global _settings
     if _settings is None:
         _settings = Settings()
@@ -1,11 +1,196 @@
 """MCP Prompts for RDF4J."""
 
-from typing import Any
+import asyncio
+from itertools import islice
+from typing import Any, Final
 
 from mcp.server import Server
 from mcp.types import GetPromptResult, Prompt, PromptArgument, PromptMessage, TextContent
 
-from ..backends.base import Backend
+from ..backends.base import Backend, NamespaceInfo
+from ..util import binding_value
+
+# Prompt definitions never change, so they are built once at import
+_PROMPTS: Final[tuple[Prompt, ...]] = (
+    Prompt(
+        name="explore_knowledge_graph",
+        description=(
+            "Guided exploration of a knowledge graph. "
+            "Provides context about the schema and suggests exploration paths."
+        ),
+        arguments=[
+            PromptArgument(
+                name="repository_id",
+                description="Repository to explore (optional, uses default)",
+                required=False,
+            ),
+            PromptArgument(
+                name="focus_area",
+                description="Specific class or concept to focus on (optional)",
+                required=False,
+            ),
+        ],
+    ),
+    Prompt(
+        name="write_sparql_query",
+        description=(
+            "Help write a SPARQL query from a natural language description. "
+            "Provides schema context to assist with query construction."
+        ),
+        arguments=[
+            PromptArgument(
+                name="question",
+                description="Natural language question to answer with SPARQL",
+                required=True,
+            ),
+            PromptArgument(
+                name="repository_id",
+                description="Repository to query (optional, uses default)",
+                required=False,
+            ),
+        ],
+    ),
+    Prompt(
+        name="explain_ontology",
+        description=(
+            "Explain the structure and meaning of an ontology or schema. "
+            "Describes classes, properties, and their relationships."
+        ),
+        arguments=[
+            PromptArgument(
+                name="repository_id",
+                description="Repository containing the ontology (optional)",
+                required=False,
+            ),
+            PromptArgument(
+                name="focus_class",
+                description="Specific class IRI to explain (optional)",
+                required=False,
+            ),
+        ],
+    ),
+)
+
+
+# Prompt skeletons, built once; only the schema-dependent sections are filled in per call
+_EXPLORE_TEMPLATE: Final = """You are helping explore a knowledge graph. \
+Here is the current schema context:
+
+## Statistics
+- Total statements: {stats.total_statements}
+- Total classes: {stats.total_classes}
+- Total properties: {stats.total_properties}
+
+## Namespaces
+{ns_text}
+
+## Main Classes
+{classes_text}
+
+## Main Properties
+{props_text}
+{focus_text}
+## Available Tools
+You can use these tools to explore:
+- `sparql_select` - Query for specific data
+- `sparql_construct` - Get RDF subgraphs
+- `describe_resource` - Get all info about a specific IRI
+- `search_classes` - Find classes by pattern
+- `search_properties` - Find properties by pattern
+- `find_instances` - Find instances of a class
+- `get_schema_summary` - Get ontology overview
+
+## Exploration Suggestions
+1. Start by understanding the main classes and their relationships
+2. Use `describe_resource` to explore specific instances
+3. Look for patterns in how classes are connected via properties
+4. Check for hierarchies using rdfs:subClassOf relationships
+
+What would you like to explore?"""
+
+_SPARQL_TEMPLATE: Final = """Help me write a SPARQL query to answer this question:
+
+"{question}"
+
+## Available Prefixes
+```sparql
+{prefixes}
+```
+
+## Available Classes
+{classes_text}
+
+## Available Properties
+{props_text}
+
+## Guidelines
+1. Use the prefixes above when possible
+2. Use OPTIONAL for non-required fields
+3. Add FILTER for text searches or constraints
+4. Use LIMIT to avoid overwhelming results
+5. Consider using ORDER BY for sorted results
+
+Please write a SPARQL SELECT query that answers the question.
+Explain your reasoning and any assumptions made."""
+
+_EXPLAIN_TEMPLATE: Final = """Please explain this ontology/schema:
+
+## Overview
+- Total statements: {stats.total_statements}
+- Total classes: {stats.total_classes}
+- Total properties: {stats.total_properties}
+
+## Namespaces Used
+{ns_text}
+
+## Classes
+{classes_text}
+
+## Properties
+{props_text}
+{focus_text}
+Please provide:
+1. A high-level summary of what this ontology represents
+2. The main concepts (classes) and how they relate
+3. Key properties and what they connect
+4. Any patterns or design choices you notice
+5. Suggestions for how to query this data effectively"""
+
+
+def _optional(binding: dict[str, Any], key: str, template: str) -> str:
+    """Format a variable's value into ``template``, or return "" when it is unbound."""
+    term = binding.get(key)
+    return template.format(term["value"]) if term else ""
+
+
+def _namespace_lines(namespaces: list[NamespaceInfo], limit: int) -> str:
+    """Format the first ``limit`` namespaces as ``  - prefix: <namespace>`` lines."""
+    return "\n".join([f"  - {ns.prefix}: <{ns.namespace}>" for ns in namespaces[:limit]])
+
+
+def _term_lines(
+    bindings: list[dict[str, Any]],
+    key: str,
+    suffixes: tuple[tuple[str, str], ...] = (),
+    line: str = "  - {}",
+    default: str = "Unknown",
+) -> str:
+    """Format one line per binding: the ``key`` term plus any optional suffixes.
+
+    Args:
+        bindings: Result bindings to format
+        key: Variable holding the term each line is about
+        suffixes: ``(variable, template)`` pairs appended when the variable is bound
+        line: Template for the term itself
+        default: Text used when ``key`` is unbound
+    """
+    return "\n".join(
+        [
+            line.format(binding_value(b, key, default))
+            + "".join([_optional(b, k, template) for k, template in suffixes])
+            for b in bindings
+        ]
+    )
 
 
 def register_prompts(server: Server, get_backend: Any) -> None:
@@ -19,65 +204,7 @@ def register_prompts(server: Server, get_backend: Any) -> None:
     @server.list_prompts()
     async def list_prompts() -> list[Prompt]:
         """List available prompts."""
-        return [
-            Prompt(
-                name="explore_knowledge_graph",
-                description=(
-                    "Guided exploration of a knowledge graph. "
-                    "Provides context about the schema and suggests exploration paths."
-                ),
-                arguments=[
-                    PromptArgument(
-                        name="repository_id",
-                        description="Repository to explore (optional, uses default)",
-                        required=False,
-                    ),
-                    PromptArgument(
-                        name="focus_area",
-                        description="Specific class or concept to focus on (optional)",
-                        required=False,
-                    ),
-                ],
-            ),
-            Prompt(
-                name="write_sparql_query",
-                description=(
-                    "Help write a SPARQL query from a natural language description. "
-                    "Provides schema context to assist with query construction."
-                ),
-                arguments=[
-                    PromptArgument(
-                        name="question",
-                        description="Natural language question to answer with SPARQL",
-                        required=True,
-                    ),
-                    PromptArgument(
-                        name="repository_id",
-                        description="Repository to query (optional, uses default)",
-                        required=False,
-                    ),
-                ],
-            ),
-            Prompt(
-                name="explain_ontology",
-                description=(
-                    "Explain the structure and meaning of an ontology or schema. "
-                    "Describes classes, properties, and their relationships."
-                ),
-                arguments=[
-                    PromptArgument(
-                        name="repository_id",
-                        description="Repository containing the ontology (optional)",
-                        required=False,
-                    ),
-                    PromptArgument(
-                        name="focus_class",
-                        description="Specific class IRI to explain (optional)",
-                        required=False,
-                    ),
-                ],
-            ),
-        ]
+        return list(_PROMPTS)
 
     @server.get_prompt()
     async def get_prompt(name: str, arguments: dict[str, str] | None) -> GetPromptResult:
@@ -104,66 +231,28 @@ async def _get_explore_prompt(
     focus_area = arguments.get("focus_area")
 
     # Get schema summary
-    summary = await backend.get_schema_summary(repo_id)
-    stats = summary["statistics"]
-    namespaces = summary["namespaces"]
-    classes = summary["classes"][:15]
-    properties = summary["properties"][:15]
+    summary = await backend.get_schema_summary(repo_id, classes_limit=15, properties_limit=15)
+    stats = summary.statistics
+    namespaces = summary.namespaces
+    classes = summary.classes
+    properties = summary.properties
 
     # Format schema context
-    ns_text = "\n".join([f"  - {ns['prefix']}: <{ns['namespace']}>" for ns in namespaces[:10]])
-    classes_text = "\n".join(
-        [
-            f"  - {c.get('class', {}).get('value', 'Unknown')}"
-            + (f" ({c.get('label', {}).get('value', '')})" if c.get("label") else "")
-            for c in classes
-        ]
-    )
-    props_text = "\n".join(
-        [
-            f"  - {p.get('property', {}).get('value', 'Unknown')}"
-            + (f" ({p.get('label', {}).get('value', '')})" if p.get("label") else "")
-            for p in properties
-        ]
-    )
+    ns_text = _namespace_lines(namespaces, 10)
+    classes_text = _term_lines(classes, "class", (("label", " ({})"),))
+    props_text = _term_lines(properties, "property", (("label", " ({})"),))
 
     focus_text = ""
     if focus_area:
         focus_text = f"\nThe user wants to focus on: {focus_area}\n"
 
-    prompt_text = f"""You are helping explore a knowledge graph. Here is the current schema context:
-
-## Statistics
-- Total statements: {stats["total_statements"]}
-- Total classes: {stats["total_classes"]}
-- Total properties: {stats["total_properties"]}
-
-## Namespaces
-{ns_text}
-
-## Main Classes
-{classes_text}
-
-## Main Properties
-{props_text}
-{focus_text}
-## Available Tools
-You can use these tools to explore:
-- `sparql_select` - Query for specific data
-- `sparql_construct` - Get RDF subgraphs
-- `describe_resource` - Get all info about a specific IRI
-- `search_classes` - Find classes by pattern
-- `search_properties` - Find properties by pattern
-- `find_instances` - Find instances of a class
-- `get_schema_summary` - Get ontology overview
-
-## Exploration Suggestions
-1. Start by understanding the main classes and their relationships
-2. Use `describe_resource` to explore specific instances
-3. Look for patterns in how classes are connected via properties
-4. Check for hierarchies using rdfs:subClassOf relationships
-
-What would you like to explore?"""
+    prompt_text = _EXPLORE_TEMPLATE.format(
+        stats=stats,
+        ns_text=ns_text,
+        classes_text=classes_text,
+        props_text=props_text,
+        focus_text=focus_text,
+    )
 
     return GetPromptResult(
         description="Knowledge graph exploration context",
@@ -185,61 +274,33 @@ async def _get_sparql_prompt(
     repo_id = arguments.get("repository_id")
 
     # Get schema context
-    summary = await backend.get_schema_summary(repo_id)
-    namespaces = summary["namespaces"]
-    classes = summary["classes"][:20]
-    properties = summary["properties"][:20]
+    summary = await backend.get_schema_summary(repo_id, classes_limit=20, properties_limit=20)
+    namespaces = summary.namespaces
+    classes = summary.classes
+    properties = summary.properties
 
     # Format prefixes
-    prefixes = "\n".join(
-        [f"PREFIX {ns['prefix']}: <{ns['namespace']}>" for ns in namespaces if ns["prefix"]][:15]
+    # Stop at the 15th prefixed namespace instead of formatting all of them
+    prefixed = islice((ns for ns in namespaces if ns.prefix), 15)
+    prefixes = "\n".join([f"PREFIX {ns.prefix}: <{ns.namespace}>" for ns in prefixed])
+
+    # Format classes and properties as IRIs annotated with their labels
+    classes_text = _term_lines(classes, "class", (("label", " # {}"),), line="  - <{}>", default="")
+    props_text = _term_lines(
+        properties,
+        "property",
+        (("label", " # {}"), ("domain", " domain: {}"), ("range", " range: {}")),
+        line="  - <{}>",
+        default="",
     )
 
-    # Format classes
-    classes_text = "\n".join(
-        [
-            f"  - <{c.get('class', {}).get('value', '')}>"
-            + (f" # {c.get('label', {}).get('value', '')}" if c.get("label") else "")
-            for c in classes
-        ]
+    prompt_text = _SPARQL_TEMPLATE.format(
+        question=question,
+        prefixes=prefixes,
+        classes_text=classes_text,
+        props_text=props_text,
     )
 
-    # Format properties
-    props_text = "\n".join(
-        [
-            f"  - <{p.get('property', {}).get('value', '')}>"
-            + (f" # {p.get('label', {}).get('value', '')}" if p.get("label") else "")
-            + (f" domain: {p.get('domain', {}).get('value', '')}" if p.get("domain") else "")
-            + (f" range: {p.get('range', {}).get('value', '')}" if p.get("range") else "")
-            for p in properties
-        ]
-    )
-
-    prompt_text = f"""Help me write a SPARQL query to answer this question:
-
-"{question}"
-
-## Available Prefixes
-```sparql
-{prefixes}
-```
-
-## Available Classes
-{classes_text}
-
-## Available Properties
-{props_text}
-
-## Guidelines
-1. Use the prefixes above when possible
-2. Use OPTIONAL for non-required fields
-3. Add FILTER for text searches or constraints
-4. Use LIMIT to avoid overwhelming results
-5. Consider using ORDER BY for sorted results
-
-Please write a SPARQL SELECT query that answers the question.
-Explain your reasoning and any assumptions made."""
-
     return GetPromptResult(
         description="SPARQL query writing assistance",
         messages=[
@@ -251,6 +312,32 @@ Explain your reasoning and any assumptions made."""
     )
 
 
+async def _focus_class_text(backend: Backend, focus_class: str, repo_id: str | None) -> str:
+    """Describe the properties related to the focus class of the explain_ontology prompt."""
+    class_query = f"""
+    SELECT ?property ?range ?label
+    WHERE {{
+        {{ ?property rdfs:domain <{focus_class}> . OPTIONAL {{ ?property rdfs:range ?range }} }}
+        UNION
+        {{ <{focus_class}> ?property ?range }}
+        OPTIONAL {{ ?property rdfs:label ?label }}
+    }}
+    LIMIT 50
+    """
+    try:
+        class_result = await backend.sparql_select(class_query, repo_id)
+    except Exception:
+        return f"\n## Focus Class: {focus_class}\n"
+    if not class_result.bindings:
+        return ""
+    props = _term_lines(class_result.bindings[:20], "property")
+    return f"""
+## Focus Class: {focus_class}
+Properties related to this class:
+{props}
+"""
+
+
 async def _get_explain_prompt(
     backend: Backend,
     arguments: dict[str, str],
@@ -259,83 +346,34 @@ async def _get_explain_prompt(
     repo_id = arguments.get("repository_id")
     focus_class = arguments.get("focus_class")
 
-    # Get schema summary
-    summary = await backend.get_schema_summary(repo_id)
-    stats = summary["statistics"]
-    namespaces = summary["namespaces"]
-    classes = summary["classes"]
-    properties = summary["properties"]
+    summary_task = backend.get_schema_summary(repo_id, classes_limit=25, properties_limit=25)
 
-    focus_text = ""
+    # The focus query doesn't depend on the summary, so both run concurrently
     if focus_class:
-        # Get detailed info about the focus class
-        class_query = f"""
-        SELECT ?property ?range ?label
-        WHERE {{
-            {{ ?property rdfs:domain <{focus_class}> . OPTIONAL {{ ?property rdfs:range ?range }} }}
-            UNION
-            {{ <{focus_class}> ?property ?range }}
-            OPTIONAL {{ ?property rdfs:label ?label }}
-        }}
-        LIMIT 50
-        """
-        try:
-            class_result = await backend.sparql_select(class_query, repo_id)
-            if class_result.bindings:
-                props = "\n".join(
-                    [
-                        f"  - {b.get('property', {}).get('value', 'Unknown')}"
-                        for b in class_result.bindings[:20]
-                    ]
-                )
-                focus_text = f"""
-## Focus Class: {focus_class}
-Properties related to this class:
-{props}
-"""
-        except Exception:
-            focus_text = f"\n## Focus Class: {focus_class}\n"
+        summary, focus_text = await asyncio.gather(
+            summary_task, _focus_class_text(backend, focus_class, repo_id)
+        )
+    else:
+        summary, focus_text = await summary_task, ""
+    stats = summary.statistics
+    namespaces = summary.namespaces
+    classes = summary.classes
+    properties = summary.properties
 
     # Format overall summary
-    ns_text = "\n".join([f"  - {ns['prefix']}: <{ns['namespace']}>" for ns in namespaces[:10]])
-    classes_text = "\n".join(
-        [
-            f"  - {c.get('class', {}).get('value', 'Unknown')}"
-            + (f": {c.get('comment', {}).get('value', '')[:100]}" if c.get("comment") else "")
-            for c in classes[:25]
-        ]
+    ns_text = _namespace_lines(namespaces, 10)
+    classes_text = _term_lines(classes, "class", (("comment", ": {:.100}"),))
+    props_text = _term_lines(
+        properties, "property", (("domain", " (domain: {})"), ("range", " -> {}"))
     )
-    props_text = "\n".join(
-        [
-            f"  - {p.get('property', {}).get('value', 'Unknown')}"
-            + (f" (domain: {p.get('domain', {}).get('value', 'Any')})" if p.get("domain") else "")
-            + (f" -> {p.get('range', {}).get('value', 'Any')}" if p.get("range") else "")
-            for p in properties[:25]
-        ]
-    )
-
-    prompt_text = f"""Please explain this ontology/schema:
 
-## Overview
-- Total statements: {stats["total_statements"]}
-- Total classes: {stats["total_classes"]}
-- Total properties: {stats["total_properties"]}
-
-## Namespaces Used
-{ns_text}
-
-## Classes
-{classes_text}
-
-## Properties
-{props_text}
-{focus_text}
-Please provide:
-1. A high-level summary of what this ontology represents
-2. The main concepts (classes) and how they relate
-3. Key properties and what they connect
-4. Any patterns or design choices you notice
-5. Suggestions for how to query this data effectively"""
+    prompt_text = _EXPLAIN_TEMPLATE.format(
+        stats=stats,
+        ns_text=ns_text,
+        classes_text=classes_text,
+        props_text=props_text,
+        focus_text=focus_text,
+    )
 
     return GetPromptResult(
         description="Ontology explanation",
@@ -1,13 +1,67 @@
 """MCP Resources for RDF4J."""
 
-import json
-from typing import Any
-
+import asyncio
+import re
+import time
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
+from typing import Any, TypeVar
+
+import orjson
 from mcp.server import Server
+from mcp.server.lowlevel.helper_types import ReadResourceContents
 from mcp.types import Resource, TextResourceContents
 from pydantic import AnyUrl
 
-from ..backends.base import Backend
+from ..backends.base import Backend, NamespaceInfo, SchemaSummary, StatisticsInfo
+from ..util import binding_value
+
+T = TypeVar("T")
+
+# Last serialization of each repository resource, keyed by (content builder, repository)
+Serialized = dict[tuple[Callable[..., Any], str], tuple[Any, str]]
+
+# The repository list changes rarely, while clients re-list resources often
+_REPOSITORY_LIST_TTL = 30.0
+
+# rdf4j://repository/{repo_id}/{resource_type}
+_REPOSITORY_RESOURCE_RE = re.compile(r"rdf4j://repository/(?P<repo>[^/]+)/(?P<kind>[^/]+)")
+
+_REPOSITORIES_RESOURCE = Resource(
+    uri=AnyUrl("rdf4j://repositories"),
+    name="Repository List",
+    description="List of all available RDF repositories",
+    mimeType="application/json",
+)
+
+
+@lru_cache(maxsize=256)
+def _repository_resources(repo_id: str, title: str) -> tuple[Resource, ...]:
+    """Build the schema, namespaces and statistics resources for one repository.
+
+    Resources are immutable, so each repository's set is validated once and
+    shared by every later listing.
+    """
+    return (
+        Resource(
+            uri=AnyUrl(f"rdf4j://repository/{repo_id}/schema"),
+            name=f"{title} - Schema",
+            description=f"Schema summary for repository '{repo_id}'",
+            mimeType="application/json",
+        ),
+        Resource(
+            uri=AnyUrl(f"rdf4j://repository/{repo_id}/namespaces"),
+            name=f"{title} - Namespaces",
+            description=f"Namespace prefixes for repository '{repo_id}'",
+            mimeType="application/json",
+        ),
+        Resource(
+            uri=AnyUrl(f"rdf4j://repository/{repo_id}/statistics"),
+            name=f"{title} - Statistics",
+            description=f"Statistics for repository '{repo_id}'",
+            mimeType="application/json",
+        ),
+    )
 
 
 def register_resources(server: Server, get_backend: Any) -> None:
@@ -17,63 +71,54 @@ def register_resources(server: Server, get_backend: Any) -> None:
         server: The MCP server instance
         get_backend: Callable that returns the backend instance
     """
+    # Last built resource list, reused for _REPOSITORY_LIST_TTL seconds
+    lock = asyncio.Lock()
+    cached_backend: Backend | None = None
+    cached_at = 0.0
+    cached_resources: list[Resource] = []
+    serialized: Serialized = {}
 
     @server.list_resources()
     async def list_resources() -> list[Resource]:
         """List available resources."""
+        nonlocal cached_backend, cached_at, cached_resources
         backend: Backend = get_backend()
-        resources = [
-            Resource(
-                uri=AnyUrl("rdf4j://repositories"),
-                name="Repository List",
-                description="List of all available RDF repositories",
-                mimeType="application/json",
-            ),
-        ]
-
-        # Add repository-specific resources
-        try:
-            repos = await backend.list_repositories()
+
+        async with lock:
+            if backend is cached_backend and time.monotonic() - cached_at < _REPOSITORY_LIST_TTL:
+                return cached_resources
+
+            try:
+                repos = await backend.list_repositories()
+            except Exception:
+                # If we can't list repositories, just return base resources
+                return [_REPOSITORIES_RESOURCE]
+
+            resources = [_REPOSITORIES_RESOURCE]
             for repo in repos:
-                resources.extend(
-                    [
-                        Resource(
-                            uri=AnyUrl(f"rdf4j://repository/{repo.id}/schema"),
-                            name=f"{repo.title} - Schema",
-                            description=f"Schema summary for repository '{repo.id}'",
-                            mimeType="application/json",
-                        ),
-                        Resource(
-                            uri=AnyUrl(f"rdf4j://repository/{repo.id}/namespaces"),
-                            name=f"{repo.title} - Namespaces",
-                            description=f"Namespace prefixes for repository '{repo.id}'",
-                            mimeType="application/json",
-                        ),
-                        Resource(
-                            uri=AnyUrl(f"rdf4j://repository/{repo.id}/statistics"),
-                            name=f"{repo.title} - Statistics",
-                            description=f"Statistics for repository '{repo.id}'",
-                            mimeType="application/json",
-                        ),
-                    ]
-                )
-        except Exception:
-            # If we can't list repositories, just return base resources
-            pass
-
-        return resources
+                resources.extend(_repository_resources(repo.id, repo.title))
+
+            cached_backend, cached_at, cached_resources = backend, time.monotonic(), resources
+            return resources
 
     @server.read_resource()
-    async def read_resource(uri: str) -> TextResourceContents:
+    async def read_resource(uri: AnyUrl) -> list[ReadResourceContents]:
         """Read a resource by URI."""
         backend: Backend = get_backend()
+        uri_text = str(uri)
 
-        if uri == "rdf4j://repositories":
-            return await _read_repositories(backend)
-        elif uri.startswith("rdf4j://repository/"):
-            return await _read_repository_resource(backend, uri)
+        if uri_text == "rdf4j://repositories":
+            contents = await _read_repositories(backend)
         else:
-            raise ValueError(f"Unknown resource URI: {uri}")
+            match = _REPOSITORY_RESOURCE_RE.fullmatch(uri_text)
+            if match is None:
+                raise ValueError(f"Unknown resource URI: {uri_text}")
+            reader = _REPOSITORY_READERS.get(match["kind"])
+            if reader is None:
+                raise ValueError(f"Unknown resource type: {match['kind']}")
+            contents = await reader(backend, match["repo"], uri_text, serialized)
+
+        return [ReadResourceContents(content=contents.text, mime_type=contents.mimeType)]
 
 
 async def _read_repositories(backend: Backend) -> TextResourceContents:
@@ -83,118 +128,137 @@ async def _read_repositories(backend: Backend) -> TextResourceContents:
     content = {
         "type": "repositories",
         "count": len(repos),
-        "repositories": [
-            {
-                "id": repo.id,
-                "title": repo.title,
-                "uri": repo.uri,
-                "readable": repo.readable,
-                "writable": repo.writable,
-            }
-            for repo in repos
-        ],
+        "repositories": repos,
     }
 
     return TextResourceContents(
         uri=AnyUrl("rdf4j://repositories"),
         mimeType="application/json",
-        text=json.dumps(content, indent=2),
+        text=orjson.dumps(content).decode(),
     )
 
 
-async def _read_repository_resource(backend: Backend, uri: str) -> TextResourceContents:
-    """Read a repository-specific resource."""
-    # Parse URI: rdf4j://repository/{repo_id}/{resource_type}
-    parts = uri.replace("rdf4j://repository/", "").split("/")
-    if len(parts) != 2:
-        raise ValueError(f"Invalid repository resource URI: {uri}")
+def _optional_value(binding: dict[str, Any], key: str) -> str | None:
+    """Return a variable's value with a single lookup, or None when it is unbound."""
+    term = binding.get(key)
+    return term["value"] if term else None
+
 
-    repo_id, resource_type = parts
+def _json_text(
+    serialized: Serialized, build: Callable[[str, T], dict[str, Any]], repo_id: str, source: T
+) -> str:
+    """Serialize ``build(repo_id, source)``, reusing the text while ``source`` is unchanged.
 
-    if resource_type == "schema":
-        return await _read_schema(backend, repo_id, uri)
-    elif resource_type == "namespaces":
-        return await _read_namespaces(backend, repo_id, uri)
-    elif resource_type == "statistics":
-        return await _read_statistics(backend, repo_id, uri)
-    else:
-        raise ValueError(f"Unknown resource type: {resource_type}")
+    The backend hands out the same cached object until its TTL or the
+    repository version invalidates it, so an identity check is enough to
+    know the previous serialization is still current.
+    """
+    key = (build, repo_id)
+    cached = serialized.get(key)
+    if cached is not None and cached[0] is source:
+        return cached[1]
 
+    text = orjson.dumps(build(repo_id, source)).decode()
+    serialized[key] = (source, text)
+    return text
 
-async def _read_schema(backend: Backend, repo_id: str, uri: str) -> TextResourceContents:
-    """Read schema summary resource."""
-    summary = await backend.get_schema_summary(repo_id)
 
-    content = {
+def _schema_content(repo_id: str, summary: SchemaSummary) -> dict[str, Any]:
+    """Build the schema summary resource content."""
+    return {
         "type": "schema_summary",
         "repository_id": repo_id,
-        "statistics": summary["statistics"],
-        "namespaces": summary["namespaces"],
+        "statistics": summary.statistics,
+        "namespaces": summary.namespaces,
         "classes": [
             {
-                "iri": c.get("class", {}).get("value", ""),
-                "label": c.get("label", {}).get("value", "") if "label" in c else None,
+                "iri": binding_value(c, "class"),
+                "label": _optional_value(c, "label"),
             }
-            for c in summary["classes"][:50]
+            for c in summary.classes
         ],
         "properties": [
             {
-                "iri": p.get("property", {}).get("value", ""),
-                "label": p.get("label", {}).get("value", "") if "label" in p else None,
-                "domain": p.get("domain", {}).get("value", "") if "domain" in p else None,
-                "range": p.get("range", {}).get("value", "") if "range" in p else None,
+                "iri": binding_value(p, "property"),
+                "label": _optional_value(p, "label"),
+                "domain": _optional_value(p, "domain"),
+                "range": _optional_value(p, "range"),
             }
-            for p in summary["properties"][:50]
+            for p in summary.properties
         ],
     }
 
+
+def _namespaces_content(repo_id: str, namespaces: list[NamespaceInfo]) -> dict[str, Any]:
+    """Build the namespaces resource content."""
+    return {
+        "type": "namespaces",
+        "repository_id": repo_id,
+        "count": len(namespaces),
+        "namespaces": namespaces,
+        "sparql_prefixes": "\n".join(
+            [f"PREFIX {ns.prefix}: <{ns.namespace}>" for ns in namespaces if ns.prefix]
+        ),
+    }
+
+
+def _statistics_content(repo_id: str, stats: StatisticsInfo) -> dict[str, Any]:
+    """Build the statistics resource content."""
+    return {
+        "type": "statistics",
+        "repository_id": repo_id,
+        "total_statements": stats.total_statements,
+        "total_classes": stats.total_classes,
+        "total_properties": stats.total_properties,
+        "total_subjects": stats.total_subjects,
+        "total_objects": stats.total_objects,
+    }
+
+
+async def _read_schema(
+    backend: Backend, repo_id: str, uri: str, serialized: Serialized
+) -> TextResourceContents:
+    """Read schema summary resource."""
+    summary = await backend.get_schema_summary(repo_id)
+
     return TextResourceContents(
         uri=AnyUrl(uri),
         mimeType="application/json",
-        text=json.dumps(content, indent=2),
+        text=_json_text(serialized, _schema_content, repo_id, summary),
     )
 
 
-async def _read_namespaces(backend: Backend, repo_id: str, uri: str) -> TextResourceContents:
+async def _read_namespaces(
+    backend: Backend, repo_id: str, uri: str, serialized: Serialized
+) -> TextResourceContents:
     """Read namespaces resource."""
     namespaces = await backend.get_namespaces(repo_id)
 
-    sparql_prefixes = []
-    for ns in namespaces:
-        if ns.prefix:
-            sparql_prefixes.append(f"PREFIX {ns.prefix}: <{ns.namespace}>")
-
-    content = {
-        "type": "namespaces",
-        "repository_id": repo_id,
-        "count": len(namespaces),
-        "namespaces": [{"prefix": ns.prefix, "namespace": ns.namespace} for ns in namespaces],
-        "sparql_prefixes": "\n".join(sparql_prefixes),
-    }
-
     return TextResourceContents(
         uri=AnyUrl(uri),
         mimeType="application/json",
-        text=json.dumps(content, indent=2),
+        text=_json_text(serialized, _namespaces_content, repo_id, namespaces),
     )
 
 
-async def _read_statistics(backend: Backend, repo_id: str, uri: str) -> TextResourceContents:
+async def _read_statistics(
+    backend: Backend, repo_id: str, uri: str, serialized: Serialized
+) -> TextResourceContents:
     """Read statistics resource."""
     stats = await backend.get_statistics(repo_id)
 
-    content = {
-        "type": "statistics",
-        "repository_id": repo_id,
-        "total_statements": stats.total_statements,
-        "total_classes": stats.total_classes,
-        "total_properties": stats.total_properties,
-        "total_subjects": stats.total_subjects,
-        "total_objects": stats.total_objects,
-    }
-
     return TextResourceContents(
         uri=AnyUrl(uri),
         mimeType="application/json",
-        text=json.dumps(content, indent=2),
+        text=_json_text(serialized, _statistics_content, repo_id, stats),
     )
+
+
+# Readers for each rdf4j://repository/{repo_id}/{resource_type} type
+_REPOSITORY_READERS: dict[
+    str, Callable[[Backend, str, str, Serialized], Awaitable[TextResourceContents]]
+] = {
+    "schema": _read_schema,
+    "namespaces": _read_namespaces,
+    "statistics": _read_statistics,
+}
@@ -2,18 +2,23 @@
 
 import argparse
 import asyncio
+import importlib.util
 import logging
 import sys
-from typing import Any
+from collections.abc import Awaitable, Callable, Iterable
+from functools import partial
+from importlib import import_module
+from typing import Any, Final, TypeVar
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import TextContent, Tool
 
-from .backends.base import Backend
-from .backends.local import LocalBackend
-from .backends.remote import RemoteBackend
+from .backends.base import Backend, NamespaceInfo, SchemaSummary, StatisticsInfo
 from .config import BackendType, Settings, configure, get_settings
+from .prompts import register_prompts
+from .resources import register_resources
+from .util import binding_value, has_limit, to_json
 
 # Configure logging
 logging.basicConfig(
@@ -22,6 +27,325 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# describe_resource queries; the same IRI always yields the same text, so
+# repeated describes hit the backend's query result cache
+_NEIGHBOURHOOD_QUERY: Final = (
+    "CONSTRUCT {{ <{iri}> ?p ?o . ?s ?p2 <{iri}> }} "
+    "WHERE {{ {{ <{iri}> ?p ?o }} UNION {{ ?s ?p2 <{iri}> }} }}"
+)
+_TYPES_QUERY: Final = "SELECT ?type WHERE {{ <{iri}> a ?type }}"
+
+
+def _records(
+    bindings: Iterable[dict[str, Any]], key: str, optional: tuple[str, ...] = ()
+) -> list[dict[str, str]]:
+    """Flatten search bindings into records with an ``iri`` and any bound optional values.
+
+    Args:
+        bindings: Result bindings to flatten
+        key: Variable holding the IRI each record is about
+        optional: Variables copied into the record only when they are bound
+    """
+    records = []
+    for binding in bindings:
+        record = {"iri": binding_value(binding, key)}
+        for name in optional:
+            term = binding.get(name)
+            if term:
+                record[name] = term["value"]
+        records.append(record)
+    return records
+
+
+def _schema_summary_output(summary: SchemaSummary) -> dict[str, Any]:
+    """Build the get_schema_summary tool output."""
+    return {
+        "type": "schema_summary",
+        # orjson serializes the dataclasses natively
+        "statistics": summary.statistics,
+        "namespaces": summary.namespaces,
+        "top_classes": _records(summary.classes, "class", ("label",)),
+        "top_properties": _records(summary.properties, "property", ("label",)),
+    }
+
+
+def _namespaces_output(namespaces: list[NamespaceInfo]) -> dict[str, Any]:
+    """Build the get_namespaces tool output."""
+    return {
+        "type": "namespaces",
+        "count": len(namespaces),
+        "namespaces": [{"prefix": ns.prefix, "namespace": ns.namespace} for ns in namespaces],
+        "sparql_prefixes": "\n".join(
+            [f"PREFIX {ns.prefix}: <{ns.namespace}>" for ns in namespaces if ns.prefix]
+        ),
+    }
+
+
+def _statistics_output(stats: StatisticsInfo) -> dict[str, Any]:
+    """Build the get_statistics tool output."""
+    return {
+        "type": "statistics",
+        "total_statements": stats.total_statements,
+        "total_classes": stats.total_classes,
+        "total_properties": stats.total_properties,
+        "total_subjects": stats.total_subjects,
+        "total_objects": stats.total_objects,
+    }
+
+
+ToolHandler = Callable[[Backend, dict[str, Any]], Awaitable[list[TextContent]]]
+
+
+# sparql_ask answers true, false or, without a boolean result, null; each is rendered once
+_ASK_OUTPUTS: Final = {
+    answer: to_json({"type": "ask", "result": answer}) for answer in (True, False, None)
+}
+
+# Schema properties shared by several tools
+_REPOSITORY_ID_PROPERTY: Final = {
+    "type": "string",
+    "description": "Repository ID (uses default if not specified)",
+}
+_LIMIT_PROPERTY: Final = {
+    "type": "integer",
+    "description": "Maximum number of results (default: 100)",
+    "default": 100,
+}
+
+# Tool definitions never change, so they are built once at import
+_TOOLS: Final[tuple[Tool, ...]] = (
+    # SPARQL Query Tools
+    Tool(
+        name="sparql_select",
+        description=(
+            "Execute a SPARQL SELECT query and return results as JSON. "
+            "Use this for queries that return tabular data with variable bindings."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "The SPARQL SELECT query to execute",
+                },
+                "repository_id": _REPOSITORY_ID_PROPERTY,
+                "limit": {
+                    "type": "integer",
+                    "description": "Max results (applied if query has no LIMIT)",
+                },
+            },
+            "required": ["query"],
+        },
+    ),
+    Tool(
+        name="sparql_construct",
+        description=(
+            "Execute a SPARQL CONSTRUCT or DESCRIBE query, return N-Triples. "
+            "Use this for queries that return RDF triples/graphs."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "The SPARQL CONSTRUCT or DESCRIBE query to execute",
+                },
+                "repository_id": _REPOSITORY_ID_PROPERTY,
+                "format": {
+                    "type": "string",
+                    "enum": ["turtle", "nt"],
+                    "description": (
+                        "Output format: 'nt' (N-Triples, default) or 'turtle' "
+                        "(prefixed and grouped by subject)"
+                    ),
+                    "default": "nt",
+                },
+            },
+            "required": ["query"],
+        },
+    ),
+    Tool(
+        name="sparql_ask",
+        description=(
+            "Execute a SPARQL ASK query and return a boolean result. "
+            "Use this for yes/no questions about the data."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "The SPARQL ASK query to execute",
+                },
+                "repository_id": _REPOSITORY_ID_PROPERTY,
+            },
+            "required": ["query"],
+        },
+    ),
+    # Exploration Tools
+    Tool(
+        name="describe_resource",
+        description=(
+            "Get all triples about a resource (subject or object). "
+            "Returns N-Triples with a human-readable summary."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "iri": {
+                    "type": "string",
+                    "description": "The IRI of the resource to describe",
+                },
+                "repository_id": _REPOSITORY_ID_PROPERTY,
+                "include_incoming": {
+                    "type": "boolean",
+                    "description": "Include triples where resource is object",
+                    "default": True,
+                },
+            },
+            "required": ["iri"],
+        },
+    ),
+    Tool(
+        name="search_classes",
+        description=(
+            "Find classes in the ontology. Can filter by name pattern. "
+            "Returns class IRIs with labels and comments."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pattern": {
+                    "type": "string",
+                    "description": "Regex pattern to filter class names (optional)",
+                },
+                "limit": _LIMIT_PROPERTY,
+                "repository_id": _REPOSITORY_ID_PROPERTY,
+            },
+        },
+    ),
+    Tool(
+        name="search_properties",
+        description=(
+            "Find properties in the ontology. Can filter by pattern, domain, or range. "
+            "Returns property IRIs with labels, domains, and ranges."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pattern": {
+                    "type": "string",
+                    "description": "Regex pattern to filter property names (optional)",
+                },
+                "domain": {
+                    "type": "string",
+                    "description": "Filter by domain class IRI (optional)",
+                },
+                "range": {
+                    "type": "string",
+                    "description": "Filter by range class IRI (optional)",
+                },
+                "limit": _LIMIT_PROPERTY,
+                "repository_id": _REPOSITORY_ID_PROPERTY,
+            },
+        },
+    ),
+    Tool(
+        name="find_instances",
+        description=("Find instances of a class. Returns instance IRIs with labels."),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "class_iri": {
+                    "type": "string",
+                    "description": "The IRI of the class to find instances of",
+                },
+                "limit": _LIMIT_PROPERTY,
+                "repository_id": _REPOSITORY_ID_PROPERTY,
+            },
+            "required": ["class_iri"],
+        },
+    ),
+    Tool(
+        name="get_schema_summary",
+        description=(
+            "Get an overview of the ontology schema including statistics, "
+            "main classes, properties, and namespaces."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "repository_id": _REPOSITORY_ID_PROPERTY,
+            },
+        },
+    ),
+    # Metadata Tools
+    Tool(
+        name="list_repositories",
+        description=(
+            "List all available RDF repositories. "
+            "Returns repository IDs, titles, and access permissions."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+    Tool(
+        name="get_namespaces",
+        description=(
+            "Get namespace prefix mappings for a repository. "
+            "Returns prefix-namespace pairs for use in SPARQL queries."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "repository_id": _REPOSITORY_ID_PROPERTY,
+            },
+        },
+    ),
+    Tool(
+        name="get_statistics",
+        description=(
+            "Get statistics about a repository including triple counts, "
+            "class counts, property counts, and more."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "repository_id": _REPOSITORY_ID_PROPERTY,
+            },
+        },
+    ),
+    Tool(
+        name="select_repository",
+        description=(
+            "Select a repository to use as the default for subsequent operations. "
+            "This persists until another repository is selected."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "repository_id": {
+                    "type": "string",
+                    "description": "Repository ID to select",
+                },
+            },
+            "required": ["repository_id"],
+        },
+    ),
+    Tool(
+        name="get_current_repository",
+        description="Get the currently selected default repository ID.",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+)
+
 
 class RDF4JMCPServer:
     """MCP Server for RDF4J knowledge graph operations."""
@@ -36,6 +360,11 @@ class RDF4JMCPServer:
             configure(settings)
         self._settings = get_settings()
         self._backend: Backend | None = None
+        # Bounds concurrent tool calls so a client fanning out requests queues
+        # here rather than exhausting the backend's connection pool
+        self._backend_calls = asyncio.Semaphore(self._settings.max_concurrent_backend_calls)
+        # Last rendering of each schema tool's output, see _render()
+        self._rendered: dict[Callable[..., Any], tuple[Any, str]] = {}
         self._server = Server(self._settings.server_name)
         self._setup_handlers()
 
@@ -45,13 +374,9 @@ class RDF4JMCPServer:
         self._register_tools()
 
         # Register resources
-        from .resources import register_resources
-
         register_resources(self._server, self._get_backend)
 
         # Register prompts
-        from .prompts import register_prompts
-
         register_prompts(self._server, self._get_backend)
 
     def _register_tools(self) -> None:
@@ -60,393 +385,58 @@ class RDF4JMCPServer:
         @self._server.list_tools()
         async def list_tools() -> list[Tool]:
             """List all available tools."""
-            return [
-                # SPARQL Query Tools
-                Tool(
-                    name="sparql_select",
-                    description=(
-                        "Execute a SPARQL SELECT query and return results as JSON. "
-                        "Use this for queries that return tabular data with variable bindings."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "query": {
-                                "type": "string",
-                                "description": "The SPARQL SELECT query to execute",
-                            },
-                            "repository_id": {
-                                "type": "string",
-                                "description": "Repository ID (uses default if not specified)",
-                            },
-                            "limit": {
-                                "type": "integer",
-                                "description": "Max results (applied if query has no LIMIT)",
-                            },
-                        },
-                        "required": ["query"],
-                    },
-                ),
-                Tool(
-                    name="sparql_construct",
-                    description=(
-                        "Execute a SPARQL CONSTRUCT or DESCRIBE query, return Turtle."
-                        "Use this for queries that return RDF triples/graphs."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "query": {
-                                "type": "string",
-                                "description": "The SPARQL CONSTRUCT or DESCRIBE query to execute",
-                            },
-                            "repository_id": {
-                                "type": "string",
-                                "description": "Repository ID (uses default if not specified)",
-                            },
-                        },
-                        "required": ["query"],
-                    },
-                ),
-                Tool(
-                    name="sparql_ask",
-                    description=(
-                        "Execute a SPARQL ASK query and return a boolean result. "
-                        "Use this for yes/no questions about the data."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "query": {
-                                "type": "string",
-                                "description": "The SPARQL ASK query to execute",
-                            },
-                            "repository_id": {
-                                "type": "string",
-                                "description": "Repository ID (uses default if not specified)",
-                            },
-                        },
-                        "required": ["query"],
-                    },
-                ),
-                # Exploration Tools
-                Tool(
-                    name="describe_resource",
-                    description=(
-                        "Get all triples about a resource (subject or object). "
-                        "Returns Turtle format with human-readable summary."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "iri": {
-                                "type": "string",
-                                "description": "The IRI of the resource to describe",
-                            },
-                            "repository_id": {
-                                "type": "string",
-                                "description": "Repository ID (optional)",
-                            },
-                            "include_incoming": {
-                                "type": "boolean",
-                                "description": "Include triples where resource is object",
-                                "default": True,
-                            },
-                        },
-                        "required": ["iri"],
-                    },
-                ),
-                Tool(
-                    name="search_classes",
-                    description=(
-                        "Find classes in the ontology. Can filter by name pattern. "
-                        "Returns class IRIs with labels and comments."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "pattern": {
-                                "type": "string",
-                                "description": "Regex pattern to filter class names (optional)",
-                            },
-                            "limit": {
-                                "type": "integer",
-                                "description": "Maximum number of results (default: 100)",
-                                "default": 100,
-                            },
-                            "repository_id": {
-                                "type": "string",
-                                "description": "Repository ID (optional)",
-                            },
-                        },
-                    },
-                ),
-                Tool(
-                    name="search_properties",
-                    description=(
-                        "Find properties in the ontology. Can filter by pattern, domain, or range. "
-                        "Returns property IRIs with labels, domains, and ranges."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "pattern": {
-                                "type": "string",
-                                "description": "Regex pattern to filter property names (optional)",
-                            },
-                            "domain": {
-                                "type": "string",
-                                "description": "Filter by domain class IRI (optional)",
-                            },
-                            "range": {
-                                "type": "string",
-                                "description": "Filter by range class IRI (optional)",
-                            },
-                            "limit": {
-                                "type": "integer",
-                                "description": "Maximum number of results (default: 100)",
-                                "default": 100,
-                            },
-                            "repository_id": {
-                                "type": "string",
-                                "description": "Repository ID (optional)",
-                            },
-                        },
-                    },
-                ),
-                Tool(
-                    name="find_instances",
-                    description=("Find instances of a class. Returns instance IRIs with labels."),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "class_iri": {
-                                "type": "string",
-                                "description": "The IRI of the class to find instances of",
-                            },
-                            "limit": {
-                                "type": "integer",
-                                "description": "Maximum number of results (default: 100)",
-                                "default": 100,
-                            },
-                            "repository_id": {
-                                "type": "string",
-                                "description": "Repository ID (optional)",
-                            },
-                        },
-                        "required": ["class_iri"],
-                    },
-                ),
-                Tool(
-                    name="get_schema_summary",
-                    description=(
-                        "Get an overview of the ontology schema including statistics, "
-                        "main classes, properties, and namespaces."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "repository_id": {
-                                "type": "string",
-                                "description": "Repository ID (optional)",
-                            },
-                        },
-                    },
-                ),
-                # Metadata Tools
-                Tool(
-                    name="list_repositories",
-                    description=(
-                        "List all available RDF repositories. "
-                        "Returns repository IDs, titles, and access permissions."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                    },
-                ),
-                Tool(
-                    name="get_namespaces",
-                    description=(
-                        "Get namespace prefix mappings for a repository. "
-                        "Returns prefix-namespace pairs for use in SPARQL queries."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "repository_id": {
-                                "type": "string",
-                                "description": "Repository ID (uses default if not specified)",
-                            },
-                        },
-                    },
-                ),
-                Tool(
-                    name="get_statistics",
-                    description=(
-                        "Get statistics about a repository including triple counts, "
-                        "class counts, property counts, and more."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "repository_id": {
-                                "type": "string",
-                                "description": "Repository ID (uses default if not specified)",
-                            },
-                        },
-                    },
-                ),
-                Tool(
-                    name="select_repository",
-                    description=(
-                        "Select a repository to use as the default for subsequent operations. "
-                        "This persists until another repository is selected."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "repository_id": {
-                                "type": "string",
-                                "description": "Repository ID to select",
-                            },
-                        },
-                        "required": ["repository_id"],
-                    },
-                ),
-                Tool(
-                    name="get_current_repository",
-                    description="Get the currently selected default repository ID.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                    },
-                ),
-            ]
-
-        @self._server.call_tool()
-        async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
-            """Handle tool calls."""
-            import json
-
-            backend = self._get_backend()
-            settings = self._settings
+            return list(_TOOLS)
 
+        # One hash lookup per call instead of walking a chain of name comparisons
+        handlers: dict[str, ToolHandler] = {
             # SPARQL Query Tools
-            if name == "sparql_select":
-                return await self._handle_sparql_select(backend, arguments, settings)
-            elif name == "sparql_construct":
-                return await self._handle_sparql_construct(backend, arguments)
-            elif name == "sparql_ask":
-                return await self._handle_sparql_ask(backend, arguments)
-
+            "sparql_select": partial(self._handle_sparql_select, settings=self._settings),
+            "sparql_construct": self._handle_sparql_construct,
+            "sparql_ask": self._handle_sparql_ask,
             # Exploration Tools
-            elif name == "describe_resource":
-                return await self._handle_describe_resource(backend, arguments)
-            elif name == "search_classes":
-                return await self._handle_search_classes(backend, arguments)
-            elif name == "search_properties":
-                return await self._handle_search_properties(backend, arguments)
-            elif name == "find_instances":
-                return await self._handle_find_instances(backend, arguments)
-            elif name == "get_schema_summary":
-                return await self._handle_get_schema_summary(backend, arguments)
-
+            "describe_resource": self._handle_describe_resource,
+            "search_classes": self._handle_search_classes,
+            "search_properties": self._handle_search_properties,
+            "find_instances": self._handle_find_instances,
+            "get_schema_summary": self._handle_get_schema_summary,
             # Metadata Tools
-            elif name == "list_repositories":
-                repos = await backend.list_repositories()
-                output = {
-                    "type": "repositories",
-                    "count": len(repos),
-                    "repositories": [
-                        {
-                            "id": r.id,
-                            "title": r.title,
-                            "uri": r.uri,
-                            "readable": r.readable,
-                            "writable": r.writable,
-                        }
-                        for r in repos
-                    ],
-                }
-                return [TextContent(type="text", text=json.dumps(output, indent=2))]
-
-            elif name == "get_namespaces":
-                repo_id = arguments.get("repository_id")
-                namespaces = await backend.get_namespaces(repo_id)
-                sparql_prefixes = "\n".join(
-                    [f"PREFIX {ns.prefix}: <{ns.namespace}>" for ns in namespaces if ns.prefix]
-                )
-                output = {
-                    "type": "namespaces",
-                    "count": len(namespaces),
-                    "namespaces": [
-                        {"prefix": ns.prefix, "namespace": ns.namespace} for ns in namespaces
-                    ],
-                    "sparql_prefixes": sparql_prefixes,
-                }
-                return [TextContent(type="text", text=json.dumps(output, indent=2))]
-
-            elif name == "get_statistics":
-                repo_id = arguments.get("repository_id")
-                stats = await backend.get_statistics(repo_id)
-                output = {
-                    "type": "statistics",
-                    "total_statements": stats.total_statements,
-                    "total_classes": stats.total_classes,
-                    "total_properties": stats.total_properties,
-                    "total_subjects": stats.total_subjects,
-                    "total_objects": stats.total_objects,
-                }
-                return [TextContent(type="text", text=json.dumps(output, indent=2))]
-
-            elif name == "select_repository":
-                repo_id = arguments["repository_id"]
-                await backend.select_repository(repo_id)
-                output = {
-                    "type": "repository_selected",
-                    "repository_id": repo_id,
-                    "message": f"Repository '{repo_id}' is now the default.",
-                }
-                return [TextContent(type="text", text=json.dumps(output, indent=2))]
-
-            elif name == "get_current_repository":
-                current = await backend.get_current_repository()
-                output = {
-                    "type": "current_repository",
-                    "repository_id": current,
-                    "message": f"Current repository: {current}"
-                    if current
-                    else "No repository selected",
-                }
-                return [TextContent(type="text", text=json.dumps(output, indent=2))]
+            "list_repositories": self._handle_list_repositories,
+            "get_namespaces": self._handle_get_namespaces,
+            "get_statistics": self._handle_get_statistics,
+            "select_repository": self._handle_select_repository,
+            "get_current_repository": self._handle_get_current_repository,
+        }
 
-            else:
+        @self._server.call_tool()
+        async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+            """Handle tool calls."""
+            handler = handlers.get(name)
+            if handler is None:
                 raise ValueError(f"Unknown tool: {name}")
+            async with self._backend_calls:
+                return await handler(self._get_backend(), arguments)
 
     async def _handle_sparql_select(
         self, backend: Backend, arguments: dict[str, Any], settings: Settings
     ) -> list[TextContent]:
         """Handle sparql_select tool."""
-        import json
-
         query = arguments["query"]
         repo_id = arguments.get("repository_id")
         limit = arguments.get("limit")
 
-        query_upper = query.upper()
-        if "LIMIT" not in query_upper:
+        if not has_limit(query):
             effective_limit = min(limit or settings.default_limit, settings.max_limit)
             query = f"{query}\nLIMIT {effective_limit}"
 
-        result = await backend.sparql_select(query, repo_id)
+        result = await backend.cached_query("select", query, repo_id)
+        bindings = result.bindings or []
         output = {
             "type": "select",
             "variables": result.variables or [],
-            "bindings": result.bindings or [],
-            "count": len(result.bindings or []),
+            "bindings": bindings,
+            "count": len(bindings),
         }
-        return [TextContent(type="text", text=json.dumps(output, indent=2))]
+        return [TextContent(type="text", text=to_json(output))]
 
     async def _handle_sparql_construct(
         self, backend: Backend, arguments: dict[str, Any]
@@ -454,21 +444,22 @@ class RDF4JMCPServer:
         """Handle sparql_construct tool."""
         query = arguments["query"]
         repo_id = arguments.get("repository_id")
-        result = await backend.sparql_construct(query, repo_id)
-        output = f"# SPARQL CONSTRUCT/DESCRIBE Result\n# Format: Turtle\n\n{result.triples or ''}"
+        format = arguments.get("format", "nt")
+        result = await backend.cached_query("construct", query, repo_id, format)
+        format_name = "N-Triples" if format == "nt" else "Turtle"
+        output = (
+            f"# SPARQL CONSTRUCT/DESCRIBE Result\n# Format: {format_name}\n\n{result.triples or ''}"
+        )
         return [TextContent(type="text", text=output)]
 
     async def _handle_sparql_ask(
         self, backend: Backend, arguments: dict[str, Any]
     ) -> list[TextContent]:
         """Handle sparql_ask tool."""
-        import json
-
         query = arguments["query"]
         repo_id = arguments.get("repository_id")
-        result = await backend.sparql_ask(query, repo_id)
-        output = {"type": "ask", "result": result.boolean}
-        return [TextContent(type="text", text=json.dumps(output, indent=2))]
+        result = await backend.cached_query("ask", query, repo_id)
+        return [TextContent(type="text", text=_ASK_OUTPUTS[result.boolean])]
 
     async def _handle_describe_resource(
         self, backend: Backend, arguments: dict[str, Any]
@@ -478,142 +469,187 @@ class RDF4JMCPServer:
         repo_id = arguments.get("repository_id")
         include_incoming = arguments.get("include_incoming", True)
 
-        result = await backend.describe_resource(iri, repo_id)
-        turtle = result.triples or ""
+        # Outgoing and incoming triples come back from one CONSTRUCT, so a
+        # describe costs the types lookup plus a single round-trip
+        if include_incoming:
+            neighbourhood_query = _NEIGHBOURHOOD_QUERY.format(iri=iri)
+            triples_lookup = backend.cached_query("construct", neighbourhood_query, repo_id)
+        else:
+            triples_lookup = backend.describe_resource(iri, repo_id)
+        result, summary_result = await asyncio.gather(
+            triples_lookup,
+            backend.cached_query("select", _TYPES_QUERY.format(iri=iri), repo_id),
+        )
+        triples = result.triples or ""
 
         incoming_text = ""
         if include_incoming:
-            incoming_query = f"CONSTRUCT {{ ?s ?p <{iri}> }} WHERE {{ ?s ?p <{iri}> }}"
-            incoming_result = await backend.sparql_construct(incoming_query, repo_id)
-            if incoming_result.triples:
-                incoming_text = f"\n# Incoming triples:\n{incoming_result.triples}"
+            # N-Triples is line based: classify each line by its subject and object
+            # position, so a self-loop shows up in both sections
+            subject = f"<{iri}> "
+            obj = f" <{iri}> ."
+            outgoing: list[str] = []
+            incoming: list[str] = []
+            for line in triples.splitlines():
+                if line.startswith(subject):
+                    outgoing.append(line)
+                if line.endswith(obj):
+                    incoming.append(line)
+            triples = "".join(f"{line}\n" for line in outgoing)
+            if incoming:
+                incoming_text = "\n# Incoming triples:\n" + "".join(
+                    f"{line}\n" for line in incoming
+                )
 
-        summary_query = f"""
-        SELECT ?type WHERE {{ <{iri}> a ?type }}
-        """
-        summary_result = await backend.sparql_select(summary_query, repo_id)
-        types = [b.get("type", {}).get("value", "") for b in (summary_result.bindings or [])]
-
-        summary_lines = [
-            "# Resource Summary",
-            f"# IRI: {iri}",
-            f"# Types: {', '.join(types) if types else 'Unknown'}",
-        ]
-        output = "\n".join(summary_lines) + f"\n\n{turtle}{incoming_text}"
+        types = [binding_value(b, "type") for b in summary_result]
+
+        # One f-string, so the possibly large triple text is copied only once
+        output = (
+            "# Resource Summary\n"
+            f"# IRI: {iri}\n"
+            f"# Types: {', '.join(types) if types else 'Unknown'}\n"
+            f"\n{triples}{incoming_text}"
+        )
         return [TextContent(type="text", text=output)]
 
     async def _handle_search_classes(
         self, backend: Backend, arguments: dict[str, Any]
     ) -> list[TextContent]:
         """Handle search_classes tool."""
-        import json
-
         pattern = arguments.get("pattern")
         limit = arguments.get("limit", 100)
         repo_id = arguments.get("repository_id")
 
-        result = await backend.search_classes(pattern, limit, repo_id)
-        classes = [
-            {
-                "iri": b.get("class", {}).get("value", ""),
-                **({"label": b["label"].get("value", "")} if "label" in b else {}),
-                **({"comment": b["comment"].get("value", "")} if "comment" in b else {}),
-            }
-            for b in (result.bindings or [])
-        ]
+        result = await backend.search_classes(pattern, limit, repo_id, sort=True)
+        classes = _records(result, "class", ("label", "comment"))
         output = {
             "type": "classes",
             "pattern": pattern,
             "count": len(classes),
             "classes": classes,
         }
-        return [TextContent(type="text", text=json.dumps(output, indent=2))]
+        return [TextContent(type="text", text=to_json(output))]
 
     async def _handle_search_properties(
         self, backend: Backend, arguments: dict[str, Any]
     ) -> list[TextContent]:
         """Handle search_properties tool."""
-        import json
-
         pattern = arguments.get("pattern")
         domain = arguments.get("domain")
         range_ = arguments.get("range")
         limit = arguments.get("limit", 100)
         repo_id = arguments.get("repository_id")
 
-        result = await backend.search_properties(pattern, domain, range_, limit, repo_id)
-        properties = [
-            {
-                "iri": b.get("property", {}).get("value", ""),
-                **({"label": b["label"].get("value", "")} if "label" in b else {}),
-                **({"domain": b["domain"].get("value", "")} if "domain" in b else {}),
-                **({"range": b["range"].get("value", "")} if "range" in b else {}),
-            }
-            for b in (result.bindings or [])
-        ]
+        result = await backend.search_properties(pattern, domain, range_, limit, repo_id, sort=True)
+        properties = _records(result, "property", ("label", "domain", "range"))
         output = {
             "type": "properties",
             "pattern": pattern,
             "count": len(properties),
             "properties": properties,
         }
-        return [TextContent(type="text", text=json.dumps(output, indent=2))]
+        return [TextContent(type="text", text=to_json(output))]
 
     async def _handle_find_instances(
         self, backend: Backend, arguments: dict[str, Any]
     ) -> list[TextContent]:
         """Handle find_instances tool."""
-        import json
-
         class_iri = arguments["class_iri"]
         limit = arguments.get("limit", 100)
         repo_id = arguments.get("repository_id")
 
         result = await backend.find_instances(class_iri, limit, repo_id)
-        instances = [
-            {
-                "iri": b.get("instance", {}).get("value", ""),
-                **({"label": b["label"].get("value", "")} if "label" in b else {}),
-            }
-            for b in (result.bindings or [])
-        ]
+        instances = _records(result, "instance", ("label",))
         output = {
             "type": "instances",
             "class": class_iri,
             "count": len(instances),
             "instances": instances,
         }
-        return [TextContent(type="text", text=json.dumps(output, indent=2))]
+        return [TextContent(type="text", text=to_json(output))]
 
     async def _handle_get_schema_summary(
         self, backend: Backend, arguments: dict[str, Any]
     ) -> list[TextContent]:
         """Handle get_schema_summary tool."""
-        import json
-
         repo_id = arguments.get("repository_id")
-        summary = await backend.get_schema_summary(repo_id)
+        summary = await backend.get_schema_summary(repo_id, classes_limit=20, properties_limit=20)
+        return [TextContent(type="text", text=self._render(_schema_summary_output, summary))]
 
+    async def _handle_list_repositories(
+        self, backend: Backend, arguments: dict[str, Any]
+    ) -> list[TextContent]:
+        """Handle list_repositories tool."""
+        repos = await backend.list_repositories()
         output = {
-            "type": "schema_summary",
-            "statistics": summary["statistics"],
-            "namespaces": summary["namespaces"],
-            "top_classes": [
+            "type": "repositories",
+            "count": len(repos),
+            "repositories": [
                 {
-                    "iri": c.get("class", {}).get("value", ""),
-                    **({"label": c["label"].get("value", "")} if "label" in c else {}),
+                    "id": r.id,
+                    "title": r.title,
+                    "uri": r.uri,
+                    "readable": r.readable,
+                    "writable": r.writable,
                 }
-                for c in summary["classes"][:20]
-            ],
-            "top_properties": [
-                {
-                    "iri": p.get("property", {}).get("value", ""),
-                    **({"label": p["label"].get("value", "")} if "label" in p else {}),
-                }
-                for p in summary["properties"][:20]
+                for r in repos
             ],
         }
-        return [TextContent(type="text", text=json.dumps(output, indent=2))]
+        return [TextContent(type="text", text=to_json(output))]
+
+    async def _handle_get_namespaces(
+        self, backend: Backend, arguments: dict[str, Any]
+    ) -> list[TextContent]:
+        """Handle get_namespaces tool."""
+        namespaces = await backend.get_namespaces(arguments.get("repository_id"))
+        return [TextContent(type="text", text=self._render(_namespaces_output, namespaces))]
+
+    async def _handle_get_statistics(
+        self, backend: Backend, arguments: dict[str, Any]
+    ) -> list[TextContent]:
+        """Handle get_statistics tool."""
+        stats = await backend.get_statistics(arguments.get("repository_id"))
+        return [TextContent(type="text", text=self._render(_statistics_output, stats))]
+
+    def _render(self, build: Callable[[T], dict[str, Any]], source: T) -> str:
+        """Serialize ``build(source)``, reusing the text while ``source`` is unchanged.
+
+        Schema lookups come from the backend's per-repository cache, which hands
+        out the same object until it is invalidated, so an identity check tells
+        whether the previous rendering is still current.
+        """
+        cached = self._rendered.get(build)
+        if cached is not None and cached[0] is source:
+            return cached[1]
+
+        text = to_json(build(source))
+        self._rendered[build] = (source, text)
+        return text
+
+    async def _handle_select_repository(
+        self, backend: Backend, arguments: dict[str, Any]
+    ) -> list[TextContent]:
+        """Handle select_repository tool."""
+        repo_id = arguments["repository_id"]
+        await backend.select_repository(repo_id)
+        output = {
+            "type": "repository_selected",
+            "repository_id": repo_id,
+            "message": f"Repository '{repo_id}' is now the default.",
+        }
+        return [TextContent(type="text", text=to_json(output))]
+
+    async def _handle_get_current_repository(
+        self, backend: Backend, arguments: dict[str, Any]
+    ) -> list[TextContent]:
+        """Handle get_current_repository tool."""
+        current = await backend.get_current_repository()
+        output = {
+            "type": "current_repository",
+            "repository_id": current,
+            "message": f"Current repository: {current}" if current else "No repository selected",
+        }
+        return [TextContent(type="text", text=to_json(output))]
 
     def _get_backend(self) -> Backend:
         """Get the backend instance, creating if needed."""
@@ -625,15 +661,35 @@ class RDF4JMCPServer:
         """Create and connect to the backend."""
         settings = self._settings
 
+        # Import only the backend in use; the others' dependencies are never loaded
+        backend: Backend
         if settings.backend_type == BackendType.LOCAL:
+            from .backends.local import LocalBackend
+
             backend = LocalBackend(
                 store_path=settings.local_store_path,
                 store_format=settings.local_store_format,
+                cache_ttl=settings.cache_ttl,
+                query_cache_size=settings.query_cache_size,
+            )
+        elif settings.backend_type == BackendType.OXIGRAPH:
+            from .backends.oxigraph import OxigraphBackend
+
+            backend = OxigraphBackend(
+                store_path=settings.local_store_path,
+                store_format=settings.local_store_format,
+                cache_ttl=settings.cache_ttl,
+                query_cache_size=settings.query_cache_size,
             )
         else:
+            from .backends.remote import RemoteBackend
+
             backend = RemoteBackend(
                 server_url=settings.rdf4j_server_url,
                 default_repository=settings.default_repository,
+                timeout=settings.query_timeout,
+                cache_ttl=settings.cache_ttl,
+                query_cache_size=settings.query_cache_size,
             )
 
         await backend.connect()
@@ -684,7 +740,7 @@ def main() -> None:
     )
     parser.add_argument(
         "--backend",
-        choices=["local", "remote"],
+        choices=["local", "oxigraph", "remote"],
         default="local",
         help="Backend type (default: local)",
     )
@@ -727,8 +783,12 @@ def main() -> None:
 
     server = create_server(settings)
 
+    # uvloop's libuv event loop speeds up the stdio transport; it is an
+    # optional extra (pip install "rdf4j-mcp[uvloop]") and unavailable on Windows
+    run = import_module("uvloop").run if importlib.util.find_spec("uvloop") else asyncio.run
+
     try:
-        asyncio.run(server.run_stdio())
+        run(server.run_stdio())
     except KeyboardInterrupt:
         logger.info("Server interrupted")
         sys.exit(0)
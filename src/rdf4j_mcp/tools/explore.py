@@ -1,12 +1,153 @@
 """Knowledge graph exploration tools for MCP."""
 
-import json
-from typing import Any
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict
+from functools import partial
+from typing import Any, Final
 
 from mcp.server import Server
 from mcp.types import TextContent, Tool
 
 from ..backends.base import Backend
+from ..util import binding_value, to_json
+
+# Classes and properties listed by get_schema_summary
+_TOP_LIMIT: Final = 20
+
+# describe_resource queries; the same IRI always yields the same text, so
+# repeated describes hit the backend's query result cache
+_INCOMING_QUERY: Final = "CONSTRUCT {{ ?s ?p <{iri}> }} WHERE {{ ?s ?p <{iri}> }}"
+_SUMMARY_QUERY: Final = (
+    "SELECT ?type (COUNT(?p) AS ?propCount) "
+    "WHERE {{ <{iri}> a ?type . OPTIONAL {{ <{iri}> ?p ?o }} }} GROUP BY ?type"
+)
+
+_EXPLORE_TOOLS: Final[tuple[Tool, ...]] = (
+    Tool(
+        name="describe_resource",
+        description=(
+            "Get all triples about a resource (subject or object). "
+            "Returns N-Triples with a human-readable summary."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "iri": {
+                    "type": "string",
+                    "description": "The IRI of the resource to describe",
+                },
+                "repository_id": {
+                    "type": "string",
+                    "description": "Repository ID (optional)",
+                },
+                "include_incoming": {
+                    "type": "boolean",
+                    "description": "Include triples where resource is object",
+                    "default": True,
+                },
+            },
+            "required": ["iri"],
+        },
+    ),
+    Tool(
+        name="search_classes",
+        description=(
+            "Find classes in the ontology. Can filter by name pattern. "
+            "Returns class IRIs with labels and comments."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pattern": {
+                    "type": "string",
+                    "description": "Regex pattern to filter class names (optional)",
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of results (default: 100)",
+                    "default": 100,
+                },
+                "repository_id": {
+                    "type": "string",
+                    "description": "Repository ID (optional)",
+                },
+            },
+        },
+    ),
+    Tool(
+        name="search_properties",
+        description=(
+            "Find properties in the ontology. Can filter by pattern, domain, or range. "
+            "Returns property IRIs with labels, domains, and ranges."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pattern": {
+                    "type": "string",
+                    "description": "Regex pattern to filter property names (optional)",
+                },
+                "domain": {
+                    "type": "string",
+                    "description": "Filter by domain class IRI (optional)",
+                },
+                "range": {
+                    "type": "string",
+                    "description": "Filter by range class IRI (optional)",
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of results (default: 100)",
+                    "default": 100,
+                },
+                "repository_id": {
+                    "type": "string",
+                    "description": "Repository ID (optional)",
+                },
+            },
+        },
+    ),
+    Tool(
+        name="find_instances",
+        description=("Find instances of a class. Returns instance IRIs with labels."),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "class_iri": {
+                    "type": "string",
+                    "description": "The IRI of the class to find instances of",
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of results (default: 100)",
+                    "default": 100,
+                },
+                "repository_id": {
+                    "type": "string",
+                    "description": "Repository ID (optional)",
+                },
+            },
+            "required": ["class_iri"],
+        },
+    ),
+    Tool(
+        name="get_schema_summary",
+        description=(
+            "Get an overview of the ontology schema including statistics, "
+            "main classes, properties, and namespaces."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "repository_id": {
+                    "type": "string",
+                    "description": "Repository ID (optional)",
+                },
+            },
+        },
+    ),
+)
 
 
 def register_explore_tools(server: Server, get_backend: Any) -> None:
@@ -16,153 +157,23 @@ def register_explore_tools(server: Server, get_backend: Any) -> None:
         server: The MCP server instance
         get_backend: Callable that returns the backend instance
     """
+    server.list_tools()(_list_explore_tools)
+    server.call_tool()(partial(_handle_explore_tool, get_backend))
+
+
+async def _list_explore_tools() -> list[Tool]:
+    """List available exploration tools."""
+    return list(_EXPLORE_TOOLS)
 
-    @server.list_tools()
-    async def list_explore_tools() -> list[Tool]:
-        """List available exploration tools."""
-        return [
-            Tool(
-                name="describe_resource",
-                description=(
-                    "Get all triples about a resource (subject or object). "
-                    "Returns Turtle format with human-readable summary."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "iri": {
-                            "type": "string",
-                            "description": "The IRI of the resource to describe",
-                        },
-                        "repository_id": {
-                            "type": "string",
-                            "description": "Repository ID (optional)",
-                        },
-                        "include_incoming": {
-                            "type": "boolean",
-                            "description": "Include triples where resource is object",
-                            "default": True,
-                        },
-                    },
-                    "required": ["iri"],
-                },
-            ),
-            Tool(
-                name="search_classes",
-                description=(
-                    "Find classes in the ontology. Can filter by name pattern. "
-                    "Returns class IRIs with labels and comments."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "pattern": {
-                            "type": "string",
-                            "description": "Regex pattern to filter class names (optional)",
-                        },
-                        "limit": {
-                            "type": "integer",
-                            "description": "Maximum number of results (default: 100)",
-                            "default": 100,
-                        },
-                        "repository_id": {
-                            "type": "string",
-                            "description": "Repository ID (optional)",
-                        },
-                    },
-                },
-            ),
-            Tool(
-                name="search_properties",
-                description=(
-                    "Find properties in the ontology. Can filter by pattern, domain, or range. "
-                    "Returns property IRIs with labels, domains, and ranges."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "pattern": {
-                            "type": "string",
-                            "description": "Regex pattern to filter property names (optional)",
-                        },
-                        "domain": {
-                            "type": "string",
-                            "description": "Filter by domain class IRI (optional)",
-                        },
-                        "range": {
-                            "type": "string",
-                            "description": "Filter by range class IRI (optional)",
-                        },
-                        "limit": {
-                            "type": "integer",
-                            "description": "Maximum number of results (default: 100)",
-                            "default": 100,
-                        },
-                        "repository_id": {
-                            "type": "string",
-                            "description": "Repository ID (optional)",
-                        },
-                    },
-                },
-            ),
-            Tool(
-                name="find_instances",
-                description=("Find instances of a class. Returns instance IRIs with labels."),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "class_iri": {
-                            "type": "string",
-                            "description": "The IRI of the class to find instances of",
-                        },
-                        "limit": {
-                            "type": "integer",
-                            "description": "Maximum number of results (default: 100)",
-                            "default": 100,
-                        },
-                        "repository_id": {
-                            "type": "string",
-                            "description": "Repository ID (optional)",
-                        },
-                    },
-                    "required": ["class_iri"],
-                },
-            ),
-            Tool(
-                name="get_schema_summary",
-                description=(
-                    "Get an overview of the ontology schema including statistics, "
-                    "main classes, properties, and namespaces."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "repository_id": {
-                            "type": "string",
-                            "description": "Repository ID (optional)",
-                        },
-                    },
-                },
-            ),
-        ]
-
-    @server.call_tool()
-    async def handle_explore_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
-        """Handle exploration tool calls."""
-        backend: Backend = get_backend()
-
-        if name == "describe_resource":
-            return await _handle_describe_resource(backend, arguments)
-        elif name == "search_classes":
-            return await _handle_search_classes(backend, arguments)
-        elif name == "search_properties":
-            return await _handle_search_properties(backend, arguments)
-        elif name == "find_instances":
-            return await _handle_find_instances(backend, arguments)
-        elif name == "get_schema_summary":
-            return await _handle_get_schema_summary(backend, arguments)
-        else:
-            raise ValueError(f"Unknown tool: {name}")
+
+async def _handle_explore_tool(
+    get_backend: Any, name: str, arguments: dict[str, Any]
+) -> list[TextContent]:
+    """Handle exploration tool calls."""
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        raise ValueError(f"Unknown tool: {name}")
+    return await handler(get_backend(), arguments)
 
 
 async def _handle_describe_resource(
@@ -174,39 +185,29 @@ async def _handle_describe_resource(
     repository_id: str | None = arguments.get("repository_id")
     include_incoming = arguments.get("include_incoming", True)
 
-    # Get outgoing triples (resource as subject)
-    result = await backend.describe_resource(iri, repository_id)
-    turtle = result.triples or ""
+    # Outgoing triples (resource as subject), the summary and, if requested,
+    # incoming triples are independent, so fetch them concurrently
+    lookups = [
+        backend.describe_resource(iri, repository_id),
+        backend.cached_query("select", _SUMMARY_QUERY.format(iri=iri), repository_id),
+    ]
+    if include_incoming:
+        incoming_query = _INCOMING_QUERY.format(iri=iri)
+        lookups.append(backend.cached_query("construct", incoming_query, repository_id))
+    result, summary_result, *incoming = await asyncio.gather(*lookups)
+    triples = result.triples or ""
 
-    # Get incoming triples if requested
     incoming_text = ""
-    if include_incoming:
-        incoming_query = f"""
-        CONSTRUCT {{ ?s ?p <{iri}> }}
-        WHERE {{ ?s ?p <{iri}> }}
-        """
-        incoming_result = await backend.sparql_construct(incoming_query, repository_id)
-        if incoming_result.triples:
-            incoming_text = f"\n# Incoming triples (resource as object):\n{incoming_result.triples}"
-
-    # Create summary
-    summary_query = f"""
-    SELECT ?type (COUNT(?p) as ?propCount)
-    WHERE {{
-        <{iri}> a ?type .
-        OPTIONAL {{ <{iri}> ?p ?o }}
-    }}
-    GROUP BY ?type
-    """
-    summary_result = await backend.sparql_select(summary_query, repository_id)
+    if incoming and incoming[0].triples:
+        incoming_text = f"\n# Incoming triples (resource as object):\n{incoming[0].triples}"
 
-    summary_lines = ["# Resource Summary"]
-    summary_lines.append(f"# IRI: {iri}")
+    types_line = ""
     if summary_result.bindings:
-        types = [b.get("type", {}).get("value", "Unknown") for b in summary_result.bindings]
-        summary_lines.append(f"# Types: {', '.join(types)}")
+        types = [binding_value(b, "type", "Unknown") for b in summary_result.bindings]
+        types_line = f"# Types: {', '.join(types)}\n"
 
-    output = "\n".join(summary_lines) + f"\n\n{turtle}{incoming_text}"
+    # One f-string, so the possibly large triple text is copied only once
+    output = f"# Resource Summary\n# IRI: {iri}\n{types_line}\n{triples}{incoming_text}"
 
     return [TextContent(type="text", text=output)]
 
@@ -222,14 +223,15 @@ async def _handle_search_classes(
 
     result = await backend.search_classes(pattern, limit, repository_id)
 
+    classes = _format_class_results(result.bindings or [])
     output = {
         "type": "classes",
         "pattern": pattern,
-        "count": len(result.bindings or []),
-        "classes": _format_class_results(result.bindings or []),
+        "count": len(classes),
+        "classes": classes,
     }
 
-    return [TextContent(type="text", text=json.dumps(output, indent=2))]
+    return [TextContent(type="text", text=to_json(output))]
 
 
 async def _handle_search_properties(
@@ -245,16 +247,17 @@ async def _handle_search_properties(
 
     result = await backend.search_properties(pattern, domain, range_, limit, repository_id)
 
+    properties = _format_property_results(result.bindings or [])
     output = {
         "type": "properties",
         "pattern": pattern,
         "domain_filter": domain,
         "range_filter": range_,
-        "count": len(result.bindings or []),
-        "properties": _format_property_results(result.bindings or []),
+        "count": len(properties),
+        "properties": properties,
     }
 
-    return [TextContent(type="text", text=json.dumps(output, indent=2))]
+    return [TextContent(type="text", text=to_json(output))]
 
 
 async def _handle_find_instances(
@@ -268,14 +271,15 @@ async def _handle_find_instances(
 
     result = await backend.find_instances(class_iri, limit, repository_id)
 
+    instances = _format_instance_results(result.bindings or [])
     output = {
         "type": "instances",
         "class": class_iri,
-        "count": len(result.bindings or []),
-        "instances": _format_instance_results(result.bindings or []),
+        "count": len(instances),
+        "instances": instances,
     }
 
-    return [TextContent(type="text", text=json.dumps(output, indent=2))]
+    return [TextContent(type="text", text=to_json(output))]
 
 
 async def _handle_get_schema_summary(
@@ -285,31 +289,34 @@ async def _handle_get_schema_summary(
     """Handle get_schema_summary tool call."""
     repository_id: str | None = arguments.get("repository_id")
 
-    summary = await backend.get_schema_summary(repository_id)
+    # The backend limits its class and property queries, so nothing is sliced here
+    summary = await backend.get_schema_summary(
+        repository_id, classes_limit=_TOP_LIMIT, properties_limit=_TOP_LIMIT
+    )
 
     # Format for output
     output = {
         "type": "schema_summary",
-        "statistics": summary["statistics"],
-        "namespaces": summary["namespaces"],
-        "top_classes": _format_class_results(summary["classes"][:20]),
-        "top_properties": _format_property_results(summary["properties"][:20]),
+        "statistics": asdict(summary.statistics),
+        "namespaces": [asdict(ns) for ns in summary.namespaces],
+        "top_classes": _format_class_results(summary.classes),
+        "top_properties": _format_property_results(summary.properties),
     }
 
-    return [TextContent(type="text", text=json.dumps(output, indent=2))]
+    return [TextContent(type="text", text=to_json(output))]
 
 
 def _format_class_results(bindings: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Format class query results."""
     classes = []
     for b in bindings:
-        cls = {
-            "iri": b.get("class", {}).get("value", ""),
-        }
-        if "label" in b:
-            cls["label"] = b["label"].get("value", "")
-        if "comment" in b:
-            cls["comment"] = b["comment"].get("value", "")
+        cls = {"iri": binding_value(b, "class")}
+        label = b.get("label")
+        if label:
+            cls["label"] = label["value"]
+        comment = b.get("comment")
+        if comment:
+            cls["comment"] = comment["value"]
         classes.append(cls)
     return classes
 
@@ -318,15 +325,16 @@ def _format_property_results(bindings: list[dict[str, Any]]) -> list[dict[str, A
     """Format property query results."""
     properties = []
     for b in bindings:
-        prop = {
-            "iri": b.get("property", {}).get("value", ""),
-        }
-        if "label" in b:
-            prop["label"] = b["label"].get("value", "")
-        if "domain" in b:
-            prop["domain"] = b["domain"].get("value", "")
-        if "range" in b:
-            prop["range"] = b["range"].get("value", "")
+        prop = {"iri": binding_value(b, "property")}
+        label = b.get("label")
+        if label:
+            prop["label"] = label["value"]
+        domain = b.get("domain")
+        if domain:
+            prop["domain"] = domain["value"]
+        range_ = b.get("range")
+        if range_:
+            prop["range"] = range_["value"]
         properties.append(prop)
     return properties
 
@@ -335,10 +343,18 @@ def _format_instance_results(bindings: list[dict[str, Any]]) -> list[dict[str, A
     """Format instance query results."""
     instances = []
     for b in bindings:
-        inst = {
-            "iri": b.get("instance", {}).get("value", ""),
-        }
-        if "label" in b:
-            inst["label"] = b["label"].get("value", "")
+        inst = {"iri": binding_value(b, "instance")}
+        label = b.get("label")
+        if label:
+            inst["label"] = label["value"]
         instances.append(inst)
     return instances
+
+
+_HANDLERS: Final[dict[str, Callable[[Backend, dict[str, Any]], Awaitable[list[TextContent]]]]] = {
+    "describe_resource": _handle_describe_resource,
+    "search_classes": _handle_search_classes,
+    "search_properties": _handle_search_properties,
+    "find_instances": _handle_find_instances,
+    "get_schema_summary": _handle_get_schema_summary,
+}
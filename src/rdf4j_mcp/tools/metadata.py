@@ -1,12 +1,88 @@
 """Repository metadata tools for MCP."""
 
-import json
-from typing import Any
+from collections.abc import Awaitable, Callable
+from functools import partial
+from typing import Any, Final
 
 from mcp.server import Server
 from mcp.types import TextContent, Tool
 
 from ..backends.base import Backend
+from ..util import to_json
+
+ToolHandler = Callable[[Backend, dict[str, Any]], Awaitable[list[TextContent]]]
+
+
+_METADATA_TOOLS: Final[tuple[Tool, ...]] = (
+    Tool(
+        name="list_repositories",
+        description=(
+            "List all available RDF repositories. "
+            "Returns repository IDs, titles, and access permissions."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+    Tool(
+        name="get_namespaces",
+        description=(
+            "Get namespace prefix mappings for a repository. "
+            "Returns prefix-namespace pairs for use in SPARQL queries."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "repository_id": {
+                    "type": "string",
+                    "description": "Repository ID (uses default if not specified)",
+                },
+            },
+        },
+    ),
+    Tool(
+        name="get_statistics",
+        description=(
+            "Get statistics about a repository including triple counts, "
+            "class counts, property counts, and more."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "repository_id": {
+                    "type": "string",
+                    "description": "Repository ID (uses default if not specified)",
+                },
+            },
+        },
+    ),
+    Tool(
+        name="select_repository",
+        description=(
+            "Select a repository to use as the default for subsequent operations. "
+            "This persists until another repository is selected."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "repository_id": {
+                    "type": "string",
+                    "description": "Repository ID to select",
+                },
+            },
+            "required": ["repository_id"],
+        },
+    ),
+    Tool(
+        name="get_current_repository",
+        description=("Get the currently selected default repository ID."),
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+)
 
 
 def register_metadata_tools(server: Server, get_backend: Any) -> None:
@@ -16,101 +92,34 @@ def register_metadata_tools(server: Server, get_backend: Any) -> None:
         server: The MCP server instance
         get_backend: Callable that returns the backend instance
     """
+    # Each registration remembers the namespace list it last formatted
+    handlers: dict[str, ToolHandler] = {
+        **_HANDLERS,
+        "get_namespaces": partial(_handle_get_namespaces, last_prefixes=[]),
+    }
+    server.list_tools()(_list_metadata_tools)
+    server.call_tool()(partial(_handle_metadata_tool, get_backend, handlers))
 
-    @server.list_tools()
-    async def list_metadata_tools() -> list[Tool]:
-        """List available metadata tools."""
-        return [
-            Tool(
-                name="list_repositories",
-                description=(
-                    "List all available RDF repositories. "
-                    "Returns repository IDs, titles, and access permissions."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {},
-                },
-            ),
-            Tool(
-                name="get_namespaces",
-                description=(
-                    "Get namespace prefix mappings for a repository. "
-                    "Returns prefix-namespace pairs for use in SPARQL queries."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "repository_id": {
-                            "type": "string",
-                            "description": "Repository ID (uses default if not specified)",
-                        },
-                    },
-                },
-            ),
-            Tool(
-                name="get_statistics",
-                description=(
-                    "Get statistics about a repository including triple counts, "
-                    "class counts, property counts, and more."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "repository_id": {
-                            "type": "string",
-                            "description": "Repository ID (uses default if not specified)",
-                        },
-                    },
-                },
-            ),
-            Tool(
-                name="select_repository",
-                description=(
-                    "Select a repository to use as the default for subsequent operations. "
-                    "This persists until another repository is selected."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "repository_id": {
-                            "type": "string",
-                            "description": "Repository ID to select",
-                        },
-                    },
-                    "required": ["repository_id"],
-                },
-            ),
-            Tool(
-                name="get_current_repository",
-                description=("Get the currently selected default repository ID."),
-                inputSchema={
-                    "type": "object",
-                    "properties": {},
-                },
-            ),
-        ]
-
-    @server.call_tool()
-    async def handle_metadata_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
-        """Handle metadata tool calls."""
-        backend: Backend = get_backend()
-
-        if name == "list_repositories":
-            return await _handle_list_repositories(backend)
-        elif name == "get_namespaces":
-            return await _handle_get_namespaces(backend, arguments)
-        elif name == "get_statistics":
-            return await _handle_get_statistics(backend, arguments)
-        elif name == "select_repository":
-            return await _handle_select_repository(backend, arguments)
-        elif name == "get_current_repository":
-            return await _handle_get_current_repository(backend)
-        else:
-            raise ValueError(f"Unknown tool: {name}")
-
-
-async def _handle_list_repositories(backend: Backend) -> list[TextContent]:
+
+async def _list_metadata_tools() -> list[Tool]:
+    """List available metadata tools."""
+    return list(_METADATA_TOOLS)
+
+
+async def _handle_metadata_tool(
+    get_backend: Any, handlers: dict[str, ToolHandler], name: str, arguments: dict[str, Any]
+) -> list[TextContent]:
+    """Handle metadata tool calls."""
+    handler = handlers.get(name)
+    if handler is None:
+        raise ValueError(f"Unknown tool: {name}")
+    return await handler(get_backend(), arguments)
+
+
+async def _handle_list_repositories(
+    backend: Backend,
+    arguments: dict[str, Any],
+) -> list[TextContent]:
     """Handle list_repositories tool call."""
     repos = await backend.list_repositories()
 
@@ -129,12 +138,13 @@ async def _handle_list_repositories(backend: Backend) -> list[TextContent]:
         ],
     }
 
-    return [TextContent(type="text", text=json.dumps(output, indent=2))]
+    return [TextContent(type="text", text=to_json(output))]
 
 
 async def _handle_get_namespaces(
     backend: Backend,
     arguments: dict[str, Any],
+    last_prefixes: list[tuple[list[Any], str]],
 ) -> list[TextContent]:
     """Handle get_namespaces tool call."""
     repository_id: str | None = arguments.get("repository_id")
@@ -145,10 +155,10 @@ async def _handle_get_namespaces(
         "type": "namespaces",
         "count": len(namespaces),
         "namespaces": [{"prefix": ns.prefix, "namespace": ns.namespace} for ns in namespaces],
-        "sparql_prefixes": _format_sparql_prefixes(namespaces),
+        "sparql_prefixes": _format_sparql_prefixes(namespaces, last_prefixes),
     }
 
-    return [TextContent(type="text", text=json.dumps(output, indent=2))]
+    return [TextContent(type="text", text=to_json(output))]
 
 
 async def _handle_get_statistics(
@@ -169,7 +179,7 @@ async def _handle_get_statistics(
         "total_objects": stats.total_objects,
     }
 
-    return [TextContent(type="text", text=json.dumps(output, indent=2))]
+    return [TextContent(type="text", text=to_json(output))]
 
 
 async def _handle_select_repository(
@@ -187,10 +197,13 @@ async def _handle_select_repository(
         "message": f"Repository '{repository_id}' is now the default.",
     }
 
-    return [TextContent(type="text", text=json.dumps(output, indent=2))]
+    return [TextContent(type="text", text=to_json(output))]
 
 
-async def _handle_get_current_repository(backend: Backend) -> list[TextContent]:
+async def _handle_get_current_repository(
+    backend: Backend,
+    arguments: dict[str, Any],
+) -> list[TextContent]:
     """Handle get_current_repository tool call."""
     current = await backend.get_current_repository()
 
@@ -200,13 +213,34 @@ async def _handle_get_current_repository(backend: Backend) -> list[TextContent]:
         "message": f"Current repository: {current}" if current else "No repository selected",
     }
 
-    return [TextContent(type="text", text=json.dumps(output, indent=2))]
+    return [TextContent(type="text", text=to_json(output))]
+
+
+def _format_sparql_prefixes(
+    namespaces: list[Any], last_prefixes: list[tuple[list[Any], str]]
+) -> str:
+    """Format namespaces as SPARQL PREFIX declarations.
+
+    The backend hands out the same cached namespace list until its
+    repository changes or the cache expires, so the text formatted for the
+    previous list is reused while that list is still current.
+
+    Args:
+        namespaces: Namespaces returned by the backend
+        last_prefixes: Holds the last formatted list and its text, if any
+    """
+    if last_prefixes and last_prefixes[0][0] is namespaces:
+        return last_prefixes[0][1]
+
+    text = "\n".join([f"PREFIX {ns.prefix}: <{ns.namespace}>" for ns in namespaces if ns.prefix])
+    last_prefixes[:] = [(namespaces, text)]
+    return text
 
 
-def _format_sparql_prefixes(namespaces: list[Any]) -> str:
-    """Format namespaces as SPARQL PREFIX declarations."""
-    lines = []
-    for ns in namespaces:
-        if ns.prefix:
-            lines.append(f"PREFIX {ns.prefix}: <{ns.namespace}>")
-    return "\n".join(lines)
+# get_namespaces is added by register_metadata_tools, bound to its own memo
+_HANDLERS: Final[dict[str, ToolHandler]] = {
+    "list_repositories": _handle_list_repositories,
+    "get_statistics": _handle_get_statistics,
+    "select_repository": _handle_select_repository,
+    "get_current_repository": _handle_get_current_repository,
+}
@@ -1,13 +1,93 @@
 """SPARQL query tools for MCP."""
 
-import json
-from typing import Any
+from collections.abc import Awaitable, Callable
+from functools import partial
+from typing import Any, Final
 
 from mcp.server import Server
 from mcp.types import TextContent, Tool
 
 from ..backends.base import Backend
-from ..config import get_settings
+from ..config import Settings, get_settings
+from ..util import has_limit, to_json
+
+ToolHandler = Callable[[Backend, dict[str, Any]], Awaitable[list[TextContent]]]
+
+
+# sparql_ask answers true, false or, without a boolean result, null; each is rendered once
+_ASK_OUTPUTS: Final = {
+    answer: to_json({"type": "ask", "result": answer}) for answer in (True, False, None)
+}
+
+_QUERY_TOOLS: Final[tuple[Tool, ...]] = (
+    Tool(
+        name="sparql_select",
+        description=(
+            "Execute a SPARQL SELECT query and return results as JSON. "
+            "Use this for queries that return tabular data with variable bindings."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "The SPARQL SELECT query to execute",
+                },
+                "repository_id": {
+                    "type": "string",
+                    "description": "Repository ID (uses default if not specified)",
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Max results (applied if query has no LIMIT)",
+                },
+            },
+            "required": ["query"],
+        },
+    ),
+    Tool(
+        name="sparql_construct",
+        description=(
+            "Execute a SPARQL CONSTRUCT or DESCRIBE query, return N-Triples. "
+            "Use this for queries that return RDF triples/graphs."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "The SPARQL CONSTRUCT or DESCRIBE query to execute",
+                },
+                "repository_id": {
+                    "type": "string",
+                    "description": "Repository ID (uses default if not specified)",
+                },
+            },
+            "required": ["query"],
+        },
+    ),
+    Tool(
+        name="sparql_ask",
+        description=(
+            "Execute a SPARQL ASK query and return a boolean result. "
+            "Use this for yes/no questions about the data."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "The SPARQL ASK query to execute",
+                },
+                "repository_id": {
+                    "type": "string",
+                    "description": "Repository ID (uses default if not specified)",
+                },
+            },
+            "required": ["query"],
+        },
+    ),
+)
 
 
 def register_query_tools(server: Server, get_backend: Any) -> None:
@@ -17,100 +97,34 @@ def register_query_tools(server: Server, get_backend: Any) -> None:
         server: The MCP server instance
         get_backend: Callable that returns the backend instance
     """
+    # The settings are read once here instead of on every sparql_select call
+    handlers: dict[str, ToolHandler] = {
+        **_HANDLERS,
+        "sparql_select": partial(_handle_sparql_select, settings=get_settings()),
+    }
+    server.list_tools()(_list_query_tools)
+    server.call_tool()(partial(_handle_query_tool, get_backend, handlers))
 
-    @server.list_tools()
-    async def list_query_tools() -> list[Tool]:
-        """List available SPARQL query tools."""
-        return [
-            Tool(
-                name="sparql_select",
-                description=(
-                    "Execute a SPARQL SELECT query and return results as JSON. "
-                    "Use this for queries that return tabular data with variable bindings."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "The SPARQL SELECT query to execute",
-                        },
-                        "repository_id": {
-                            "type": "string",
-                            "description": "Repository ID (uses default if not specified)",
-                        },
-                        "limit": {
-                            "type": "integer",
-                            "description": "Max results (applied if query has no LIMIT)",
-                        },
-                    },
-                    "required": ["query"],
-                },
-            ),
-            Tool(
-                name="sparql_construct",
-                description=(
-                    "Execute a SPARQL CONSTRUCT or DESCRIBE query and return results as Turtle. "
-                    "Use this for queries that return RDF triples/graphs."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "The SPARQL CONSTRUCT or DESCRIBE query to execute",
-                        },
-                        "repository_id": {
-                            "type": "string",
-                            "description": "Repository ID (uses default if not specified)",
-                        },
-                    },
-                    "required": ["query"],
-                },
-            ),
-            Tool(
-                name="sparql_ask",
-                description=(
-                    "Execute a SPARQL ASK query and return a boolean result. "
-                    "Use this for yes/no questions about the data."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "The SPARQL ASK query to execute",
-                        },
-                        "repository_id": {
-                            "type": "string",
-                            "description": "Repository ID (uses default if not specified)",
-                        },
-                    },
-                    "required": ["query"],
-                },
-            ),
-        ]
 
-    @server.call_tool()
-    async def handle_query_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
-        """Handle SPARQL query tool calls."""
-        backend: Backend = get_backend()
-        settings = get_settings()
+async def _list_query_tools() -> list[Tool]:
+    """List available SPARQL query tools."""
+    return list(_QUERY_TOOLS)
 
-        if name == "sparql_select":
-            return await _handle_sparql_select(backend, arguments, settings)
-        elif name == "sparql_construct":
-            return await _handle_sparql_construct(backend, arguments)
-        elif name == "sparql_ask":
-            return await _handle_sparql_ask(backend, arguments)
-        else:
-            raise ValueError(f"Unknown tool: {name}")
+
+async def _handle_query_tool(
+    get_backend: Any, handlers: dict[str, ToolHandler], name: str, arguments: dict[str, Any]
+) -> list[TextContent]:
+    """Handle SPARQL query tool calls."""
+    handler = handlers.get(name)
+    if handler is None:
+        raise ValueError(f"Unknown tool: {name}")
+    return await handler(get_backend(), arguments)
 
 
 async def _handle_sparql_select(
     backend: Backend,
     arguments: dict[str, Any],
-    settings: Any,
+    settings: Settings,
 ) -> list[TextContent]:
     """Handle sparql_select tool call."""
     query = arguments["query"]
@@ -118,25 +132,25 @@ async def _handle_sparql_select(
     limit = arguments.get("limit")
 
     # Apply default limit if query doesn't have one
-    query_upper = query.upper()
-    if "LIMIT" not in query_upper:
+    if not has_limit(query):
         effective_limit = min(limit or settings.default_limit, settings.max_limit)
         query = f"{query}\nLIMIT {effective_limit}"
     elif limit:
         # Warn that limit parameter is ignored
         pass
 
-    result = await backend.sparql_select(query, repository_id)
+    result = await backend.cached_query("select", query, repository_id)
 
     # Format results
+    bindings = result.bindings or []
     output = {
         "type": "select",
         "variables": result.variables or [],
-        "bindings": result.bindings or [],
-        "count": len(result.bindings or []),
+        "bindings": bindings,
+        "count": len(bindings),
     }
 
-    return [TextContent(type="text", text=json.dumps(output, indent=2))]
+    return [TextContent(type="text", text=to_json(output))]
 
 
 async def _handle_sparql_construct(
@@ -147,10 +161,10 @@ async def _handle_sparql_construct(
     query = arguments["query"]
     repository_id: str | None = arguments.get("repository_id")
 
-    result = await backend.sparql_construct(query, repository_id)
+    result = await backend.cached_query("construct", query, repository_id)
 
-    # Return Turtle format
-    output = f"# SPARQL CONSTRUCT/DESCRIBE Result\n# Format: Turtle\n\n{result.triples or ''}"
+    # The backend serializes CONSTRUCT results as N-Triples by default
+    output = f"# SPARQL CONSTRUCT/DESCRIBE Result\n# Format: N-Triples\n\n{result.triples or ''}"
 
     return [TextContent(type="text", text=output)]
 
@@ -163,8 +177,13 @@ async def _handle_sparql_ask(
     query = arguments["query"]
     repository_id: str | None = arguments.get("repository_id")
 
-    result = await backend.sparql_ask(query, repository_id)
+    result = await backend.cached_query("ask", query, repository_id)
+
+    return [TextContent(type="text", text=_ASK_OUTPUTS[result.boolean])]
 
-    output = {"type": "ask", "result": result.boolean}
 
-    return [TextContent(type="text", text=json.dumps(output, indent=2))]
+# sparql_select is added by register_query_tools, bound to the settings
+_HANDLERS: Final[dict[str, ToolHandler]] = {
+    "sparql_construct": _handle_sparql_construct,
+    "sparql_ask": _handle_sparql_ask,
+}
@@ -0,0 +1,7 @@
+"""Utility helpers for RDF4J MCP Server."""
+
+from .iri import binding_value, local_name
+from .output import to_json
+from .sparql import has_limit, normalize_query
+
+__all__ = ["binding_value", "has_limit", "local_name", "normalize_query", "to_json"]
@@ -0,0 +1,31 @@
+"""Helpers for working with IRIs and SPARQL result bindings."""
+
+from typing import Any
+
+
+def local_name(iri: str) -> str:
+    """Return the local part of an IRI (after the last '#' or '/').
+
+    Args:
+        iri: The IRI to shorten
+
+    Returns:
+        The local name, or the IRI itself if it has no local part
+    """
+    cut = max(iri.rfind("#"), iri.rfind("/"))
+    return iri[cut + 1 :] or iri
+
+
+def binding_value(binding: dict[str, Any], key: str, default: str = "") -> str:
+    """Return the value of a variable in a SPARQL result binding.
+
+    Args:
+        binding: A binding dict as produced by the backends
+        key: Variable name
+        default: Value returned when the variable is unbound
+
+    Returns:
+        The bound term's value, or the default
+    """
+    term = binding.get(key)
+    return term["value"] if term else default
@@ -0,0 +1,10 @@
+"""Helpers for rendering tool output."""
+
+from typing import Any
+
+import orjson
+
+
+def to_json(output: Any) -> str:
+    """Serialize a tool response as indented JSON."""
+    return orjson.dumps(output, option=orjson.OPT_INDENT_2).decode()
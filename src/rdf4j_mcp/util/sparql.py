@@ -0,0 +1,56 @@
+"""Helpers for inspecting SPARQL query text."""
+
+import re
+from typing import Final
+
+# A LIMIT clause, not a ?limit variable or ex:limit name
+_LIMIT_RE = re.compile(r"(?<![\w?$:])LIMIT\s+\d+", re.IGNORECASE)
+
+# String literals and IRIs, whose text must be taken verbatim
+_TERMS: Final = (
+    r'"""(?:[^"\\]|\\.|"(?!""))*"""'
+    r"|'''(?:[^'\\]|\\.|'(?!''))*'''"
+    r'|"(?:[^"\\\n]|\\.)*"'
+    r"|'(?:[^'\\\n]|\\.)*'"
+    r'|<[^<>"{}|^`\\\s]*>'
+)
+
+# A comment, but not an escaped '#' in a prefixed name
+_COMMENT: Final = r"(?<!\\)#[^\n]*"
+
+# String literals, IRIs and comments, where a LIMIT keyword means nothing
+_OPAQUE_RE = re.compile(rf"{_TERMS}|{_COMMENT}")
+
+# A verbatim term, or a run of whitespace and comments
+_LAYOUT_RE = re.compile(rf"({_TERMS})|(?:\s|{_COMMENT})+")
+
+
+def has_limit(query: str) -> bool:
+    """Check whether a query has a LIMIT clause outside literals, IRIs and comments.
+
+    Args:
+        query: SPARQL query text
+
+    Returns:
+        True if the query already limits its results
+    """
+    # Queries without a limit rarely mention the keyword, so skip the masking copy
+    if _LIMIT_RE.search(query) is None:
+        return False
+    return _LIMIT_RE.search(_OPAQUE_RE.sub(" ", query)) is not None
+
+
+def normalize_query(query: str) -> str:
+    """Canonicalize the layout of a query, e.g. for use as a cache key.
+
+    Comments are dropped and whitespace runs become a single space; string
+    literals and IRIs are kept verbatim, so queries that only differ in
+    layout normalize to the same text.
+
+    Args:
+        query: SPARQL query text
+
+    Returns:
+        The query with normalized layout
+    """
+    return _LAYOUT_RE.sub(lambda match: match.group(1) or " ", query).strip()
@@ -0,0 +1,35 @@
+"""Sample data shared by the backend and server tests."""
+
+SAMPLE_TURTLE = """
+@prefix ex: <http://example.org/> .
+@prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+@prefix owl: <http://www.w3.org/2002/07/owl#> .
+
+ex:Person a owl:Class ;
+    rdfs:label "Person" ;
+    rdfs:comment "A human being" .
+
+ex:Organization a owl:Class ;
+    rdfs:label "Organization" .
+
+ex:name a owl:DatatypeProperty ;
+    rdfs:label "name" ;
+    rdfs:domain ex:Person .
+
+ex:worksFor a owl:ObjectProperty ;
+    rdfs:label "works for" ;
+    rdfs:domain ex:Person ;
+    rdfs:range ex:Organization .
+
+ex:alice a ex:Person ;
+    ex:name "Alice" ;
+    ex:worksFor ex:acme .
+
+ex:bob a ex:Person ;
+    ex:name "Bob" ;
+    ex:worksFor ex:acme .
+
+ex:acme a ex:Organization ;
+    ex:name "Acme Corp" .
+"""
@@ -1,5 +1,9 @@
 """Tests for configuration module."""
 
+import pytest
+from pydantic import ValidationError
+
+from rdf4j_mcp import config
 from rdf4j_mcp.config import BackendType, Settings, configure, get_settings
 
 
@@ -8,7 +12,7 @@ class TestSettings:
 
     def test_default_settings(self):
         """Test default settings values."""
-        settings = Settings()
+        settings = Settings(_env_file=None)
 
         assert settings.backend_type == BackendType.LOCAL
         assert settings.rdf4j_server_url == "http://localhost:8080/rdf4j-server"
@@ -18,6 +22,9 @@ class TestSettings:
         assert settings.query_timeout == 30
         assert settings.default_limit == 100
         assert settings.max_limit == 10000
+        assert settings.max_concurrent_backend_calls == 16
+        assert settings.cache_ttl == 300
+        assert settings.query_cache_size == 256
         assert settings.server_name == "rdf4j-mcp"
         assert settings.server_version == "0.1.0"
 
@@ -37,9 +44,16 @@ class TestSettings:
         assert settings.query_timeout == 60
         assert settings.default_limit == 50
 
+    def test_settings_are_frozen(self):
+        """Test settings can't be modified after construction."""
+        settings = Settings()
+        with pytest.raises(ValidationError):
+            settings.default_limit = 5
+
     def test_backend_type_enum(self):
         """Test BackendType enum values."""
         assert BackendType.LOCAL.value == "local"
+        assert BackendType.OXIGRAPH.value == "oxigraph"
         assert BackendType.REMOTE.value == "remote"
 
     def test_settings_from_env(self, monkeypatch):
@@ -49,7 +63,7 @@ class TestSettings:
         monkeypatch.setenv("RDF4J_MCP_DEFAULT_REPOSITORY", "env-repo")
         monkeypatch.setenv("RDF4J_MCP_QUERY_TIMEOUT", "45")
 
-        settings = Settings()
+        settings = Settings(_env_file=None)
 
         assert settings.backend_type == BackendType.REMOTE
         assert settings.rdf4j_server_url == "http://env-server:8080"
@@ -60,41 +74,27 @@ class TestSettings:
 class TestGlobalSettings:
     """Test global settings management."""
 
+    @pytest.fixture(autouse=True)
+    def reset_global_settings(self, monkeypatch):
+        """Start each test without global settings and restore them afterwards."""
+        monkeypatch.setattr(config, "_settings", None)
+
     def test_get_settings_returns_instance(self):
         """Test get_settings returns a Settings instance."""
-        # Reset global settings
-        import rdf4j_mcp.config as config_module
-
-        config_module._settings = None
-
         settings = get_settings()
         assert isinstance(settings, Settings)
 
     def test_configure_sets_global(self):
         """Test configure sets global settings."""
-        import rdf4j_mcp.config as config_module
-
-        config_module._settings = None
-
         custom = Settings(query_timeout=99)
         configure(custom)
 
         settings = get_settings()
         assert settings.query_timeout == 99
 
-        # Reset for other tests
-        config_module._settings = None
-
     def test_get_settings_caches(self):
         """Test get_settings caches the instance."""
-        import rdf4j_mcp.config as config_module
-
-        config_module._settings = None
-
         settings1 = get_settings()
         settings2 = get_settings()
 
         assert settings1 is settings2
-
-        # Reset for other tests
-        config_module._settings = None
@@ -1,8 +1,21 @@
 """Tests for the local backend."""
 
-import pytest
+import asyncio
+import threading
+from dataclasses import FrozenInstanceError
 
+import pytest
+from rdflib import BNode, Literal, URIRef
+
+from rdf4j_mcp.backends import local
+from rdf4j_mcp.backends.base import (
+    SUMMARY_COMMENT_LENGTH,
+    SchemaSummary,
+    node_to_dict,
+    parse_single_pattern_ask,
+)
 from rdf4j_mcp.backends.local import LocalBackend
+from tests._sample_data import SAMPLE_TURTLE
 
 
 @pytest.fixture
@@ -17,43 +30,20 @@ async def backend():
 @pytest.fixture
 async def backend_with_data(backend):
     """Backend with sample RDF data loaded."""
-    sample_turtle = """
-    @prefix ex: <http://example.org/> .
-    @prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
-    @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
-    @prefix owl: <http://www.w3.org/2002/07/owl#> .
-
-    ex:Person a owl:Class ;
-        rdfs:label "Person" ;
-        rdfs:comment "A human being" .
-
-    ex:Organization a owl:Class ;
-        rdfs:label "Organization" .
-
-    ex:name a owl:DatatypeProperty ;
-        rdfs:label "name" ;
-        rdfs:domain ex:Person .
-
-    ex:worksFor a owl:ObjectProperty ;
-        rdfs:label "works for" ;
-        rdfs:domain ex:Person ;
-        rdfs:range ex:Organization .
-
-    ex:alice a ex:Person ;
-        ex:name "Alice" ;
-        ex:worksFor ex:acme .
-
-    ex:bob a ex:Person ;
-        ex:name "Bob" ;
-        ex:worksFor ex:acme .
-
-    ex:acme a ex:Organization ;
-        ex:name "Acme Corp" .
-    """
-    await backend.load_data(sample_turtle, format="turtle")
+    await backend.load_data(SAMPLE_TURTLE, format="turtle")
     return backend
 
 
+@pytest.fixture(scope="module")
+async def shared_backend_with_data():
+    """Backend with the sample data, loaded once for the read-only tests of this module."""
+    backend = LocalBackend()
+    await backend.connect()
+    await backend.load_data(SAMPLE_TURTLE, format="turtle")
+    yield backend
+    await backend.close()
+
+
 class TestLocalBackendBasics:
     """Test basic backend operations."""
 
@@ -82,6 +72,18 @@ class TestLocalBackendBasics:
         with pytest.raises(ValueError):
             await backend.select_repository("nonexistent")
 
+    async def test_queries_run_off_event_loop(self, backend):
+        """Test rdflib work runs on the backend's worker thread."""
+        name = await backend._run(lambda: threading.current_thread().name)
+        assert name.startswith("rdflib")
+        assert name != threading.current_thread().name
+
+    async def test_query_after_close_raises(self, backend):
+        """Test queries fail cleanly once the backend is closed."""
+        await backend.close()
+        with pytest.raises(RuntimeError):
+            await backend.sparql_select("SELECT * WHERE { ?s ?p ?o }")
+
 
 class TestSPARQLQueries:
     """Test SPARQL query operations."""
@@ -92,9 +94,9 @@ class TestSPARQLQueries:
         assert result.type == "select"
         assert result.bindings == []
 
-    async def test_sparql_select_with_data(self, backend_with_data):
+    async def test_sparql_select_with_data(self, shared_backend_with_data):
         """Test SELECT with data."""
-        result = await backend_with_data.sparql_select(
+        result = await shared_backend_with_data.sparql_select(
             "SELECT ?name WHERE { ?s <http://example.org/name> ?name }"
         )
         assert result.type == "select"
@@ -104,34 +106,193 @@ class TestSPARQLQueries:
         assert "Bob" in names
         assert "Acme Corp" in names
 
-    async def test_sparql_construct(self, backend_with_data):
+    async def test_sparql_select_stream(self, shared_backend_with_data):
+        """Test streaming SELECT yields the same bindings as sparql_select."""
+        query = "SELECT ?name WHERE { ?s <http://example.org/name> ?name }"
+        streamed = [b async for b in shared_backend_with_data.sparql_select_stream(query)]
+        result = await shared_backend_with_data.sparql_select(query)
+        assert streamed == result.bindings
+
+    async def test_sparql_select_stream_on_worker(self, backend_with_data, monkeypatch):
+        """Test streamed rows are evaluated on the worker thread, a batch at a time."""
+        monkeypatch.setattr(local, "_STREAM_BATCH_SIZE", 2)
+        threads = set()
+        row_to_dict = backend_with_data._row_to_dict
+
+        def recording_row_to_dict(row, names):
+            threads.add(threading.current_thread().name)
+            return row_to_dict(row, names)
+
+        monkeypatch.setattr(backend_with_data, "_row_to_dict", recording_row_to_dict)
+        query = "SELECT ?s ?name WHERE { ?s <http://example.org/name> ?name }"
+        streamed = [b async for b in backend_with_data.sparql_select_stream(query)]
+        assert len(streamed) == 3
+        assert threading.current_thread().name not in threads
+
+    async def test_sparql_select_stream_load_while_streaming(self, backend_with_data, monkeypatch):
+        """Test loading data between streamed batches is reported."""
+        monkeypatch.setattr(local, "_STREAM_BATCH_SIZE", 1)
+        stream = backend_with_data.sparql_select_stream("SELECT ?s WHERE { ?s ?p ?o }")
+        await anext(stream)
+        await backend_with_data.load_data("<http://example.org/x> <http://example.org/y> 1 .")
+        with pytest.raises(RuntimeError, match="streaming"):
+            await anext(stream)
+
+    async def test_sparql_select_sees_prefixes_from_later_loads(self, backend_with_data):
+        """Test cached query parsing picks up prefixes bound by a later load."""
+        query = "SELECT ?s WHERE { ?s a zoo:Animal }"
+        with pytest.raises(Exception, match="zoo"):
+            await backend_with_data.sparql_select(query)
+
+        await backend_with_data.load_data(
+            "@prefix zoo: <http://zoo.example/> . zoo:rex a zoo:Animal .", format="turtle"
+        )
+        result = await backend_with_data.sparql_select(query)
+        assert [b["s"]["value"] for b in result.bindings] == ["http://zoo.example/rex"]
+
+    async def test_sparql_select_values(self, shared_backend_with_data):
+        """Test single-variable SELECT returns plain values matching the bindings."""
+        query = "SELECT ?name WHERE { ?s <http://example.org/name> ?name }"
+        values = await shared_backend_with_data.sparql_select_values(query)
+        result = await shared_backend_with_data.sparql_select(query)
+        assert values == [b["name"]["value"] for b in result.bindings]
+        assert sorted(values) == ["Acme Corp", "Alice", "Bob"]
+
+    async def test_sparql_select_values_rejects_multiple_variables(self, shared_backend_with_data):
+        """Test single-variable SELECT refuses queries projecting several variables."""
+        with pytest.raises(ValueError):
+            await shared_backend_with_data.sparql_select_values("SELECT ?s ?o WHERE { ?s ?p ?o }")
+
+    async def test_query_result_iteration(self, shared_backend_with_data):
+        """Test iterating a result yields its bindings, and nothing for ASK."""
+        query = "SELECT ?name WHERE { ?s <http://example.org/name> ?name }"
+        result = await shared_backend_with_data.sparql_select(query)
+        assert list(result) == result.bindings
+
+        ask = await shared_backend_with_data.sparql_ask("ASK { ?s ?p ?o }")
+        assert list(ask) == []
+
+    async def test_sparql_construct(self, shared_backend_with_data):
         """Test CONSTRUCT query."""
-        result = await backend_with_data.sparql_construct(
+        result = await shared_backend_with_data.sparql_construct(
             "CONSTRUCT { ?s ?p ?o } WHERE { ?s a <http://example.org/Person> . ?s ?p ?o }"
         )
         assert result.type == "construct"
         assert result.triples is not None
         assert "Alice" in result.triples
 
-    async def test_sparql_ask_true(self, backend_with_data):
+    async def test_sparql_construct_ntriples(self, shared_backend_with_data):
+        """Test CONSTRUCT serialized as N-Triples, one full triple per line."""
+        result = await shared_backend_with_data.sparql_construct(
+            "CONSTRUCT { ?s <http://example.org/name> ?o } "
+            "WHERE { ?s <http://example.org/name> ?o }",
+            format="nt",
+        )
+        lines = (result.triples or "").strip().splitlines()
+        assert len(lines) == 3
+        assert '<http://example.org/alice> <http://example.org/name> "Alice" .' in lines
+
+    async def test_sparql_construct_turtle(self, shared_backend_with_data):
+        """Test Turtle output is available on request."""
+        result = await shared_backend_with_data.sparql_construct(
+            "CONSTRUCT { ?s ?p ?o } WHERE { ?s a <http://example.org/Person> . ?s ?p ?o }",
+            format="turtle",
+        )
+        assert "@prefix" in (result.triples or "")
+
+    async def test_sparql_construct_rejects_unknown_format(self, shared_backend_with_data):
+        """Test unsupported CONSTRUCT formats are rejected."""
+        with pytest.raises(ValueError):
+            await shared_backend_with_data.sparql_construct(
+                "CONSTRUCT { ?s ?p ?o } WHERE { ?s ?p ?o }", format="xml"
+            )
+
+    async def test_sparql_ask_true(self, shared_backend_with_data):
         """Test ASK query returning true."""
-        result = await backend_with_data.sparql_ask("ASK { ?s a <http://example.org/Person> }")
+        result = await shared_backend_with_data.sparql_ask(
+            "ASK { ?s a <http://example.org/Person> }"
+        )
         assert result.type == "ask"
         assert result.boolean is True
 
-    async def test_sparql_ask_false(self, backend_with_data):
+    async def test_sparql_ask_false(self, shared_backend_with_data):
         """Test ASK query returning false."""
-        result = await backend_with_data.sparql_ask("ASK { ?s a <http://example.org/NonExistent> }")
+        result = await shared_backend_with_data.sparql_ask(
+            "ASK { ?s a <http://example.org/NonExistent> }"
+        )
         assert result.type == "ask"
         assert result.boolean is False
 
+    async def test_sparql_ask_any_triple_empty(self, backend):
+        """Test single-pattern ASK on an empty graph."""
+        result = await backend.sparql_ask("ASK { ?s ?p ?o }")
+        assert result.boolean is False
+
+    async def test_sparql_ask_bound_pattern(self, shared_backend_with_data):
+        """Test single-pattern ASK with bound subject and predicate."""
+        result = await shared_backend_with_data.sparql_ask(
+            "ask where { <http://example.org/alice> <http://example.org/worksFor> ?org . }"
+        )
+        assert result.boolean is True
+
+    async def test_sparql_ask_complex_falls_back(self, shared_backend_with_data):
+        """Test ASK queries the fast path can't handle still evaluate."""
+        result = await shared_backend_with_data.sparql_ask(
+            "PREFIX ex: <http://example.org/> ASK { ?s ex:worksFor ?o . ?o ex:name 'Acme Corp' }"
+        )
+        assert result.boolean is True
+
+
+class TestParseSinglePatternAsk:
+    """Test recognition of single triple pattern ASK queries."""
+
+    def test_variables_and_type_shorthand(self):
+        """Test variables become wildcards and 'a' becomes rdf:type."""
+        assert parse_single_pattern_ask("ASK { ?s a <http://example.org/T> }") == (
+            None,
+            "http://www.w3.org/1999/02/22-rdf-syntax-ns#type",
+            "http://example.org/T",
+        )
+
+    def test_rejects_unsupported_queries(self):
+        """Test queries needing the full SPARQL pipeline are rejected."""
+        assert parse_single_pattern_ask("ASK { ?s ?s ?o }") is None
+        assert parse_single_pattern_ask("ASK { ?s ex:p ?o }") is None
+        assert parse_single_pattern_ask('ASK { ?s ?p "x" }') is None
+        assert parse_single_pattern_ask("ASK { ?s ?p ?o . ?o ?q ?r }") is None
+
+
+class TestNodeToDict:
+    """Test conversion of rdflib terms to SPARQL JSON dicts."""
+
+    def test_term_types(self):
+        """Test URIs, literals and blank nodes convert by their exact type."""
+        assert node_to_dict(URIRef("http://example.org/a")) == {
+            "type": "uri",
+            "value": "http://example.org/a",
+        }
+        assert node_to_dict(Literal("hi", lang="en")) == {
+            "type": "literal",
+            "value": "hi",
+            "xml:lang": "en",
+        }
+        assert node_to_dict(BNode("b0")) == {"type": "bnode", "value": "b0"}
+
+    def test_subclass_falls_back_to_isinstance(self):
+        """Test subclasses of rdflib terms still find their converter."""
+
+        class CustomURIRef(URIRef):
+            pass
+
+        assert node_to_dict(CustomURIRef("http://example.org/a"))["type"] == "uri"
+
 
 class TestExplorationMethods:
     """Test knowledge graph exploration methods."""
 
-    async def test_search_classes(self, backend_with_data):
+    async def test_search_classes(self, shared_backend_with_data):
         """Test searching for classes."""
-        result = await backend_with_data.search_classes()
+        result = await shared_backend_with_data.search_classes()
         assert result.type == "select"
         assert len(result.bindings) > 0
 
@@ -140,29 +301,129 @@ class TestExplorationMethods:
         assert any("Person" in c for c in class_iris)
         assert any("Organization" in c for c in class_iris)
 
-    async def test_search_classes_with_pattern(self, backend_with_data):
+    async def test_search_templates_prepared_on_worker(self, monkeypatch):
+        """Test search templates are parsed on the worker thread, at connect or first use."""
+        threads = set()
+        prepare_query = local.prepareQuery
+
+        def recording_prepare_query(*args, **kwargs):
+            threads.add(threading.current_thread().name)
+            return prepare_query(*args, **kwargs)
+
+        monkeypatch.setattr(local, "prepareQuery", recording_prepare_query)
+        local._prepared_search_classes.cache_clear()
+        local._prepared_search_properties.cache_clear()
+        async with LocalBackend() as backend:
+            await backend.search_classes("Person")
+            await backend.search_properties(domain="http://example.org/Person")
+        assert threads
+        assert all(name.startswith("rdflib") for name in threads)
+
+    async def test_search_classes_with_pattern(self, shared_backend_with_data):
         """Test searching classes with pattern."""
-        result = await backend_with_data.search_classes(pattern="Person")
+        result = await shared_backend_with_data.search_classes(pattern="Person")
         assert result.type == "select"
         assert len(result.bindings) > 0
 
         class_iris = [b.get("class", {}).get("value", "") for b in result.bindings]
         assert any("Person" in c for c in class_iris)
 
-    async def test_search_properties(self, backend_with_data):
+    async def test_search_classes_with_prefix_pattern(self, shared_backend_with_data):
+        """Test anchored patterns match on the IRI prefix."""
+        result = await shared_backend_with_data.search_classes(pattern="^HTTP://EXAMPLE.ORG/Org")
+        class_iris = [b.get("class", {}).get("value", "") for b in result.bindings]
+        assert class_iris == ["http://example.org/Organization"]
+
+    async def test_search_classes_with_regex_pattern(self, shared_backend_with_data):
+        """Test patterns with regex metacharacters still use REGEX."""
+        result = await shared_backend_with_data.search_classes(pattern="pers.n$")
+        class_iris = [b.get("class", {}).get("value", "") for b in result.bindings]
+        assert class_iris == ["http://example.org/Person"]
+
+    @pytest.mark.parametrize("pattern", ["Person(", "*Person", "[a-"])
+    async def test_search_classes_invalid_regex(self, shared_backend_with_data, pattern):
+        """Test malformed regex patterns are rejected before querying."""
+        with pytest.raises(ValueError, match="Invalid search pattern"):
+            await shared_backend_with_data.search_classes(pattern=pattern)
+
+    async def test_search_classes_pattern_is_escaped(self, shared_backend_with_data):
+        """Test quotes in the pattern cannot break out of the string literal."""
+        result = await shared_backend_with_data.search_classes(pattern='Person" , "')
+        assert result.bindings == []
+
+    async def test_search_classes_with_namespace_prefix(self, shared_backend_with_data):
+        """Test restricting classes to a namespace."""
+        result = await shared_backend_with_data.search_classes(
+            namespace_prefix="http://example.org/"
+        )
+        class_iris = {b["class"]["value"] for b in result.bindings}
+        assert class_iris == {"http://example.org/Person", "http://example.org/Organization"}
+
+    async def test_search_classes_namespace_prefix_is_case_sensitive(
+        self, shared_backend_with_data
+    ):
+        """Test the namespace filter compares IRIs exactly."""
+        result = await shared_backend_with_data.search_classes(
+            namespace_prefix="HTTP://EXAMPLE.ORG/"
+        )
+        assert result.bindings == []
+
+    async def test_search_properties_with_namespace_prefix(self, shared_backend_with_data):
+        """Test restricting properties to a namespace combined with a pattern."""
+        result = await shared_backend_with_data.search_properties(
+            pattern="work", namespace_prefix="http://example.org/"
+        )
+        property_iris = [b["property"]["value"] for b in result.bindings]
+        assert property_iris == ["http://example.org/worksFor"]
+
+    async def test_search_classes_sorted(self, shared_backend_with_data):
+        """Test sort=True returns the smallest IRIs in order."""
+        result = await shared_backend_with_data.search_classes(limit=2, sort=True)
+        class_iris = [b["class"]["value"] for b in result.bindings]
+        everything = await shared_backend_with_data.search_classes(limit=1000)
+        expected = sorted(b["class"]["value"] for b in everything.bindings)[:2]
+        assert class_iris == expected
+
+    async def test_search_properties(self, shared_backend_with_data):
         """Test searching for properties."""
-        result = await backend_with_data.search_properties()
+        result = await shared_backend_with_data.search_properties()
         assert result.type == "select"
         assert len(result.bindings) > 0
 
-    async def test_search_properties_with_domain(self, backend_with_data):
+    async def test_search_properties_with_domain(self, shared_backend_with_data):
         """Test searching properties with domain filter."""
-        result = await backend_with_data.search_properties(domain="http://example.org/Person")
+        result = await shared_backend_with_data.search_properties(
+            domain="http://example.org/Person"
+        )
         assert result.type == "select"
 
-    async def test_find_instances(self, backend_with_data):
+    async def test_search_properties_bulk(self, shared_backend_with_data):
+        """Test searching properties for several domains at once."""
+        result = await shared_backend_with_data.search_properties_bulk(
+            ["http://example.org/Person", "http://example.org/Organization"]
+        )
+        pairs = {(b["domain"]["value"], b["property"]["value"]) for b in result.bindings}
+        assert ("http://example.org/Person", "http://example.org/name") in pairs
+        assert ("http://example.org/Person", "http://example.org/worksFor") in pairs
+
+    async def test_search_properties_bulk_repeated_domain(self, shared_backend_with_data):
+        """Test a domain listed twice yields its properties once."""
+        person = "http://example.org/Person"
+        once = await shared_backend_with_data.search_properties_bulk([person])
+        twice = await shared_backend_with_data.search_properties_bulk([person, person])
+        assert twice.bindings == once.bindings
+        assert all(b["domain"]["value"] == person for b in once.bindings)
+
+    async def test_search_properties_bulk_empty(self, shared_backend_with_data):
+        """Test bulk property search with no domains."""
+        result = await shared_backend_with_data.search_properties_bulk([])
+        assert result.bindings == []
+
+    async def test_find_instances(self, shared_backend_with_data):
         """Test finding instances of a class."""
-        result = await backend_with_data.find_instances(class_iri="http://example.org/Person")
+        result = await shared_backend_with_data.find_instances(
+            class_iri="http://example.org/Person"
+        )
         assert result.type == "select"
         assert len(result.bindings) == 2  # Alice and Bob
 
@@ -170,9 +431,64 @@ class TestExplorationMethods:
         assert any("alice" in i for i in instance_iris)
         assert any("bob" in i for i in instance_iris)
 
-    async def test_describe_resource(self, backend_with_data):
+    async def test_find_instances_with_labels(self, shared_backend_with_data):
+        """Test instance labels are attached in the bulk label pass."""
+        result = await shared_backend_with_data.find_instances(
+            class_iri="http://www.w3.org/2002/07/owl#Class"
+        )
+        labels = {b["instance"]["value"]: b["label"]["value"] for b in result.bindings}
+        assert labels["http://example.org/Person"] == "Person"
+        assert labels["http://example.org/Organization"] == "Organization"
+
+    async def test_find_instances_limit(self, shared_backend_with_data):
+        """Test find_instances honours the limit."""
+        result = await shared_backend_with_data.find_instances(
+            class_iri="http://example.org/Person", limit=1
+        )
+        assert len(result.bindings) == 1
+
+    async def test_match_triples_subject(self, shared_backend_with_data):
+        """Test matching triples by subject."""
+        triples = await shared_backend_with_data.match_triples(subject="http://example.org/alice")
+        assert len(triples) == 3
+        assert all(str(s) == "http://example.org/alice" for s, _, _ in triples)
+
+    async def test_match_triples_limit(self, shared_backend_with_data):
+        """Test matching stops at the limit."""
+        triples = await shared_backend_with_data.match_triples(
+            subject="http://example.org/alice", limit=2
+        )
+        assert len(triples) == 2
+
+    async def test_match_triples_predicate_object(self, shared_backend_with_data):
+        """Test matching triples by predicate and object."""
+        triples = await shared_backend_with_data.match_triples(
+            predicate="http://example.org/worksFor", obj="http://example.org/acme"
+        )
+        subjects = {str(s) for s, _, _ in triples}
+        assert subjects == {"http://example.org/alice", "http://example.org/bob"}
+
+    async def test_get_property_usage(self, shared_backend_with_data):
+        """Test object property usage counts."""
+        result = await shared_backend_with_data.get_property_usage()
+        assert len(result.bindings) == 1
+        binding = result.bindings[0]
+        assert binding["prop"]["value"] == "http://example.org/worksFor"
+        assert binding["usage"]["value"] == "2"
+
+    async def test_get_connectivity(self, shared_backend_with_data):
+        """Test connection counts include incoming and outgoing triples."""
+        result = await shared_backend_with_data.get_connectivity(
+            ["http://example.org/Person", "http://example.org/Organization"]
+        )
+        connections = {b["entity"]["value"]: b["connections"]["value"] for b in result.bindings}
+        assert connections["http://example.org/acme"] == "4"
+        assert connections["http://example.org/alice"] == "3"
+        assert result.bindings[0]["entity"]["value"] == "http://example.org/acme"
+
+    async def test_describe_resource(self, shared_backend_with_data):
         """Test describing a resource."""
-        result = await backend_with_data.describe_resource(iri="http://example.org/alice")
+        result = await shared_backend_with_data.describe_resource(iri="http://example.org/alice")
         assert result.type == "construct"
         assert result.triples is not None
         assert "alice" in result.triples
@@ -186,69 +502,259 @@ class TestStatistics:
         stats = await backend.get_statistics()
         assert stats.total_statements == 0
 
-    async def test_get_statistics_with_data(self, backend_with_data):
+    async def test_get_statistics_with_data(self, shared_backend_with_data):
         """Test statistics with data."""
-        stats = await backend_with_data.get_statistics()
+        stats = await shared_backend_with_data.get_statistics()
         assert stats.total_statements > 0
         assert stats.total_classes > 0
         assert stats.total_properties > 0
         assert stats.total_subjects > 0
         assert stats.total_objects > 0
 
+    async def test_get_statistics_counts(self, shared_backend_with_data):
+        """Test class and property counts include rdf:type objects and used predicates."""
+        stats = await shared_backend_with_data.get_statistics()
+        # ex:Person, ex:Organization plus owl:Class/ObjectProperty/DatatypeProperty
+        assert stats.total_classes == 5
+        # rdf:type, rdfs:label/comment/domain/range, ex:name, ex:worksFor
+        assert stats.total_properties == 7
+        assert stats.total_subjects == 7
+
+    async def test_get_statistics_after_remove(self, backend):
+        """Test counts drop once the last triple using a term is removed."""
+        await backend.load_data(
+            """
+            @prefix ex: <http://example.org/> .
+            ex:alice a ex:Person ; ex:name "Alice" .
+            ex:bob a ex:Person .
+            """
+        )
+        stats = await backend.get_statistics()
+        assert (stats.total_subjects, stats.total_classes, stats.total_properties) == (2, 1, 2)
+
+        backend._graph.remove((URIRef("http://example.org/alice"), None, None))
+        stats = await backend.get_statistics()
+        assert stats.total_statements == 1
+        assert (stats.total_subjects, stats.total_classes, stats.total_properties) == (1, 1, 1)
+
+    async def test_get_statistics_cached(self, backend_with_data):
+        """Test statistics are served from cache until the graph changes."""
+        first = await backend_with_data.get_statistics()
+        assert await backend_with_data.get_statistics() is first
+
+        await backend_with_data.load_data("<http://example.org/x> a <http://example.org/New> .")
+        stats = await backend_with_data.get_statistics()
+        assert stats.total_statements == first.total_statements + 1
+
+    async def test_cached_statistics_immutable(self, shared_backend_with_data):
+        """Test callers can't modify the statistics shared through the cache."""
+        stats = await shared_backend_with_data.get_statistics()
+        with pytest.raises(FrozenInstanceError):
+            stats.total_statements = 0
+
 
 class TestNamespaces:
     """Test namespace operations."""
 
     async def test_get_namespaces(self, backend):
         """Test getting namespaces."""
-        namespaces = await backend.get_namespaces()
         # Should have default namespaces bound
-        prefixes = [ns.prefix for ns in namespaces]
-        assert "rdf" in prefixes
-        assert "rdfs" in prefixes
-        assert "owl" in prefixes
+        prefixes = {ns.prefix for ns in await backend.get_namespaces()}
+        assert {"rdf", "rdfs", "owl", "xsd"} <= prefixes
+
+    async def test_get_namespaces_cached(self, backend):
+        """Test namespaces are served from cache until the graph changes."""
+        first = await backend.get_namespaces()
+        assert await backend.get_namespaces() is first
+
+        await backend.load_data("@prefix foo: <http://foo.example/> . foo:a foo:b foo:c .")
+        prefixes = [ns.prefix for ns in await backend.get_namespaces()]
+        assert "foo" in prefixes
+
+    async def test_get_namespaces_cache_disabled(self):
+        """Test a zero TTL disables caching."""
+        local_backend = LocalBackend(cache_ttl=0)
+        async with local_backend as backend:
+            first = await backend.get_namespaces()
+            assert await backend.get_namespaces() is not first
+
+
+class TestQueryCache:
+    """Test the SPARQL query result cache."""
+
+    async def test_cached_query_reuses_result(self, backend_with_data):
+        """Test repeating a query returns the cached result."""
+        query = "SELECT ?s WHERE { ?s a <http://example.org/Person> }"
+        first = await backend_with_data.cached_query("select", query)
+        assert await backend_with_data.cached_query("select", query) is first
+        assert len(first.bindings) == 2
+
+    async def test_cached_query_invalidated_by_load(self, backend_with_data):
+        """Test loading data invalidates cached results."""
+        query = "SELECT ?s WHERE { ?s a <http://example.org/Person> }"
+        first = await backend_with_data.cached_query("select", query)
+        await backend_with_data.load_data(
+            "<http://example.org/carol> a <http://example.org/Person> ."
+        )
+        second = await backend_with_data.cached_query("select", query)
+        assert second is not first
+        assert len(second.bindings) == 3
+
+    async def test_cached_query_ignores_layout(self, backend_with_data):
+        """Test queries differing only in whitespace and comments share a result."""
+        first = await backend_with_data.cached_query(
+            "select", "SELECT ?s WHERE { ?s a <http://example.org/Person> }"
+        )
+        second = await backend_with_data.cached_query(
+            "select", "SELECT ?s\nWHERE {  # people\n  ?s a <http://example.org/Person>\n}\n"
+        )
+        assert second is first
+
+    async def test_cached_query_coalesces_concurrent_misses(self, backend_with_data, monkeypatch):
+        """Test concurrent identical queries share one backend request."""
+        calls = 0
+        sparql_select = backend_with_data.sparql_select
+
+        async def slow_sparql_select(query, repository_id=None):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return await sparql_select(query, repository_id)
+
+        monkeypatch.setattr(backend_with_data, "sparql_select", slow_sparql_select)
+        query = "SELECT ?s WHERE { ?s a <http://example.org/Person> }"
+        results = await asyncio.gather(
+            *(backend_with_data.cached_query("select", query) for _ in range(5))
+        )
+        assert calls == 1
+        assert all(result is results[0] for result in results)
+
+    async def test_cached_query_failure_not_shared_later(self, backend_with_data, monkeypatch):
+        """Test a failed query is retried by the next caller."""
+
+        async def failing_sparql_select(query, repository_id=None):
+            raise RuntimeError("server unavailable")
+
+        query = "SELECT ?s WHERE { ?s a <http://example.org/Person> }"
+        monkeypatch.setattr(backend_with_data, "sparql_select", failing_sparql_select)
+        with pytest.raises(RuntimeError):
+            await backend_with_data.cached_query("select", query)
+
+        monkeypatch.undo()
+        result = await backend_with_data.cached_query("select", query)
+        assert len(result.bindings) == 2
+
+    async def test_cached_query_evicts_least_recently_used(self):
+        """Test the cache keeps at most query_cache_size results."""
+        async with LocalBackend(query_cache_size=1) as backend:
+            first = await backend.cached_query("ask", "ASK { ?s ?p ?o }")
+            await backend.cached_query("ask", "ASK { ?s ?p ?s }")
+            assert await backend.cached_query("ask", "ASK { ?s ?p ?o }") is not first
+
+    async def test_cached_query_rejects_unknown_type(self, backend):
+        """Test unknown query types are rejected."""
+        with pytest.raises(ValueError):
+            await backend.cached_query("update", "DELETE WHERE { ?s ?p ?o }")
 
 
 class TestSchemaSummary:
     """Test schema summary."""
 
-    async def test_get_schema_summary(self, backend_with_data):
+    async def test_get_schema_summary(self, shared_backend_with_data):
         """Test getting schema summary."""
-        summary = await backend_with_data.get_schema_summary()
-
-        assert "statistics" in summary
-        assert "classes" in summary
-        assert "properties" in summary
-        assert "namespaces" in summary
+        summary = await shared_backend_with_data.get_schema_summary()
+
+        assert isinstance(summary, SchemaSummary)
+        assert summary.statistics.total_statements > 0
+        assert len(summary.classes) > 0
+        assert len(summary.properties) > 0
+
+    async def test_schema_summary_truncates_comments(self, backend):
+        """Test class comments are cut short in the summary but not in searches."""
+        comment = "x" * 500
+        await backend.load_data(
+            f"""
+            @prefix owl: <http://www.w3.org/2002/07/owl#> .
+            @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+            <http://example.org/Verbose> a owl:Class ; rdfs:comment "{comment}"@en .
+            """
+        )
+        summary = await backend.get_schema_summary()
+        comments = {c["class"]["value"]: c["comment"] for c in summary.classes if "comment" in c}
+        summary_comment = comments["http://example.org/Verbose"]
+        assert summary_comment["value"] == "x" * SUMMARY_COMMENT_LENGTH
+        assert summary_comment["xml:lang"] == "en"
+
+        result = await backend.search_classes(pattern="verbose")
+        assert result.bindings[0]["comment"]["value"] == comment
+
+    async def test_schema_summary_limits(self, shared_backend_with_data):
+        """Test the limits are applied by the backend and cached separately."""
+        full = await shared_backend_with_data.get_schema_summary()
+        limited = await shared_backend_with_data.get_schema_summary(
+            classes_limit=1, properties_limit=2
+        )
 
-        assert summary["statistics"]["total_statements"] > 0
-        assert len(summary["classes"]) > 0
-        assert len(summary["properties"]) > 0
+        assert len(limited.classes) == 1
+        assert len(limited.properties) == 2
+        assert limited.classes == full.classes[:1]
+        assert len(full.classes) > 1
 
 
 class TestDataLoading:
     """Test data loading operations."""
 
-    async def test_load_data_turtle(self, backend):
-        """Test loading Turtle data."""
-        turtle = """
-        @prefix ex: <http://example.org/> .
-        ex:test ex:value "hello" .
-        """
-        count = await backend.load_data(turtle, format="turtle")
+    @pytest.mark.parametrize(
+        ("turtle", "expected"),
+        [
+            ('@prefix ex: <http://example.org/> . ex:test ex:value "hello" .', 1),
+            (
+                """
+                @prefix ex: <http://example.org/> .
+                ex:a ex:b ex:c .
+                ex:d ex:e ex:f .
+                ex:g ex:h ex:i .
+                """,
+                3,
+            ),
+        ],
+        ids=["single", "multiple"],
+    )
+    async def test_load_data_turtle(self, backend, turtle, expected):
+        """Test loading Turtle data reports the number of triples added."""
+        assert await backend.load_data(turtle, format="turtle") == expected
+
+    async def test_load_file_detects_format_from_extension(self, backend, tmp_path):
+        """Test the parser is chosen from the file extension."""
+        path = tmp_path / "data.nt"
+        path.write_text(
+            '<http://example.org/a> <http://example.org/name> "A"@en .\n'
+            '<http://example.org/a> <http://example.org/age> "3"^^'
+            "<http://www.w3.org/2001/XMLSchema#integer> .\n"
+        )
+        assert await backend.load_file(str(path)) == 2
+
+        graph = backend._graph
+        assert (URIRef("http://example.org/a"), None, Literal("A", lang="en")) in graph
+        assert (URIRef("http://example.org/a"), None, Literal(3)) in graph
+
+    async def test_load_data_ntriples_blank_nodes_are_per_load(self, backend):
+        """Test blank node labels don't merge across separate loads."""
+        data = '_:b0 <http://example.org/name> "x" .'
+        await backend.load_data(data, format="nt")
+        await backend.load_data(data, format="nt")
+        subjects = set(backend._graph.subjects())
+        assert len(subjects) == 2
+
+    async def test_load_data_nquads_flattens_graphs(self, backend):
+        """Test N-Quads statements are added to the graph."""
+        count = await backend.load_data(
+            "<http://example.org/a> <http://example.org/b> <http://example.org/c> "
+            "<http://example.org/g> .",
+            format="nquads",
+        )
         assert count == 1
 
-    async def test_load_data_multiple(self, backend):
-        """Test loading multiple triples."""
-        turtle = """
-        @prefix ex: <http://example.org/> .
-        ex:a ex:b ex:c .
-        ex:d ex:e ex:f .
-        ex:g ex:h ex:i .
-        """
-        count = await backend.load_data(turtle, format="turtle")
-        assert count == 3
-
 
 class TestContextManager:
     """Test async context manager."""
@@ -0,0 +1,241 @@
+"""Tests for the Oxigraph backend."""
+
+import threading
+
+import pytest
+
+from rdf4j_mcp.backends import oxigraph
+from rdf4j_mcp.backends.local import LocalBackend
+from rdf4j_mcp.backends.oxigraph import OxigraphBackend
+
+SAMPLE_TURTLE = """
+@prefix ex: <http://example.org/> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+@prefix owl: <http://www.w3.org/2002/07/owl#> .
+
+ex:Person a owl:Class ;
+    rdfs:label "Person" ;
+    rdfs:comment "A human being" .
+
+ex:Organization a owl:Class ;
+    rdfs:label "Organization"@en .
+
+ex:name a owl:DatatypeProperty ;
+    rdfs:label "name" ;
+    rdfs:domain ex:Person .
+
+ex:worksFor a owl:ObjectProperty ;
+    rdfs:label "works for" ;
+    rdfs:domain ex:Person ;
+    rdfs:range ex:Organization .
+
+ex:alice a ex:Person ;
+    ex:name "Alice" ;
+    ex:age 30 ;
+    ex:worksFor ex:acme .
+
+ex:bob a ex:Person ;
+    ex:name "Bob" ;
+    ex:worksFor ex:acme .
+
+ex:acme a ex:Organization ;
+    ex:name "Acme Corp" .
+"""
+
+
+@pytest.fixture
+async def backend():
+    """Create an Oxigraph backend for testing."""
+    backend = OxigraphBackend()
+    await backend.connect()
+    yield backend
+    await backend.close()
+
+
+@pytest.fixture
+async def backend_with_data(backend):
+    """Backend with sample RDF data loaded."""
+    await backend.load_data(SAMPLE_TURTLE, format="turtle")
+    return backend
+
+
+@pytest.fixture
+async def local_backend():
+    """rdflib backend with the same data, for comparing outputs."""
+    backend = LocalBackend()
+    await backend.connect()
+    await backend.load_data(SAMPLE_TURTLE, format="turtle")
+    yield backend
+    await backend.close()
+
+
+class TestOxigraphBackendBasics:
+    """Test basic backend operations."""
+
+    async def test_connect_disconnect(self):
+        """Test connecting and disconnecting."""
+        backend = OxigraphBackend()
+        await backend.connect()
+        assert backend._store is not None
+        await backend.close()
+        assert backend._store is None
+
+    async def test_select_repository_invalid(self, backend):
+        """Test selecting invalid repository raises error."""
+        with pytest.raises(ValueError):
+            await backend.select_repository("nonexistent")
+
+    async def test_load_file(self, backend, tmp_path):
+        """Test loading a file with the format guessed from its extension."""
+        path = tmp_path / "data.nt"
+        path.write_text("<http://example.org/a> <http://example.org/b> <http://example.org/c> .\n")
+        assert await backend.load_file(str(path)) == 1
+
+    async def test_load_data_counts_only_new_triples(self, backend_with_data):
+        """Test reloading existing triples adds nothing to the tracked size."""
+        before = (await backend_with_data.get_statistics()).total_statements
+        assert await backend_with_data.load_data(SAMPLE_TURTLE) == 0
+        stats = await backend_with_data.get_statistics()
+        assert stats.total_statements == before == len(backend_with_data._store)
+
+    @pytest.mark.parametrize(
+        ("data", "format"),
+        [
+            ('_:x <http://example.org/p> "1" .', "turtle"),
+            ('_:x <http://example.org/p> "1" .\n', "nt"),
+        ],
+    )
+    async def test_load_data_blank_nodes_are_per_load(self, backend, data, format):
+        """Test blank node labels don't merge across separate loads."""
+        assert await backend.load_data(data, format=format) == 1
+        assert await backend.load_data(data, format=format) == 1
+        assert len(backend._store) == 2
+
+    async def test_work_runs_off_event_loop(self, backend):
+        """Test Oxigraph work runs on the backend's worker thread."""
+        name = await backend._run(lambda: threading.current_thread().name)
+        assert name.startswith("oxigraph")
+        assert name != threading.current_thread().name
+
+    async def test_load_data_unknown_format(self, backend):
+        """Test unknown format names are rejected."""
+        with pytest.raises(ValueError):
+            await backend.load_data("", format="csv")
+
+
+class TestOxigraphQueries:
+    """Test SPARQL queries produce the same output as the rdflib backend."""
+
+    async def test_sparql_select_matches_local(self, backend_with_data, local_backend):
+        """Test SELECT bindings, including datatypes and language tags, match rdflib."""
+        query = "SELECT ?s ?p ?o WHERE { ?s ?p ?o FILTER(isLiteral(?o)) }"
+        result = await backend_with_data.sparql_select(query)
+        expected = await local_backend.sparql_select(query)
+
+        def key(binding):
+            return str(sorted((k, sorted(v.items())) for k, v in binding.items()))
+
+        assert result.variables == expected.variables
+        assert sorted(result.bindings, key=key) == sorted(expected.bindings, key=key)
+
+    async def test_sparql_select_uses_loaded_prefixes(self, backend_with_data):
+        """Test prefixes declared by loaded data can be used in queries."""
+        values = await backend_with_data.sparql_select_values("SELECT ?s WHERE { ?s a ex:Person }")
+        assert sorted(values) == ["http://example.org/alice", "http://example.org/bob"]
+
+    async def test_sparql_select_stream(self, backend_with_data):
+        """Test streaming SELECT yields the same bindings as sparql_select."""
+        query = "SELECT ?name WHERE { ?s ex:name ?name }"
+        streamed = [b async for b in backend_with_data.sparql_select_stream(query)]
+        result = await backend_with_data.sparql_select(query)
+        assert streamed == result.bindings
+
+    async def test_sparql_select_stream_batches(self, backend_with_data, monkeypatch):
+        """Test streaming in small batches, stopping early, then loading more data."""
+        monkeypatch.setattr(oxigraph, "_STREAM_BATCH_SIZE", 2)
+        query = "SELECT ?s ?p ?o WHERE { ?s ?p ?o }"
+        streamed = [b async for b in backend_with_data.sparql_select_stream(query)]
+        assert len(streamed) == len(backend_with_data._store)
+
+        stream = backend_with_data.sparql_select_stream(query)
+        await anext(stream)
+        await stream.aclose()
+        assert (
+            await backend_with_data.load_data(
+                "<http://example.org/carol> a <http://example.org/Person> ."
+            )
+            == 1
+        )
+
+    async def test_sparql_construct(self, backend_with_data):
+        """Test CONSTRUCT query."""
+        result = await backend_with_data.sparql_construct(
+            "CONSTRUCT { ?s ?p ?o } WHERE { ?s a ex:Person . ?s ?p ?o }"
+        )
+        assert result.type == "construct"
+        assert result.triples is not None
+        assert "Alice" in result.triples
+
+    async def test_sparql_construct_ntriples(self, backend_with_data):
+        """Test CONSTRUCT serialized as N-Triples."""
+        result = await backend_with_data.sparql_construct(
+            "CONSTRUCT { ?s ex:name ?o } WHERE { ?s ex:name ?o }", format="nt"
+        )
+        lines = (result.triples or "").strip().splitlines()
+        assert len(lines) == 3
+        assert all(line.startswith("<http://example.org/") for line in lines)
+
+    async def test_sparql_ask(self, backend_with_data):
+        """Test ASK queries on both the single-pattern and full evaluation paths."""
+        assert (await backend_with_data.sparql_ask("ASK { ?s a ex:Person }")).boolean is True
+        assert (await backend_with_data.sparql_ask("ASK { ?s a ex:Robot }")).boolean is False
+        result = await backend_with_data.sparql_ask(
+            "ASK { ?s ex:worksFor ?o . ?o ex:name 'Acme Corp' }"
+        )
+        assert result.boolean is True
+
+    async def test_match_triples(self, backend_with_data):
+        """Test triple pattern matching returns rdflib terms."""
+        triples = await backend_with_data.match_triples(subject="http://example.org/alice")
+        assert len(triples) == 4
+        assert len(await backend_with_data.match_triples(limit=2)) == 2
+
+
+class TestOxigraphSchema:
+    """Test statistics and schema exploration."""
+
+    async def test_get_statistics_matches_local(self, backend_with_data, local_backend):
+        """Test statistics use the same definitions as the rdflib backend."""
+        assert await backend_with_data.get_statistics() == await local_backend.get_statistics()
+
+    async def test_get_statistics_empty(self, backend):
+        """Test statistics on an empty store."""
+        stats = await backend.get_statistics()
+        assert stats.total_statements == 0
+        assert stats.total_classes == 0
+
+    async def test_get_namespaces(self, backend_with_data):
+        """Test default and loaded prefixes are reported."""
+        prefixes = {ns.prefix for ns in await backend_with_data.get_namespaces()}
+        assert {"rdf", "rdfs", "owl", "xsd", "ex"} <= prefixes
+
+    async def test_search_classes(self, backend_with_data):
+        """Test the shared class search runs on Oxigraph."""
+        result = await backend_with_data.search_classes(pattern="Person")
+        assert [b["class"]["value"] for b in result] == ["http://example.org/Person"]
+
+    async def test_search_classes_cached(self, backend_with_data):
+        """Test repeated searches reuse the cached result until data is loaded."""
+        first = await backend_with_data.search_classes(pattern="Person")
+        assert await backend_with_data.search_classes(pattern="Person") is first
+
+        await backend_with_data.load_data(
+            "<http://example.org/PersonRole> a <http://www.w3.org/2002/07/owl#Class> ."
+        )
+        result = await backend_with_data.search_classes(pattern="Person")
+        assert len(result.bindings) == 2
+
+    async def test_find_instances_with_labels(self, backend_with_data):
+        """Test instance lookup with labels."""
+        result = await backend_with_data.find_instances("http://example.org/Organization")
+        assert [b["instance"]["value"] for b in result] == ["http://example.org/acme"]
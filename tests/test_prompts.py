@@ -0,0 +1,104 @@
+"""Tests for the MCP prompts."""
+
+import pytest
+from mcp import types
+from mcp.server import Server
+
+from rdf4j_mcp.backends.local import LocalBackend
+from rdf4j_mcp.prompts import register_prompts
+
+
+@pytest.fixture
+async def backend():
+    """Create a local backend with a small ontology."""
+    backend = LocalBackend()
+    await backend.connect()
+    await backend.load_data(
+        """
+        @prefix ex: <http://example.org/> .
+        @prefix owl: <http://www.w3.org/2002/07/owl#> .
+        @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+
+        ex:Person a owl:Class ;
+            rdfs:label "Person" ;
+            rdfs:comment "A human being" .
+
+        ex:name a owl:DatatypeProperty ;
+            rdfs:label "name" ;
+            rdfs:domain ex:Person .
+
+        ex:alice a ex:Person ; ex:name "Alice" .
+        """
+    )
+    yield backend
+    await backend.close()
+
+
+@pytest.fixture
+def server(backend):
+    """MCP server with the prompts registered against the backend."""
+    server = Server("test")
+    register_prompts(server, lambda: backend)
+    return server
+
+
+async def get_prompt(server: Server, name: str, arguments: dict[str, str] | None = None) -> str:
+    """Call the registered get_prompt handler and return the message text."""
+    handler = server.request_handlers[types.GetPromptRequest]
+    request = types.GetPromptRequest(
+        method="prompts/get",
+        params=types.GetPromptRequestParams(name=name, arguments=arguments),
+    )
+    result = await handler(request)
+    assert isinstance(result.root, types.GetPromptResult)
+    content = result.root.messages[0].content
+    assert isinstance(content, types.TextContent)
+    return content.text
+
+
+class TestPrompts:
+    """Test prompt listing and rendering."""
+
+    async def test_list_prompts(self, server):
+        """Test the three prompts are listed."""
+        handler = server.request_handlers[types.ListPromptsRequest]
+        result = await handler(types.ListPromptsRequest(method="prompts/list"))
+        assert isinstance(result.root, types.ListPromptsResult)
+        assert [p.name for p in result.root.prompts] == [
+            "explore_knowledge_graph",
+            "write_sparql_query",
+            "explain_ontology",
+        ]
+
+    async def test_explore_prompt(self, server):
+        """Test the exploration prompt lists classes with their labels."""
+        text = await get_prompt(server, "explore_knowledge_graph", {"focus_area": "people"})
+        assert "  - http://example.org/Person (Person)" in text
+        assert "The user wants to focus on: people" in text
+
+    async def test_sparql_prompt(self, server):
+        """Test the SPARQL prompt annotates properties with label and domain."""
+        text = await get_prompt(server, "write_sparql_query", {"question": "Who is there?"})
+        assert '"Who is there?"' in text
+        assert "  - <http://example.org/name> # name domain: http://example.org/Person" in text
+
+    async def test_explain_prompt(self, server):
+        """Test the explanation prompt includes comments and the focus class."""
+        text = await get_prompt(
+            server, "explain_ontology", {"focus_class": "http://example.org/Person"}
+        )
+        assert "  - http://example.org/Person: A human being" in text
+        assert "## Focus Class: http://example.org/Person" in text
+
+    async def test_unknown_prompt(self, server):
+        """Test requesting an unknown prompt raises an error."""
+        with pytest.raises(ValueError):
+            await get_prompt(server, "nonexistent")
+
+    async def test_explain_prompt_unknown_focus_class(self, server):
+        """Test a focus class without related properties adds no focus section."""
+        text = await get_prompt(
+            server, "explain_ontology", {"focus_class": "http://example.org/Missing"}
+        )
+        assert "## Focus Class" not in text
+        assert "  - http://example.org/Person: A human being" in text
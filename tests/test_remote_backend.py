@@ -0,0 +1,175 @@
+"""Tests for the remote backend."""
+
+import asyncio
+
+import httpx
+import orjson
+import pytest
+from rdf4j_python import RepositoryNotFoundException
+
+from rdf4j_mcp.backends import remote
+from rdf4j_mcp.backends.remote import RemoteBackend
+
+SERVER_URL = "http://rdf4j.test/rdf4j-server"
+
+ALICE = {"s": {"type": "uri", "value": "http://example.org/alice"}}
+ALICE_TRIPLE = "<http://example.org/alice> <http://example.org/p> <http://example.org/o> .\n"
+
+
+def sparql_json(document: dict) -> httpx.Response:
+    """Build a SPARQL JSON results response."""
+    return httpx.Response(
+        200,
+        content=orjson.dumps(document),
+        headers={"Content-Type": "application/sparql-results+json"},
+    )
+
+
+def fake_rdf4j(request: httpx.Request) -> httpx.Response:
+    """Answer requests for the "test" repository like a tiny RDF4J server."""
+    path = request.url.path.removeprefix("/rdf4j-server")
+    if path == "/repositories/test/size":
+        return httpx.Response(200, text="3\n")
+    if path != "/repositories/test":
+        return httpx.Response(404, text="Unknown repository")
+
+    query = request.url.params["query"]
+    if query.startswith("ASK"):
+        return sparql_json({"head": {}, "boolean": "Robot" not in query})
+    if "COUNT" in query:
+        count = {"type": "literal", "value": "2"}
+        return sparql_json(
+            {"head": {"vars": ["count"]}, "results": {"bindings": [{"count": count}]}}
+        )
+    if request.headers["Accept"] == "application/n-triples":
+        return httpx.Response(200, text=ALICE_TRIPLE)
+    bindings = [] if "Robot" in query else [ALICE]
+    return sparql_json({"head": {"vars": ["s"]}, "results": {"bindings": bindings}})
+
+
+@pytest.fixture
+def requests() -> list[httpx.Request]:
+    """Requests the fake server received, in order."""
+    return []
+
+
+@pytest.fixture
+async def backend(requests):
+    """Create a remote backend talking to the fake server."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return fake_rdf4j(request)
+
+    backend = RemoteBackend(SERVER_URL, "test", transport=httpx.MockTransport(handler))
+    await backend.connect()
+    yield backend
+    await backend.close()
+
+
+class TestRemoteQueries:
+    """Test SPARQL requests sent to the repository endpoint."""
+
+    async def test_sparql_select(self, backend, requests):
+        """Test SELECT results are decoded from the SPARQL JSON document."""
+        result = await backend.sparql_select("SELECT ?s WHERE { ?s a <http://example.org/Person> }")
+        assert result.bindings == [ALICE]
+        assert result.variables == ["s"]
+        assert requests[0].url.path == "/rdf4j-server/repositories/test"
+        assert requests[0].headers["Accept"] == "application/sparql-results+json"
+
+    async def test_sparql_select_stream(self, backend, requests):
+        """Test streaming yields the buffered SELECT bindings from one request."""
+        query = "SELECT ?s WHERE { ?s a <http://example.org/Person> }"
+        assert [b async for b in backend.sparql_select_stream(query)] == [ALICE]
+        assert len(requests) == 1
+
+    async def test_sparql_construct(self, backend, requests):
+        """Test CONSTRUCT results are passed through in the negotiated format."""
+        result = await backend.sparql_construct("CONSTRUCT { ?s ?p ?o } WHERE { ?s ?p ?o }")
+        assert result.triples == ALICE_TRIPLE
+        assert requests[0].headers["Accept"] == "application/n-triples"
+
+    @pytest.mark.parametrize(
+        ("query", "answer"),
+        [
+            ("ASK { ?s a <http://example.org/Person> }", True),
+            ("ASK { ?s a <http://example.org/Robot> }", False),
+            ("ASK { ?s a ?c . ?c a <http://example.org/Person> }", True),
+            ("ASK { ?s a ?c . ?c a <http://example.org/Robot> }", False),
+        ],
+    )
+    async def test_sparql_ask(self, backend, query, answer):
+        """Test single-pattern and general ASK queries report the answer."""
+        result = await backend.sparql_ask(query)
+        assert result.boolean is answer
+
+    async def test_unknown_repository(self, backend):
+        """Test a 404 from the repository endpoint names the repository."""
+        with pytest.raises(RepositoryNotFoundException, match="missing"):
+            await backend.sparql_select("SELECT * WHERE { ?s ?p ?o }", "missing")
+
+    async def test_not_connected(self):
+        """Test querying before connect() raises an error."""
+        backend = RemoteBackend(SERVER_URL, "test")
+        with pytest.raises(RuntimeError):
+            await backend.sparql_select("SELECT * WHERE { ?s ?p ?o }")
+
+
+class TestRemoteStatistics:
+    """Test statistics gathered through the REST API."""
+
+    async def test_get_statistics(self, backend):
+        """Test the size endpoint and COUNT queries fill the statistics."""
+        stats = await backend.get_statistics()
+        assert stats.total_statements == 3
+        assert stats.total_classes == 2
+        assert stats.total_subjects == 2
+
+
+class TestRemoteCaching:
+    """Test the repository size probe used to stamp cached results."""
+
+    QUERY = "SELECT ?s WHERE { ?s a <http://example.org/Person> }"
+
+    @staticmethod
+    def count(requests: list[httpx.Request], path: str) -> int:
+        """Count the requests sent to a path below the server URL."""
+        return sum(r.url.path == f"/rdf4j-server{path}" for r in requests)
+
+    async def test_size_probe_shared(self, backend, requests):
+        """Test concurrent and repeated cache lookups share one size probe."""
+        await asyncio.gather(*(backend.cached_query("select", self.QUERY) for _ in range(3)))
+        await backend.cached_query("select", self.QUERY)
+        assert self.count(requests, "/repositories/test/size") == 1
+        assert self.count(requests, "/repositories/test") == 1
+
+    async def test_cache_hit_sends_no_request(self, backend, requests):
+        """Test a repeated query within the probe interval stays off the network."""
+        first = await backend.cached_query("select", self.QUERY)
+        requests.clear()
+        assert await backend.cached_query("select", self.QUERY) is first
+        assert self.count(requests, "/repositories/test/size") == 0
+        assert self.count(requests, "/repositories/test") == 0
+
+    async def test_find_instances_cached(self, backend, requests):
+        """Test a repeated instance lookup is answered from the query result cache."""
+        first = await backend.find_instances("http://example.org/Person")
+        assert await backend.find_instances("http://example.org/Person") is first
+        assert self.count(requests, "/repositories/test") == 1
+
+    async def test_size_reprobed_after_interval(self, backend, requests, monkeypatch):
+        """Test an expired probe is repeated and an unchanged size keeps the entry."""
+        monkeypatch.setattr(remote, "_VERSION_PROBE_INTERVAL", 0.0)
+        await backend.cached_query("select", self.QUERY)
+        await backend.cached_query("select", self.QUERY)
+        assert self.count(requests, "/repositories/test/size") == 2
+        assert self.count(requests, "/repositories/test") == 1
+
+    async def test_failed_probe_not_reused(self, backend, requests):
+        """Test a failed size probe is retried on the next lookup."""
+        with pytest.raises(RepositoryNotFoundException):
+            await backend.cached_query("select", self.QUERY, "missing")
+        with pytest.raises(RepositoryNotFoundException):
+            await backend.cached_query("select", self.QUERY, "missing")
+        assert self.count(requests, "/repositories/missing/size") == 2
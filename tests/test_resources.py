@@ -0,0 +1,169 @@
+"""Tests for the MCP resources."""
+
+import orjson
+import pytest
+from mcp import types
+from mcp.server import Server
+from pydantic import AnyUrl
+
+from rdf4j_mcp.backends.local import LocalBackend
+from rdf4j_mcp.resources import register_resources, resources
+
+
+@pytest.fixture
+async def backend():
+    """Create a local backend with a little data."""
+    backend = LocalBackend()
+    await backend.connect()
+    await backend.load_data(
+        """
+        @prefix ex: <http://example.org/> .
+        @prefix owl: <http://www.w3.org/2002/07/owl#> .
+        @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+
+        ex:Person a owl:Class ; rdfs:label "Person" .
+        ex:alice a ex:Person .
+        """
+    )
+    yield backend
+    await backend.close()
+
+
+@pytest.fixture
+def server(backend):
+    """MCP server with the resources registered against the backend."""
+    server = Server("test")
+    register_resources(server, lambda: backend)
+    return server
+
+
+async def list_resources(server: Server) -> list[types.Resource]:
+    """Call the registered list_resources handler."""
+    handler = server.request_handlers[types.ListResourcesRequest]
+    result = await handler(types.ListResourcesRequest(method="resources/list"))
+    assert isinstance(result.root, types.ListResourcesResult)
+    return result.root.resources
+
+
+async def read_resource(server: Server, uri: str) -> dict:
+    """Call the registered read_resource handler and decode its JSON."""
+    handler = server.request_handlers[types.ReadResourceRequest]
+    request = types.ReadResourceRequest(
+        method="resources/read", params=types.ReadResourceRequestParams(uri=AnyUrl(uri))
+    )
+    result = await handler(request)
+    assert isinstance(result.root, types.ReadResourceResult)
+    contents = result.root.contents[0]
+    assert isinstance(contents, types.TextResourceContents)
+    assert contents.mimeType == "application/json"
+    return orjson.loads(contents.text)
+
+
+class TestListResources:
+    """Test resource listing."""
+
+    async def test_lists_repository_resources(self, server):
+        """Test the repository list plus three resources per repository."""
+        uris = [str(resource.uri) for resource in await list_resources(server)]
+        assert uris == [
+            "rdf4j://repositories",
+            "rdf4j://repository/local/schema",
+            "rdf4j://repository/local/namespaces",
+            "rdf4j://repository/local/statistics",
+        ]
+
+    async def test_repository_list_cached(self, server, backend, monkeypatch):
+        """Test repeated listings reuse the repository list."""
+        calls = 0
+        list_repositories = backend.list_repositories
+
+        async def counting_list_repositories():
+            nonlocal calls
+            calls += 1
+            return await list_repositories()
+
+        monkeypatch.setattr(backend, "list_repositories", counting_list_repositories)
+        first = await list_resources(server)
+        second = await list_resources(server)
+        assert first == second
+        assert calls == 1
+
+    async def test_failed_listing_not_cached(self, server, backend, monkeypatch):
+        """Test a failed repository listing falls back without being cached."""
+
+        async def failing_list_repositories():
+            raise RuntimeError("server unavailable")
+
+        monkeypatch.setattr(backend, "list_repositories", failing_list_repositories)
+        assert len(await list_resources(server)) == 1
+
+        monkeypatch.undo()
+        assert len(await list_resources(server)) == 4
+
+
+class TestReadResource:
+    """Test reading resources by URI."""
+
+    async def test_read_repositories(self, server):
+        """Test the repository list resource."""
+        content = await read_resource(server, "rdf4j://repositories")
+        assert content["count"] == 1
+        assert content["repositories"][0]["id"] == "local"
+
+    async def test_read_schema(self, server):
+        """Test the schema summary resource."""
+        content = await read_resource(server, "rdf4j://repository/local/schema")
+        assert content["type"] == "schema_summary"
+        classes = {c["iri"]: c["label"] for c in content["classes"]}
+        assert classes["http://example.org/Person"] == "Person"
+
+    async def test_read_statistics(self, server):
+        """Test the statistics resource."""
+        content = await read_resource(server, "rdf4j://repository/local/statistics")
+        assert content["total_statements"] == 3
+
+    async def test_read_statistics_after_load(self, server, backend):
+        """Test a re-read reflects data loaded since the previous read."""
+        await read_resource(server, "rdf4j://repository/local/statistics")
+        await backend.load_data("<http://example.org/bob> a <http://example.org/Person> .")
+        content = await read_resource(server, "rdf4j://repository/local/statistics")
+        assert content["total_statements"] == 4
+
+    async def test_serialization_memo_per_registration(self, server, backend, monkeypatch):
+        """Test each registration reuses only the text it serialized itself."""
+        builds = 0
+        statistics_content = resources._statistics_content
+
+        def counting_statistics_content(repo_id, stats):
+            nonlocal builds
+            builds += 1
+            return statistics_content(repo_id, stats)
+
+        monkeypatch.setattr(resources, "_statistics_content", counting_statistics_content)
+        other = Server("other")
+        register_resources(other, lambda: backend)
+        uri = "rdf4j://repository/local/statistics"
+        await read_resource(server, uri)
+        await read_resource(server, uri)
+        assert builds == 1
+        assert await read_resource(other, uri) == await read_resource(server, uri)
+        assert builds == 2
+
+    async def test_read_namespaces(self, server):
+        """Test the namespaces resource includes ready-made PREFIX lines."""
+        content = await read_resource(server, "rdf4j://repository/local/namespaces")
+        assert "PREFIX owl: <http://www.w3.org/2002/07/owl#>" in content["sparql_prefixes"]
+
+    @pytest.mark.parametrize(
+        "uri",
+        [
+            "rdf4j://unknown",
+            "rdf4j://repository/local",
+            "rdf4j://repository/local/unknown",
+            "rdf4j://repository/local/schema/extra",
+        ],
+    )
+    async def test_read_invalid_uri(self, server, uri):
+        """Test malformed or unknown resource URIs are rejected."""
+        with pytest.raises(ValueError):
+            await read_resource(server, uri)
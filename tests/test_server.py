@@ -1,19 +1,31 @@
 """Tests for the MCP server."""
 
+import subprocess
+import sys
+
+import orjson
 import pytest
+from mcp import types
 
+from rdf4j_mcp.backends.local import LocalBackend
 from rdf4j_mcp.config import BackendType, Settings
 from rdf4j_mcp.server import RDF4JMCPServer, create_server
+from tests._sample_data import SAMPLE_TURTLE
+
+
+@pytest.fixture(scope="module")
+def default_server():
+    """Unstarted server with default settings, shared by the introspection tests."""
+    return create_server()
 
 
 class TestServerCreation:
     """Test server creation and initialization."""
 
-    def test_create_server_default(self):
+    def test_create_server_default(self, default_server):
         """Test creating server with default settings."""
-        server = create_server()
-        assert server is not None
-        assert server._settings.backend_type == BackendType.LOCAL
+        assert default_server is not None
+        assert default_server._settings.backend_type == BackendType.LOCAL
 
     def test_create_server_custom_settings(self):
         """Test creating server with custom settings."""
@@ -26,45 +38,64 @@ class TestServerCreation:
         assert server._settings.query_timeout == 60
         assert server._settings.default_limit == 50
 
+    def test_import_skips_backend_implementations(self):
+        """Test importing the server doesn't load the backend implementations."""
+        code = (
+            "import sys, rdf4j_mcp.server; "
+            "print(any(m in sys.modules for m in "
+            "('rdf4j_mcp.backends.local', 'rdf4j_mcp.backends.remote')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
 
-class TestServerWithLocalBackend:
-    """Test server operations with local backend."""
+    async def test_list_tools(self, default_server):
+        """Test every tool is listed exactly once."""
+        handler = default_server._server.request_handlers[types.ListToolsRequest]
+        result = await handler(types.ListToolsRequest(method="tools/list"))
+        assert isinstance(result.root, types.ListToolsResult)
+        names = [tool.name for tool in result.root.tools]
+        assert len(names) == len(set(names))
+        assert {"sparql_select", "describe_resource", "get_schema_summary"} <= set(names)
 
-    @pytest.fixture
-    async def server(self):
-        """Create and start a server for testing."""
-        settings = Settings(backend_type=BackendType.LOCAL)
-        server = RDF4JMCPServer(settings)
-        await server.start()
-        yield server
-        await server.stop()
 
-    @pytest.fixture
-    async def server_with_data(self, server):
-        """Server with sample data loaded."""
-        from rdf4j_mcp.backends.local import LocalBackend
+async def load_sample_data(server: RDF4JMCPServer) -> None:
+    """Load the sample data into a started server's local backend."""
+    backend = server._get_backend()
+    assert isinstance(backend, LocalBackend)
+    await backend.load_data(SAMPLE_TURTLE, format="turtle")
 
-        backend = server._get_backend()
-        if isinstance(backend, LocalBackend):
-            sample_turtle = """
-            @prefix ex: <http://example.org/> .
-            @prefix owl: <http://www.w3.org/2002/07/owl#> .
-            @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
 
-            ex:Person a owl:Class ;
-                rdfs:label "Person" .
+@pytest.fixture
+async def server():
+    """Create and start a server for testing."""
+    settings = Settings(backend_type=BackendType.LOCAL)
+    server = RDF4JMCPServer(settings)
+    await server.start()
+    yield server
+    await server.stop()
+
 
-            ex:name a owl:DatatypeProperty ;
-                rdfs:domain ex:Person .
+@pytest.fixture
+async def server_with_data(server):
+    """Server with sample data, for tests that load more data."""
+    await load_sample_data(server)
+    return server
 
-            ex:alice a ex:Person ;
-                ex:name "Alice" .
 
-            ex:bob a ex:Person ;
-                ex:name "Bob" .
-            """
-            await backend.load_data(sample_turtle, format="turtle")
-        return server
+@pytest.fixture(scope="module")
+async def shared_server_with_data():
+    """Server with sample data, started once for the read-only tests of this module."""
+    server = RDF4JMCPServer(Settings(backend_type=BackendType.LOCAL))
+    await server.start()
+    await load_sample_data(server)
+    yield server
+    await server.stop()
+
+
+class TestServerWithLocalBackend:
+    """Test server operations with local backend."""
 
     async def test_server_start_stop(self, server):
         """Test server start and stop."""
@@ -72,9 +103,9 @@ class TestServerWithLocalBackend:
         await server.stop()
         assert server._backend is None
 
-    async def test_get_backend(self, server):
+    async def test_get_backend(self, shared_server_with_data):
         """Test getting backend from started server."""
-        backend = server._get_backend()
+        backend = shared_server_with_data._get_backend()
         assert backend is not None
 
     async def test_get_backend_not_started(self):
@@ -87,81 +118,48 @@ class TestServerWithLocalBackend:
 class TestToolHandlers:
     """Test individual tool handlers."""
 
-    @pytest.fixture
-    async def server_with_data(self):
-        """Server with sample data."""
-        settings = Settings(backend_type=BackendType.LOCAL)
-        server = RDF4JMCPServer(settings)
-        await server.start()
-
-        from rdf4j_mcp.backends.local import LocalBackend
-
-        backend = server._get_backend()
-        if isinstance(backend, LocalBackend):
-            sample_turtle = """
-            @prefix ex: <http://example.org/> .
-            @prefix owl: <http://www.w3.org/2002/07/owl#> .
-            @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
-
-            ex:Person a owl:Class ;
-                rdfs:label "Person" .
-
-            ex:name a owl:DatatypeProperty .
-
-            ex:alice a ex:Person ;
-                ex:name "Alice" .
-            """
-            await backend.load_data(sample_turtle, format="turtle")
-
-        yield server
-        await server.stop()
-
-    async def test_handle_sparql_select(self, server_with_data):
+    async def test_handle_sparql_select(self, shared_server_with_data):
         """Test SPARQL SELECT handler."""
-        import json
-
-        backend = server_with_data._get_backend()
-        result = await server_with_data._handle_sparql_select(
+        backend = shared_server_with_data._get_backend()
+        result = await shared_server_with_data._handle_sparql_select(
             backend,
             {"query": "SELECT ?s WHERE { ?s a <http://example.org/Person> }"},
-            server_with_data._settings,
+            shared_server_with_data._settings,
         )
 
         assert len(result) == 1
-        data = json.loads(result[0].text)
+        data = orjson.loads(result[0].text)
         assert data["type"] == "select"
         assert data["count"] >= 1
 
-    async def test_handle_sparql_construct(self, server_with_data):
+    async def test_handle_sparql_construct(self, shared_server_with_data):
         """Test SPARQL CONSTRUCT handler."""
-        backend = server_with_data._get_backend()
-        result = await server_with_data._handle_sparql_construct(
+        backend = shared_server_with_data._get_backend()
+        result = await shared_server_with_data._handle_sparql_construct(
             backend,
             {"query": "CONSTRUCT { ?s ?p ?o } WHERE { ?s ?p ?o } LIMIT 10"},
         )
 
         assert len(result) == 1
-        assert "Turtle" in result[0].text
+        assert "N-Triples" in result[0].text
 
-    async def test_handle_sparql_ask(self, server_with_data):
+    async def test_handle_sparql_ask(self, shared_server_with_data):
         """Test SPARQL ASK handler."""
-        import json
-
-        backend = server_with_data._get_backend()
-        result = await server_with_data._handle_sparql_ask(
+        backend = shared_server_with_data._get_backend()
+        result = await shared_server_with_data._handle_sparql_ask(
             backend,
             {"query": "ASK { ?s a <http://example.org/Person> }"},
         )
 
         assert len(result) == 1
-        data = json.loads(result[0].text)
+        data = orjson.loads(result[0].text)
         assert data["type"] == "ask"
         assert data["result"] is True
 
-    async def test_handle_describe_resource(self, server_with_data):
+    async def test_handle_describe_resource(self, shared_server_with_data):
         """Test describe_resource handler."""
-        backend = server_with_data._get_backend()
-        result = await server_with_data._handle_describe_resource(
+        backend = shared_server_with_data._get_backend()
+        result = await shared_server_with_data._handle_describe_resource(
             backend,
             {"iri": "http://example.org/alice"},
         )
@@ -169,32 +167,154 @@ class TestToolHandlers:
         assert len(result) == 1
         assert "alice" in result[0].text
 
-    async def test_handle_search_classes(self, server_with_data):
-        """Test search_classes handler."""
-        import json
+    async def test_handle_describe_resource_after_load(self, server_with_data):
+        """Test repeated describes pick up triples loaded in between."""
+        backend = server_with_data._get_backend()
+        arguments = {"iri": "http://example.org/alice"}
+        first = await server_with_data._handle_describe_resource(backend, arguments)
+        assert "http://example.org/bob" not in first[0].text
 
+        await backend.load_data(
+            "<http://example.org/bob> <http://example.org/knows> <http://example.org/alice> ."
+        )
+        second = await server_with_data._handle_describe_resource(backend, arguments)
+        assert "# Incoming triples:\n<http://example.org/bob>" in second[0].text
+
+    async def test_handle_describe_resource_sections(self, server_with_data):
+        """Test outgoing and incoming triples land in their own sections."""
+        backend = server_with_data._get_backend()
+        await backend.load_data(
+            "<http://example.org/bob> <http://example.org/knows> <http://example.org/alice> ."
+        )
+        arguments = {"iri": "http://example.org/alice"}
+        result = await server_with_data._handle_describe_resource(backend, arguments)
+        outgoing, incoming = result[0].text.split("# Incoming triples:\n")
+        assert "<http://example.org/alice> " in outgoing
+        assert incoming.splitlines() == [
+            "<http://example.org/bob> <http://example.org/knows> <http://example.org/alice> ."
+        ]
+
+        arguments["include_incoming"] = False
+        result = await server_with_data._handle_describe_resource(backend, arguments)
+        assert "# Incoming triples" not in result[0].text
+        assert "<http://example.org/alice> " in result[0].text
+
+    async def test_handle_describe_resource_self_loop(self, server_with_data):
+        """Test a triple linking the resource to itself appears in both sections."""
         backend = server_with_data._get_backend()
-        result = await server_with_data._handle_search_classes(
+        loop = "<http://example.org/alice> <http://example.org/knows> <http://example.org/alice> ."
+        await backend.load_data(loop)
+        arguments = {"iri": "http://example.org/alice"}
+        result = await server_with_data._handle_describe_resource(backend, arguments)
+        outgoing, incoming = result[0].text.split("# Incoming triples:\n")
+        assert loop in outgoing.splitlines()
+        assert incoming.splitlines() == [loop]
+
+    async def test_handle_search_classes(self, shared_server_with_data):
+        """Test search_classes handler."""
+        backend = shared_server_with_data._get_backend()
+        result = await shared_server_with_data._handle_search_classes(
             backend,
             {},
         )
 
         assert len(result) == 1
-        data = json.loads(result[0].text)
+        data = orjson.loads(result[0].text)
         assert data["type"] == "classes"
 
-    async def test_handle_get_schema_summary(self, server_with_data):
-        """Test get_schema_summary handler."""
-        import json
+    async def test_handle_find_instances(self, shared_server_with_data):
+        """Test find_instances records only carry bound optional values."""
+        backend = shared_server_with_data._get_backend()
+        result = await shared_server_with_data._handle_find_instances(
+            backend,
+            {"class_iri": "http://example.org/Person"},
+        )
 
-        backend = server_with_data._get_backend()
-        result = await server_with_data._handle_get_schema_summary(
+        data = orjson.loads(result[0].text)
+        assert sorted(data["instances"], key=lambda i: i["iri"]) == [
+            {"iri": "http://example.org/alice"},
+            {"iri": "http://example.org/bob"},
+        ]
+
+    async def test_handle_get_schema_summary(self, shared_server_with_data):
+        """Test get_schema_summary handler."""
+        backend = shared_server_with_data._get_backend()
+        result = await shared_server_with_data._handle_get_schema_summary(
             backend,
             {},
         )
 
         assert len(result) == 1
-        data = json.loads(result[0].text)
+        data = orjson.loads(result[0].text)
         assert data["type"] == "schema_summary"
         assert "statistics" in data
         assert "namespaces" in data
+
+    async def test_handle_get_statistics_reuses_rendering(self, server_with_data):
+        """Test statistics output is re-rendered only when the data changes."""
+        backend = server_with_data._get_backend()
+        first = await server_with_data._handle_get_statistics(backend, {})
+        second = await server_with_data._handle_get_statistics(backend, {})
+        assert second[0].text is first[0].text
+
+        await backend.load_data("<http://example.org/carol> a <http://example.org/Person> .")
+        third = await server_with_data._handle_get_statistics(backend, {})
+        assert orjson.loads(third[0].text)["total_statements"] == 21
+
+    async def test_call_tool_dispatch(self, shared_server_with_data):
+        """Test call_tool routes tool names to their handlers."""
+        handler = shared_server_with_data._server.request_handlers[types.CallToolRequest]
+        request = types.CallToolRequest(
+            method="tools/call",
+            params=types.CallToolRequestParams(name="get_statistics", arguments={}),
+        )
+        result = await handler(request)
+        assert isinstance(result.root, types.CallToolResult)
+        assert not result.root.isError
+        content = result.root.content[0]
+        assert isinstance(content, types.TextContent)
+        assert orjson.loads(content.text)["total_statements"] == 20
+
+    async def test_call_tool_concurrency_limit(self, monkeypatch):
+        """Test concurrent tool calls beyond the limit wait for a free slot."""
+        import asyncio
+
+        server = RDF4JMCPServer(Settings(max_concurrent_backend_calls=2))
+        await server.start()
+        backend = server._get_backend()
+        running = peak = 0
+
+        async def slow_statistics(repository_id=None):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return await get_statistics(repository_id)
+
+        get_statistics = backend.get_statistics
+        monkeypatch.setattr(backend, "get_statistics", slow_statistics)
+        handler = server._server.request_handlers[types.CallToolRequest]
+        request = types.CallToolRequest(
+            method="tools/call",
+            params=types.CallToolRequestParams(name="get_statistics", arguments={}),
+        )
+        try:
+            results = await asyncio.gather(*(handler(request) for _ in range(5)))
+        finally:
+            await server.stop()
+        for result in results:
+            assert isinstance(result.root, types.CallToolResult)
+            assert not result.root.isError
+        assert peak == 2
+
+    async def test_call_unknown_tool(self, shared_server_with_data):
+        """Test calling an unknown tool reports an error."""
+        handler = shared_server_with_data._server.request_handlers[types.CallToolRequest]
+        request = types.CallToolRequest(
+            method="tools/call",
+            params=types.CallToolRequestParams(name="nonexistent", arguments={}),
+        )
+        result = await handler(request)
+        assert isinstance(result.root, types.CallToolResult)
+        assert result.root.isError
@@ -0,0 +1,211 @@
+"""Tests for the tools package."""
+
+import orjson
+import pytest
+from mcp import types
+from mcp.server import Server
+
+import rdf4j_mcp.tools
+from rdf4j_mcp.backends.local import LocalBackend
+from rdf4j_mcp.tools import register_explore_tools, register_metadata_tools, register_query_tools
+
+
+@pytest.fixture
+async def backend():
+    """Create a local backend with a little data."""
+    backend = LocalBackend()
+    await backend.connect()
+    await backend.load_data(
+        """
+        @prefix ex: <http://example.org/> .
+        @prefix owl: <http://www.w3.org/2002/07/owl#> .
+        @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+
+        ex:Person a owl:Class ; rdfs:label "Person" .
+        ex:alice a ex:Person .
+        """
+    )
+    yield backend
+    await backend.close()
+
+
+async def list_tools(server: Server) -> list[types.Tool]:
+    """Call the registered list_tools handler."""
+    handler = server.request_handlers[types.ListToolsRequest]
+    result = await handler(types.ListToolsRequest(method="tools/list"))
+    assert isinstance(result.root, types.ListToolsResult)
+    return result.root.tools
+
+
+async def call_tool(server: Server, name: str, arguments: dict | None = None) -> str:
+    """Call the registered call_tool handler and return the text content."""
+    handler = server.request_handlers[types.CallToolRequest]
+    request = types.CallToolRequest(
+        method="tools/call",
+        params=types.CallToolRequestParams(name=name, arguments=arguments or {}),
+    )
+    result = await handler(request)
+    assert isinstance(result.root, types.CallToolResult)
+    assert not result.root.isError
+    content = result.root.content[0]
+    assert isinstance(content, types.TextContent)
+    return content.text
+
+
+class TestToolsPackage:
+    """Test the tools package layout."""
+
+    def test_import_resolves_to_package(self):
+        """Test rdf4j_mcp.tools is the package, not a same-named module."""
+        assert hasattr(rdf4j_mcp.tools, "__path__")
+        assert callable(rdf4j_mcp.tools.register_query_tools)
+
+
+class TestListTools:
+    """Test tool listing for each tool group."""
+
+    @pytest.mark.parametrize(
+        ("register", "names"),
+        [
+            (register_query_tools, ["sparql_select", "sparql_construct", "sparql_ask"]),
+            (
+                register_explore_tools,
+                [
+                    "describe_resource",
+                    "search_classes",
+                    "search_properties",
+                    "find_instances",
+                    "get_schema_summary",
+                ],
+            ),
+            (
+                register_metadata_tools,
+                [
+                    "list_repositories",
+                    "get_namespaces",
+                    "get_statistics",
+                    "select_repository",
+                    "get_current_repository",
+                ],
+            ),
+        ],
+    )
+    async def test_list_tools(self, register, names):
+        """Test each group lists its tools, reusing the same definitions."""
+        server = Server("test")
+        register(server, lambda: None)
+        first = await list_tools(server)
+        second = await list_tools(server)
+        assert [tool.name for tool in first] == names
+        assert all(a is b for a, b in zip(first, second, strict=True))
+
+
+class TestCallTools:
+    """Test tool calls through the registered handlers."""
+
+    async def test_get_statistics(self, backend):
+        """Test a metadata tool returns its output as JSON."""
+        server = Server("test")
+        register_metadata_tools(server, lambda: backend)
+        output = orjson.loads(await call_tool(server, "get_statistics"))
+        assert output["type"] == "statistics"
+        assert output["total_statements"] == 3
+
+    async def test_sparql_select(self, backend):
+        """Test a query tool returns its bindings as JSON."""
+        server = Server("test")
+        register_query_tools(server, lambda: backend)
+        query = "SELECT ?s WHERE { ?s a <http://example.org/Person> }"
+        output = orjson.loads(await call_tool(server, "sparql_select", {"query": query}))
+        assert output["count"] == 1
+        assert output["bindings"][0]["s"]["value"] == "http://example.org/alice"
+
+    async def test_sparql_select_cached(self, backend, monkeypatch):
+        """Test repeated queries are answered from the backend's query cache."""
+        calls = 0
+        sparql_select = backend.sparql_select
+
+        async def counting_sparql_select(query, repository_id=None):
+            nonlocal calls
+            calls += 1
+            return await sparql_select(query, repository_id)
+
+        monkeypatch.setattr(backend, "sparql_select", counting_sparql_select)
+        server = Server("test")
+        register_query_tools(server, lambda: backend)
+        arguments = {"query": "SELECT ?s WHERE { ?s a <http://example.org/Person> }"}
+        first = await call_tool(server, "sparql_select", arguments)
+        second = await call_tool(server, "sparql_select", arguments)
+        assert first == second
+        assert calls == 1
+
+    async def test_sparql_construct(self, backend):
+        """Test the construct tool labels its N-Triples output as such."""
+        server = Server("test")
+        register_query_tools(server, lambda: backend)
+        query = "CONSTRUCT { ?s a ?o } WHERE { ?s a ?o }"
+        text = await call_tool(server, "sparql_construct", {"query": query})
+        assert text.startswith("# SPARQL CONSTRUCT/DESCRIBE Result\n# Format: N-Triples\n")
+        assert (
+            "<http://example.org/alice> "
+            "<http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://example.org/Person> ."
+        ) in text
+
+    async def test_describe_resource(self, backend):
+        """Test describe_resource combines the summary with both triple directions."""
+        server = Server("test")
+        register_explore_tools(server, lambda: backend)
+        text = await call_tool(server, "describe_resource", {"iri": "http://example.org/Person"})
+        assert "# Types: http://www.w3.org/2002/07/owl#Class" in text
+        assert "# Incoming triples (resource as object):\n<http://example.org/alice>" in text
+
+    async def test_search_classes(self, backend):
+        """Test class search records carry the IRI and any bound label."""
+        server = Server("test")
+        register_explore_tools(server, lambda: backend)
+        output = orjson.loads(await call_tool(server, "search_classes", {"pattern": "Person"}))
+        assert output["classes"] == [{"iri": "http://example.org/Person", "label": "Person"}]
+
+    async def test_get_schema_summary(self, backend):
+        """Test the schema summary lists the top classes."""
+        server = Server("test")
+        register_explore_tools(server, lambda: backend)
+        output = orjson.loads(await call_tool(server, "get_schema_summary"))
+        assert output["type"] == "schema_summary"
+        assert {"iri": "http://example.org/Person", "label": "Person"} in output["top_classes"]
+
+    async def test_unknown_tool(self, backend):
+        """Test calling a tool from another group reports an error."""
+        server = Server("test")
+        register_metadata_tools(server, lambda: backend)
+        handler = server.request_handlers[types.CallToolRequest]
+        request = types.CallToolRequest(
+            method="tools/call",
+            params=types.CallToolRequestParams(name="sparql_select", arguments={}),
+        )
+        result = await handler(request)
+        assert isinstance(result.root, types.CallToolResult)
+        assert result.root.isError
+
+    async def test_get_namespaces(self, backend):
+        """Test the namespaces tool includes ready-made PREFIX lines on every call."""
+        server = Server("test")
+        register_metadata_tools(server, lambda: backend)
+        first = orjson.loads(await call_tool(server, "get_namespaces"))
+        second = orjson.loads(await call_tool(server, "get_namespaces"))
+        assert "PREFIX owl: <http://www.w3.org/2002/07/owl#>" in first["sparql_prefixes"]
+        assert second == first
+
+    @pytest.mark.parametrize(
+        ("query", "answer"),
+        [
+            ("ASK { ?s a <http://example.org/Person> }", True),
+            ("ASK { ?s a <http://example.org/Robot> }", False),
+        ],
+    )
+    async def test_sparql_ask(self, backend, query, answer):
+        """Test the ask tool reports the boolean answer."""
+        server = Server("test")
+        register_query_tools(server, lambda: backend)
+        output = orjson.loads(await call_tool(server, "sparql_ask", {"query": query}))
+        assert output == {"type": "ask", "result": answer}
@@ -0,0 +1,92 @@
+"""Tests for utility helpers."""
+
+import pytest
+
+from rdf4j_mcp.util import binding_value, has_limit, local_name, normalize_query, to_json
+
+
+class TestLocalName:
+    """Test IRI local name extraction."""
+
+    def test_slash_iri(self):
+        """Test IRIs ending in a path segment."""
+        assert local_name("http://example.org/Person") == "Person"
+
+    def test_hash_iri(self):
+        """Test IRIs with a fragment after the last slash."""
+        assert local_name("http://www.w3.org/2001/XMLSchema#string") == "string"
+
+    def test_no_local_part(self):
+        """Test IRIs without a local part are returned unchanged."""
+        assert local_name("http://example.org/") == "http://example.org/"
+        assert local_name("") == ""
+
+
+class TestBindingValue:
+    """Test binding value extraction."""
+
+    def test_bound_variable(self):
+        """Test a bound variable returns its value."""
+        binding = {"name": {"type": "literal", "value": "Alice"}}
+        assert binding_value(binding, "name") == "Alice"
+
+    def test_unbound_variable(self):
+        """Test an unbound variable returns the default."""
+        assert binding_value({}, "name") == ""
+        assert binding_value({}, "name", "N/A") == "N/A"
+
+
+class TestLimitDetection:
+    """Test detection of an existing LIMIT clause in sparql_select queries."""
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "SELECT * WHERE { ?s ?p ?o } LIMIT 10",
+            "select * where { ?s ?p ?o } limit 5",
+            "SELECT * WHERE { ?s ?p ?o }\nLIMIT\n7",
+            "SELECT * WHERE { { SELECT ?s WHERE { ?s ?p ?o } LIMIT 3 } }",
+        ],
+    )
+    def test_limit_found(self, query):
+        """Test LIMIT clauses are recognized in any case and spacing."""
+        assert has_limit(query)
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "SELECT * WHERE { ?s ?p ?o }",
+            'SELECT * WHERE { ?s ?p "LIMIT 10" }',
+            "SELECT ?limit WHERE { ?s <http://example.org/limit> ?limit }",
+            "SELECT * WHERE { ?s ?p ?o } # LIMIT 10",
+        ],
+    )
+    def test_limit_not_found(self, query):
+        """Test LIMIT inside literals, IRIs, names or comments is ignored."""
+        assert not has_limit(query)
+
+
+class TestNormalizeQuery:
+    """Test query layout normalization."""
+
+    def test_collapses_whitespace_and_comments(self):
+        """Test whitespace runs and comments become single spaces."""
+        query = "SELECT ?s  # subjects\nWHERE {\n\t?s ?p ?o\n}\n"
+        assert normalize_query(query) == "SELECT ?s WHERE { ?s ?p ?o }"
+
+    def test_keeps_terms_verbatim(self):
+        """Test literals, IRIs and escaped '#' in names are left untouched."""
+        query = 'SELECT * WHERE { ?s <http://example.org/a#b>  "x  # y" ; ex:a\\#b ?o }'
+        assert normalize_query(query) == (
+            'SELECT * WHERE { ?s <http://example.org/a#b> "x  # y" ; ex:a\\#b ?o }'
+        )
+
+
+class TestToJson:
+    """Test tool output serialization."""
+
+    def test_indented(self):
+        """Test output is rendered as indented JSON text."""
+        assert (
+            to_json({"type": "ask", "result": True}) == '{\n  "type": "ask",\n  "result": true\n}'
+        )